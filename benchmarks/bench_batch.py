@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Time to fetch 300 bike points from a local stub server that adds 20 ms of
+latency per request: one GetBikePoint call after another, against a
+single GetBikePointsBatch call.
+
+    python -m benchmarks.bench_batch
+"""
+
+import time
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+POINTS = ["BikePoints_{0}".format(i) for i in range(300)]
+
+
+def main():
+    with StubServer("tests/testdata/bike_point_correct.json",
+                    delay=0.02) as server:
+        with tfl.Api(app_id="bench", app_key="bench") as api:
+            api.base_url = server.base_url
+
+            start = time.time()
+            for point in POINTS:
+                api.GetBikePoint(point)
+            sequential = time.time() - start
+
+            start = time.time()
+            api.GetBikePointsBatch(POINTS)
+            batch = time.time() - start
+
+    print("sequential: {0:8.1f} ms".format(sequential * 1000))
+    print("batch:      {0:8.1f} ms".format(batch * 1000))
+    print("speed-up:   {0:8.1f}x".format(sequential / batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Time for 100 threads to call GetLinesByMode(["tube"]) at the same moment
+against a local stub server that adds 50 ms of latency per request, with
+request coalescing off and on, and how many requests each one sent.
+
+    python -m benchmarks.bench_coalesce
+"""
+
+import threading
+import time
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+CALLERS = 100
+
+
+def _Run(base_url, coalesce):
+    with tfl.Api(app_id="bench", app_key="bench", pool_maxsize=CALLERS,
+                 coalesce=coalesce) as api:
+        api.base_url = base_url
+        start = threading.Event()
+
+        def call():
+            start.wait()
+            api.GetLinesByMode(["tube"])
+
+        threads = [threading.Thread(target=call) for _ in range(CALLERS)]
+        for thread in threads:
+            thread.start()
+        began = time.time()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+        return (time.time() - began, api.coalesce_stats["requests"])
+
+
+def main():
+    with StubServer("tests/testdata/line_by_mode.json", delay=0.05) as server:
+        for coalesce in (False, True):
+            (elapsed, requests) = _Run(server.base_url, coalesce)
+            print("coalesce={0!s:5}  {1:8.1f} ms  {2:4d} requests".format(
+                coalesce, elapsed * 1000,
+                CALLERS if not coalesce else requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Time to dedup the disruptions merged from many lines, as when combining
+the lines of several GetLinesByMode calls: a list scan with the old
+toDict() equality against a set of hashed models. The lines share a pool
+of disruptions taken from tests/testdata/journey/planner_via.json.
+
+    python -m benchmarks.bench_dedup
+"""
+
+import json
+import time
+
+from tfl.models import Disruption
+
+LINES_PER_POOL = 10
+
+
+def _Pool(size):
+    with open("tests/testdata/journey/planner_via.json") as f:
+        data = json.load(f)
+    raw = [d for j in data["journeys"] for l in j["legs"]
+           for d in l["disruptions"]]
+
+    return [dict(raw[i % len(raw)], description="Disruption {0}".format(i))
+            for i in range(size)]
+
+
+def _ListDedup(disruptions):
+    unique = []
+    for disruption in disruptions:
+        if not any(disruption.toDict() == u.toDict() for u in unique):
+            unique.append(disruption)
+    return unique
+
+
+def _SetDedup(disruptions):
+    return list(dict.fromkeys(disruptions))
+
+
+def main():
+    for size in (50, 100, 200, 400):
+        # Each line reports three disruptions from the pool
+        pool = _Pool(size)
+        merged = [Disruption.fromJSON(pool[(i * 7 + k) % size])
+                  for i in range(size * LINES_PER_POOL // 3)
+                  for k in range(3)]
+
+        timings = []
+        for dedup in (_ListDedup, _SetDedup):
+            start = time.time()
+            unique = dedup(merged)
+            timings.append(time.time() - start)
+
+        print("{0:5} disruptions, {1:4} unique  toDict list: {2:9.2f} ms  "
+              "hashed set: {3:6.2f} ms".format(
+                  len(merged), len(unique), timings[0] * 1000,
+                  timings[1] * 1000))
+
+
+if __name__ == "__main__":
+    main()
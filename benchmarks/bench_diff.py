@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Time to find the bike points that changed between two polls of
+tests/testdata/bike_points.json (with 5% of the docks changed) using
+TflModel.__eq__ per point, against diff_bike_points().
+
+    python -m benchmarks.bench_diff
+"""
+
+import copy
+import json
+import timeit
+
+from tfl.diff import diff_bike_points
+from tfl.models import Point
+
+NUMBER = 10
+
+
+def _Equality(old, new):
+    previous = dict((p.id, p) for p in old)
+    return [p for p in new if p.id in previous and p != previous[p.id]]
+
+
+def main():
+    with open("tests/testdata/bike_points.json") as f:
+        data = json.load(f)
+    changed = copy.deepcopy(data)
+    for point in changed[::20]:
+        point["additionalProperties"][6]["value"] = "0"
+        point["additionalProperties"][6]["modified"] = "2018-03-16T12:00:00Z"
+    old = [Point.fromJSON(p) for p in data]
+    new = [Point.fromJSON(p) for p in changed]
+
+    equality = min(timeit.repeat(
+        lambda: _Equality(old, new), number=NUMBER, repeat=3)) / NUMBER
+    diff = min(timeit.repeat(
+        lambda: diff_bike_points(old, new), number=NUMBER, repeat=3)) / NUMBER
+
+    print("{0} points, {1} changed".format(
+        len(new), len(diff_bike_points(old, new).changed)))
+    print("__eq__:           {0:8.2f} ms".format(equality * 1000))
+    print("diff_bike_points: {0:8.2f} ms".format(diff * 1000))
+
+
+if __name__ == "__main__":
+    main()
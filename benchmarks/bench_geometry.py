@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Memory retained by the route geometry of a synthetic network of 60 lines,
+each with 4 branches of 2000 points: parsed into nested lists of floats as
+lineStrings used to be, and packed into a Geometry. Also the time taken to
+measure every branch, with and without numpy.
+
+    python -m benchmarks.bench_geometry
+"""
+
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+import tfl
+from tfl import geometry
+
+LINES = 60
+BRANCHES = 4
+POINTS = 2000
+
+
+def _LineStrings(rng):
+    strings = []
+    for _ in range(BRANCHES):
+        (lat, lon) = (51.5 + rng.random() / 5, -0.3 + rng.random() / 2)
+        points = []
+        for _ in range(POINTS):
+            lat += rng.gauss(0, 0.0005)
+            lon += rng.gauss(0, 0.0005)
+            points.append([round(lon, 6), round(lat, 6)])
+        strings.append(json.dumps([points]))
+
+    return strings
+
+
+def _Retained(build):
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (retained, kept)
+
+
+def _Parsed(geometry):
+    geometry.bounds()
+
+    return geometry
+
+
+def main():
+    rng = random.Random(1)
+    network = [_LineStrings(rng) for _ in range(LINES)]
+
+    (lists, _) = _Retained(lambda: [
+        [json.loads(text) for text in strings] for strings in network])
+    (packed, geometries) = _Retained(lambda: [
+        _Parsed(tfl.Geometry.fromJSON(strings)) for strings in network])
+
+    start = time.time()
+    for g in geometries:
+        g.lengths()
+    vectorised = time.time() - start
+    (numpy, geometry.numpy) = (geometry.numpy, None)
+    try:
+        start = time.time()
+        for g in geometries:
+            g.lengths()
+        plain = time.time() - start
+    finally:
+        geometry.numpy = numpy
+
+    print("points:             {0:10d}".format(LINES * BRANCHES * POINTS))
+    print("nested lists:       {0:10.2f} MB".format(lists / 1e6))
+    print("packed Geometry:    {0:10.2f} MB  ({1:.1f}x smaller)".format(
+        packed / 1e6, float(lists) / packed))
+    print("lengths (numpy):    {0:10.1f} ms".format(vectorised * 1000))
+    print("lengths (python):   {0:10.1f} ms".format(plain * 1000))
+
+
+if __name__ == "__main__":
+    main()
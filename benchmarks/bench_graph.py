@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Station-to-station shortest paths over a synthetic network of 12 lines of
+40 stops each, crossing at shared interchange stations: building the
+graph, the first query from each origin, and repeat queries answered from
+the cached shortest-path trees.
+
+    python -m benchmarks.bench_graph
+"""
+
+import random
+import time
+
+import tfl
+
+LINES = 12
+STOPS = 40
+QUERIES = 10000
+
+
+def _Sequences():
+    rng = random.Random(1)
+    # Roughly one stop in five is an interchange shared between lines
+    hubs = ["HUB{0}".format(i) for i in range(LINES * STOPS // 5)]
+    sequences = []
+    for line in range(LINES):
+        stops = []
+        for stop in range(STOPS):
+            hub = rng.choice(hubs) if rng.random() < 0.2 else None
+            stops.append({
+                "id": "L{0}S{1}".format(line, stop),
+                "stationId": "L{0}S{1}".format(line, stop),
+                "topMostParentId": hub,
+            })
+        sequences.append(tfl.LineRouteSequence.fromJSON({
+            "lineId": "line{0}".format(line),
+            "stopPointSequences": [{
+                "lineId": "line{0}".format(line),
+                "branchId": 0,
+                "stopPoint": stops,
+            }],
+        }))
+
+    return sequences
+
+
+def main():
+    sequences = _Sequences()
+    start = time.time()
+    graph = tfl.StationGraph(sequences)
+    build = time.time() - start
+
+    rng = random.Random(2)
+    stations = sorted(graph.stations)
+    origins = stations[:50]
+    pairs = [(rng.choice(origins), rng.choice(stations))
+             for _ in range(QUERIES)]
+
+    start = time.time()
+    for origin in origins:
+        graph.shortest_path(origin, stations[0])
+    first = (time.time() - start) / len(origins)
+
+    start = time.time()
+    for (origin, destination) in pairs:
+        graph.shortest_path(origin, destination)
+    cached = (time.time() - start) / QUERIES
+
+    print("stations:     {0:8d}".format(len(graph)))
+    print("build:        {0:8.1f} ms".format(build * 1000))
+    print("first query:  {0:8.1f} us".format(first * 1e6))
+    print("cached query: {0:8.1f} us".format(cached * 1e6))
+
+
+if __name__ == "__main__":
+    main()
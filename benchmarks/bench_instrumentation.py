@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Where the time of an Api call goes, by phase, for a few endpoints served
+by a local stub server; then the cost of instrumentation itself, timing
+the same calls on an Api with and without it.
+
+    python -m benchmarks.bench_instrumentation
+"""
+
+import timeit
+
+import tfl
+from benchmarks.stub_server import StubServer
+from tfl.instrumentation import PHASES
+
+ENDPOINTS = [
+    ("tests/testdata/bike_points.json", "GetBikePoints", ()),
+    ("tests/testdata/line_by_mode.json", "GetLinesByMode", (["tube"],)),
+    ("tests/testdata/air_quality.json", "GetAirQuality", ()),
+]
+NUMBER = 20
+
+
+def main():
+    instrumentation = tfl.Instrumentation()
+    overheads = []
+    for (fixture, method, args) in ENDPOINTS:
+        with StubServer(fixture) as server:
+            plain = tfl.Api(app_id="bench", app_key="bench", coalesce=False)
+            timed = tfl.Api(app_id="bench", app_key="bench", coalesce=False,
+                            instrumentation=instrumentation)
+            for api in (plain, timed):
+                api.base_url = server.base_url
+            call_plain = lambda: getattr(plain, method)(*args)
+            call_timed = lambda: getattr(timed, method)(*args)
+            # Interleave the runs so machine noise hits both alike
+            (off, on) = (float("inf"), float("inf"))
+            for _ in range(5):
+                off = min(off, timeit.timeit(call_plain, number=NUMBER))
+                on = min(on, timeit.timeit(call_timed, number=NUMBER))
+            overheads.append((method, off / NUMBER, on / NUMBER))
+            plain.close()
+            timed.close()
+
+    print("{0:16} {1}".format("mean ms", " ".join(
+        "{0:>9}".format(phase) for phase in PHASES + ("total",))))
+    for (method, summary) in sorted(instrumentation.summary().items()):
+        print("{0:16} {1}".format(method, " ".join(
+            "{0:9.3f}".format(summary[phase]["mean"] * 1000)
+            for phase in PHASES + ("total",))))
+    print()
+    for (method, off, on) in overheads:
+        print("{0:16} off: {1:8.3f} ms  on: {2:8.3f} ms  ({3:+.1f}%)".format(
+            method, off * 1000, on * 1000, (on / off - 1) * 100))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Journeys planned per second against a local stub server that adds 20 ms
+of latency per request: SearchJourneyPlanner called one query after
+another, against IterJourneyPlannerBatch on a thread pool and on AsyncApi.
+
+    python -m benchmarks.bench_journey_batch
+"""
+
+import asyncio
+import time
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+SERIAL = 50
+BATCH = 1000
+WORKERS = 32
+
+
+def _Queries(count):
+    return [("1000129", "{0:07d}".format(i)) for i in range(count)]
+
+
+async def _Async(base_url):
+    async with tfl.AsyncApi(app_id="bench", app_key="bench",
+                            max_concurrency=WORKERS) as api:
+        api.base_url = base_url
+        return [r async for r in api.IterJourneyPlannerBatch(_Queries(BATCH))]
+
+
+def main():
+    with StubServer("tests/testdata/journey/planner_default.json",
+                    delay=0.02) as server:
+        with tfl.Api(app_id="bench", app_key="bench",
+                     pool_maxsize=WORKERS) as api:
+            api.base_url = server.base_url
+
+            start = time.time()
+            for (_from, to) in _Queries(SERIAL):
+                api.SearchJourneyPlanner(_from, to)
+            serial = SERIAL / (time.time() - start)
+
+            start = time.time()
+            for _ in api.IterJourneyPlannerBatch(_Queries(BATCH)):
+                pass
+            threaded = BATCH / (time.time() - start)
+
+        start = time.time()
+        asyncio.run(_Async(server.base_url))
+        concurrent = BATCH / (time.time() - start)
+
+    print("serial:  {0:8.1f} journeys/s".format(serial))
+    print("threads: {0:8.1f} journeys/s ({1:.1f}x)".format(
+        threaded, threaded / serial))
+    print("async:   {0:8.1f} journeys/s ({1:.1f}x)".format(
+        concurrent, concurrent / serial))
+
+
+if __name__ == "__main__":
+    main()
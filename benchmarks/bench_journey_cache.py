@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Requests sent for 2000 journey queries between 20 origin/destination
+pairs, with GPS jitter in the coordinates, departure times spread over
+ten minutes and modes given in any order: with the URL response cache,
+against the JourneyCache, served by a local stub server.
+
+    python -m benchmarks.bench_journey_cache
+"""
+
+import random
+import time
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+QUERIES = 2000
+PAIRS = 20
+
+
+def _Queries():
+    rng = random.Random(1)
+    places = [(51.5 + rng.random() / 10, -0.2 + rng.random() / 5)
+              for _ in range(PAIRS * 2)]
+    queries = []
+    for _ in range(QUERIES):
+        pair = rng.randrange(PAIRS)
+        (lat, lon) = places[2 * pair]
+        modes = ["tube", "bus", "overground"]
+        rng.shuffle(modes)
+        queries.append({
+            "_from": "{0:.6f},{1:.6f}".format(
+                lat + rng.gauss(0, 0.00002), lon + rng.gauss(0, 0.00002)),
+            "to": "{0:.4f},{1:.4f}".format(*places[2 * pair + 1]),
+            "time": "09{0:02d}".format(30 + rng.randrange(10)),
+            "mode": modes if rng.random() < 0.5 else ",".join(modes),
+        })
+
+    return queries
+
+
+def _Run(base_url, queries, **kwargs):
+    with tfl.Api(app_id="bench", app_key="bench", **kwargs) as api:
+        api.base_url = base_url
+        start = time.time()
+        for query in queries:
+            api.SearchJourneyPlanner(**query)
+
+        return (time.time() - start, api.coalesce_stats["requests"])
+
+
+def main():
+    queries = _Queries()
+    with StubServer("tests/testdata/journey/planner_default.json") as server:
+        (url_seconds, url_requests) = _Run(
+            server.base_url, queries, cache=True)
+        (journey_seconds, journey_requests) = _Run(
+            server.base_url, queries,
+            journey_cache=tfl.JourneyCache(precision=3, time_bucket=15))
+
+    print("url cache:     {0:5d} requests  {1:8.1f} ms".format(
+        url_requests, url_seconds * 1000))
+    print("journey cache: {0:5d} requests  {1:8.1f} ms".format(
+        journey_requests, journey_seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Time to parse the journey planner fixtures and read each journey's
+duration, building nested models eagerly versus lazily.
+
+    python -m benchmarks.bench_lazy
+"""
+
+import json
+import timeit
+
+from tfl.models import JourneyPlanner
+
+FIXTURES = [
+    "tests/testdata/journey/planner_default.json",
+    "tests/testdata/journey/planner_via.json",
+]
+NUMBER = 200
+
+
+def _Durations(data, lazy):
+    planner = JourneyPlanner.fromJSON(data, lazy=lazy)
+    return [journey.duration for journey in planner.journeys]
+
+
+def main():
+    for fixture in FIXTURES:
+        with open(fixture) as f:
+            data = json.load(f)
+        eager = timeit.timeit(lambda: _Durations(data, False), number=NUMBER)
+        lazy = timeit.timeit(lambda: _Durations(data, True), number=NUMBER)
+        print("{0:45} eager: {1:7.3f} ms  lazy: {2:7.3f} ms  ({3:.0f}x)"
+              .format(fixture, eager / NUMBER * 1000, lazy / NUMBER * 1000,
+                      eager / lazy))
+
+
+if __name__ == "__main__":
+    main()
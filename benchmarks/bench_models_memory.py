@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Memory retained by the parsed BikePoint and Cabwise fixtures, using the
+slotted models against the layout models used to have: a per-instance
+``defaults`` dict, a ``__dict__`` and a ``_json`` reference to the payload.
+
+    python -m benchmarks.bench_models_memory
+"""
+
+import gc
+import json
+import tracemalloc
+
+from tfl.models import AdditionalProperty, BpChildUrl, Cabwise, Point
+
+CASES = [
+    ("BikePoint", "tests/testdata/bike_points.json", lambda d: d, Point,
+     {"additionalProperties": AdditionalProperty,
+      "childrenUrls": BpChildUrl}),
+    ("Cabwise", "tests/testdata/cabwise_no_options.json",
+     lambda d: d["Operators"]["OperatorList"], Cabwise, {}),
+]
+
+
+class _LegacyModel(object):
+
+    def __init__(self, cls, data, nested):
+        self.defaults = dict(cls.defaults)
+        for (param, default) in self.defaults.items():
+            value = data.get(param, default)
+            if param in nested and value is not None:
+                value = [_LegacyModel(nested[param], v, {}) for v in value]
+            elif isinstance(value, list):
+                value = list(value)
+            setattr(self, param, value)
+        self._json = data
+
+
+def _Retained(text, select, build):
+    gc.collect()
+    tracemalloc.start()
+    models = [build(x) for x in select(json.loads(text))]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return retained, len(models)
+
+
+def main():
+    for (name, fixture, select, cls, nested) in CASES:
+        with open(fixture) as f:
+            text = f.read()
+        legacy, count = _Retained(
+            text, select, lambda x: _LegacyModel(cls, x, nested))
+        compact, _ = _Retained(text, select, cls.fromJSON)
+        print("{0:10} {1:5} objects  legacy: {2:6.2f} MB  slotted: "
+              "{3:6.2f} MB  ({4:.1f}x smaller)".format(
+                  name, count, legacy / 1e6, compact / 1e6,
+                  float(legacy) / compact))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Startup cost of the bike point, Cabwise and line route sequence fixtures:
+parsing the JSON file and building models, against opening a saved
+snapshot (memory mapped, decoded on access), reading its first model, and
+decoding every model in it. Also prints the file sizes.
+
+    python -m benchmarks.bench_persistence
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import timeit
+
+from tfl import models
+from tfl.persistence import load_snapshot, save_snapshot
+
+NUMBER = 20
+
+FIXTURES = [
+    ("tests/testdata/bike_points.json", models.Point),
+    ("tests/testdata/cabwise_extra_options.json", models.Cabwise),
+    ("tests/testdata/line_route_sequence.json", models.LineRouteSequence),
+]
+
+
+def _Load(fixture, cls):
+    with open(fixture) as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "Operators" in data:
+        data = data["Operators"]["OperatorList"]
+    if not isinstance(data, list):
+        data = [data]
+
+    return [cls.fromJSON(d) for d in data]
+
+
+def _Time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+
+
+def _Open(path):
+    with load_snapshot(path) as snapshot:
+        return snapshot[0]
+
+
+def _Full(path):
+    with load_snapshot(path) as snapshot:
+        return list(snapshot)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        for (fixture, cls) in FIXTURES:
+            path = os.path.join(directory, os.path.basename(fixture))
+            save_snapshot(path, _Load(fixture, cls))
+            timings = [
+                _Time(lambda: _Load(fixture, cls)),
+                _Time(lambda: _Open(path)),
+                _Time(lambda: _Full(path)),
+            ]
+            print("{0:45} json: {1:7.3f} ms  open: {2:6.3f} ms  "
+                  "all: {3:7.3f} ms  ({4} -> {5} bytes)".format(
+                      fixture, *[t * 1000 for t in timings] + [
+                          os.path.getsize(fixture), os.path.getsize(path)]))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Time to serialise the model tree of each journey planner fixture: the old
+toDict() (getattr/isinstance probing per field) with json.dumps, against
+the compiled toDict() with toString(), toJSON() bytes, and
+toJSON(original=True) on an unmodified model kept with keep_json.
+
+    python -m benchmarks.bench_serialise
+"""
+
+import glob
+import json
+import timeit
+
+from tfl import models
+
+NUMBER = 200
+
+
+def _LegacyToDict(self):
+    if not isinstance(self, models.TflModel):
+        # Geometry, which the old models kept as its JSON text
+        return self.toDict()
+    data = {}
+    for (key, _) in self.defaults.items():
+        if isinstance(getattr(self, key, None), (list, set, tuple)):
+            data[key] = []
+            for sub in getattr(self, key, None):
+                if getattr(sub, "toDict", None):
+                    data[key].append(_LegacyToDict(sub))
+                else:
+                    data[key].append(sub)
+
+        elif getattr(getattr(self, key, None), "toDict", None):
+            data[key] = _LegacyToDict(getattr(self, key))
+
+        elif hasattr(self, key):
+            data[key] = getattr(self, key, None)
+
+    return data
+
+
+def _Time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main():
+    print("JSON backend: {0}".format(
+        "orjson" if models.orjson is not None else "json"))
+    for fixture in sorted(glob.glob("tests/testdata/journey/*.json")):
+        with open(fixture) as f:
+            data = json.load(f)
+        cls = models.JourneyPlanner
+        if "DisambiguationResult" in data["$type"]:
+            cls = models.JourneyDisambiguation
+        cls.keep_json = True
+        try:
+            model = cls.fromJSON(data)
+        finally:
+            del cls.keep_json
+
+        timings = [
+            _Time(lambda: json.dumps(_LegacyToDict(model), sort_keys=True)),
+            _Time(model.toString),
+            _Time(model.toJSON),
+            _Time(lambda: model.toJSON(original=True)),
+        ]
+        print("{0:52} old: {1:6.3f} ms  toString: {2:6.3f} ms  "
+              "toJSON: {3:6.3f} ms  original: {4:6.3f} ms".format(
+                  fixture, *[t * 1000 for t in timings]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Per-request latency of Api.GetAirQuality against a local stub server, with
+a fresh connection per request (keep_alive=0, the old behaviour) and with
+the pooled keep-alive session.
+
+    python -m benchmarks.bench_session
+"""
+
+import time
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+REQUESTS = 500
+
+
+def _Run(base_url, **kwargs):
+    with tfl.Api(app_id="bench", app_key="bench", **kwargs) as api:
+        api.base_url = base_url
+        api.GetAirQuality()
+        start = time.time()
+        for _ in range(REQUESTS):
+            api.GetAirQuality()
+        return (time.time() - start) / REQUESTS
+
+
+def main():
+    with StubServer("tests/testdata/air_quality.json") as server:
+        fresh = _Run(server.base_url, keep_alive=0)
+        pooled = _Run(server.base_url)
+
+    print("fresh connection: {0:8.3f} ms/request".format(fresh * 1000))
+    print("pooled session:   {0:8.3f} ms/request".format(pooled * 1000))
+    print("speed-up:         {0:8.2f}x".format(fresh / pooled))
+
+
+if __name__ == "__main__":
+    main()
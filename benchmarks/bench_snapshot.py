@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Fleet-wide stats over tests/testdata/bike_points.json (total bikes, docks
+with no bikes, the five nearest docks with bikes) from Point models
+against a BikePointSnapshot, including the time to build each.
+
+    python -m benchmarks.bench_snapshot
+"""
+
+import json
+import timeit
+
+from tfl.models import Point
+from tfl.snapshot import BikePointSnapshot
+from tfl.spatial import distance
+
+NUMBER = 20
+LONDON = (51.5074, -0.1278)
+
+
+def _Bikes(point):
+    for prop in point.additionalProperties:
+        if prop.key == "NbBikes":
+            return int(prop.value)
+    return -1
+
+
+def _Models(data):
+    points = [Point.fromJSON(p) for p in data]
+    total = sum(max(0, _Bikes(p)) for p in points)
+    empty = [p.id for p in points if _Bikes(p) == 0]
+    nearest = sorted(
+        (p for p in points if _Bikes(p) > 0),
+        key=lambda p: distance(LONDON[0], LONDON[1], p.lat, p.lon))[:5]
+    return (total, empty, nearest)
+
+
+def _Stats(snapshot):
+    total = snapshot.bikes[snapshot.bikes > 0].sum()
+    empty = snapshot[snapshot.bikes == 0].ids
+    nearest = snapshot.nearest(
+        LONDON[0], LONDON[1], k=5, mask=snapshot.bikes > 0)
+    return (total, empty, nearest)
+
+
+def _Snapshot(data):
+    return _Stats(BikePointSnapshot.fromJSON(data))
+
+
+def main():
+    with open("tests/testdata/bike_points.json") as f:
+        data = json.load(f)
+    snapshot = BikePointSnapshot.fromJSON(data)
+
+    for (name, function, argument) in (
+            ("models, build + stats", _Models, data),
+            ("snapshot, build + stats", _Snapshot, data),
+            ("snapshot, stats only", _Stats, snapshot)):
+        seconds = min(timeit.repeat(
+            lambda: function(argument), number=NUMBER, repeat=3)) / NUMBER
+        print("{0:25} {1:8.3f} ms".format(name, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Time to find the five docks nearest to random spots around central
+London among the points in tests/testdata/bike_points.json: a full scan
+against BikePointIndex.nearest, plus BikePointIndex.within for 500m.
+
+    python -m benchmarks.bench_spatial
+"""
+
+import json
+import random
+import time
+
+from tfl.models import Point
+from tfl.spatial import BikePointIndex, distance
+
+QUERIES = 1000
+
+
+def _Time(function, queries):
+    start = time.time()
+    for (lat, lon) in queries:
+        function(lat, lon)
+    return (time.time() - start) / len(queries)
+
+
+def main():
+    with open("tests/testdata/bike_points.json") as f:
+        points = [Point.fromJSON(p) for p in json.load(f)]
+    index = BikePointIndex(points)
+
+    random.seed(0)
+    queries = [(random.uniform(51.45, 51.55), random.uniform(-0.22, -0.02))
+               for _ in range(QUERIES)]
+
+    scan = _Time(lambda lat, lon: sorted(
+        points, key=lambda p: distance(lat, lon, p.lat, p.lon))[:5], queries)
+    nearest = _Time(lambda lat, lon: index.nearest(lat, lon, k=5), queries)
+    within = _Time(lambda lat, lon: index.within(lat, lon, 500), queries)
+
+    print("{0} points".format(len(points)))
+    print("scan:    {0:7.3f} ms/query".format(scan * 1000))
+    print("nearest: {0:7.3f} ms/query".format(nearest * 1000))
+    print("within:  {0:7.3f} ms/query".format(within * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Peak Python memory of building every model in one list versus consuming
+the streaming Iter* variants one element at a time.
+
+    python -m benchmarks.bench_streaming
+"""
+
+import tracemalloc
+
+import tfl
+from benchmarks.stub_server import StubServer
+
+CASES = [
+    ("BikePoint", "tests/testdata/bike_points.json",
+     lambda api: api.GetBikePoints(), lambda api: api.IterBikePoints()),
+    ("Cabwise", "tests/testdata/cabwise_no_options.json",
+     lambda api: api.SearchCabwise(51.5, -0.12),
+     lambda api: api.IterCabwise(51.5, -0.12)),
+]
+
+
+def _Peak(fixture, call):
+    with StubServer(fixture) as server:
+        with tfl.Api(app_id="bench", app_key="bench") as api:
+            api.base_url = server.base_url
+            tracemalloc.start()
+            count = 0
+            for _ in call(api):
+                count += 1
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return peak, count
+
+
+def main():
+    for (name, fixture, whole, streamed) in CASES:
+        whole_peak, count = _Peak(fixture, whole)
+        streamed_peak, _ = _Peak(fixture, streamed)
+        print("{0:10} {1:5} objects  list: {2:7.2f} MB  iter: {3:7.2f} MB"
+              .format(name, count, whole_peak / 1e6, streamed_peak / 1e6))
+
+
+if __name__ == "__main__":
+    main()
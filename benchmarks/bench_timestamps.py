@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Time to sort every bike point property in tests/testdata/bike_points.json
+by its modified timestamp: dateutil per property, the fixed-format parser
+per property, and epoch_seconds() over the whole list.
+
+    python -m benchmarks.bench_timestamps
+"""
+
+import json
+import timeit
+
+from dateutil import parser
+
+from tfl.models import Point, epoch_seconds
+from tfl.utils import timestamp_to_seconds
+
+NUMBER = 5
+
+
+def _Dateutil(properties):
+    return sorted(properties, key=lambda p: parser.parse(p.modified))
+
+
+def _Parser(properties):
+    return sorted(properties, key=lambda p: timestamp_to_seconds(p.modified))
+
+
+def _Batch(properties):
+    seconds = epoch_seconds(properties, "modified")
+    order = sorted(range(len(properties)), key=seconds.__getitem__)
+    return [properties[i] for i in order]
+
+
+def main():
+    with open("tests/testdata/bike_points.json") as f:
+        points = [Point.fromJSON(p) for p in json.load(f)]
+    properties = [p for point in points for p in point.additionalProperties]
+
+    print("{0} properties".format(len(properties)))
+    for (name, function) in (("dateutil", _Dateutil), ("parser", _Parser),
+                             ("epoch_seconds", _Batch)):
+        seconds = min(timeit.repeat(
+            lambda: function(properties), number=NUMBER, repeat=3)) / NUMBER
+        print("{0:15} {1:8.2f} ms".format(name, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 # encoding: utf-8
-from __future__ import unicode_literals
 
+import json
 import os
 import re
 import responses
+import threading
+import time
 import unittest
 
 import tfl
@@ -267,7 +269,7 @@ class TestTflApi(unittest.TestCase):
         categories = self.api.GetLineDisruptionCategories()
         self.assertTrue(isinstance(categories, list))
         self.assertGreater(len(categories), 1)
-        self.assertTrue(isinstance(categories[0], unicode))
+        self.assertTrue(isinstance(categories[0], str))
 
     @responses.activate
     def test_line_service_types(self):
@@ -282,7 +284,7 @@ class TestTflApi(unittest.TestCase):
         services = self.api.GetLineServiceTypes()
         self.assertTrue(isinstance(services, list))
         self.assertGreater(len(services), 1)
-        self.assertTrue(isinstance(services[0], unicode))
+        self.assertTrue(isinstance(services[0], str))
 
     @responses.activate
     def test_line_by_id(self):
@@ -374,7 +376,7 @@ class TestTflApi(unittest.TestCase):
             "waterloocity", "inbound", "Regular", True
         )
         self.assertTrue(isinstance(line, tfl.LineRouteSequence))
-        self.assertTrue(isinstance(line.lineStrings, list))
+        self.assertTrue(isinstance(line.lineStrings, tfl.Geometry))
         self.assertTrue(isinstance(line.stations, list))
         self.assertTrue(isinstance(line.stations[0], tfl.models.Station))
         self.assertTrue(isinstance(line.stopPointSequences, list))
@@ -386,3 +388,366 @@ class TestTflApi(unittest.TestCase):
         self.assertTrue(isinstance(
             line.orderedLineRoutes[0], tfl.models.LineRoute)
         )
+
+    @responses.activate
+    def test_session_reused(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        self.api.GetAirQuality()
+        session = self.api._session
+        self.api.GetAirQuality()
+        self.assertIs(session, self.api._session)
+
+    @responses.activate
+    def test_session_keep_alive_recycles(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", keep_alive=0)
+        api.GetAirQuality()
+        session = api._session
+        closed = []
+        session.close = lambda: closed.append(session)
+        api.GetAirQuality()
+        self.assertIsNot(session, api._session)
+        # Left open for any request still using it
+        self.assertEqual([], closed)
+
+    @responses.activate
+    def test_session_close(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        with tfl.Api(app_id="test", app_key="test") as api:
+            api.GetAirQuality()
+            self.assertIsNotNone(api._session)
+        self.assertIsNone(api._session)
+
+    @responses.activate
+    def test_cache_meta_endpoint(self):
+        with open("tests/testdata/line_mode.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", cache=True)
+        first = api.GetLineModes()
+        second = api.GetLineModes()
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual(first, second)
+
+    @responses.activate
+    def test_cache_respects_cache_control(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            headers={"Cache-Control": "no-cache"},
+            match_querystring=True
+        )
+
+        api = tfl.Api(
+            app_id="test", app_key="test", cache=True, default_cache_ttl=60)
+        api.GetAirQuality()
+        api.GetAirQuality()
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_cache_recommended_max_age(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", cache=True)
+        api.SearchJourneyPlanner(_from="1000129", to="1000077")
+        api.SearchJourneyPlanner(_from="1000129", to="1000077")
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_cache_disabled_by_default(self):
+        with open("tests/testdata/line_mode.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        self.api.GetLineModes()
+        self.api.GetLineModes()
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_conditional_get_not_modified(self):
+        with open("tests/testdata/bike_points.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            headers={"ETag": "\"abc\"",
+                     "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            match_querystring=True
+        )
+        responses.add(
+            responses.GET, DEFAULT_URL, status=304,
+            match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", conditional_get=True)
+        first = api.GetBikePoints()
+        second = api.GetBikePoints()
+
+        self.assertEqual(2, len(responses.calls))
+        headers = responses.calls[1].request.headers
+        self.assertEqual("\"abc\"", headers["If-None-Match"])
+        self.assertEqual(
+            "Wed, 21 Oct 2015 07:28:00 GMT", headers["If-Modified-Since"])
+        self.assertIsNot(first, second)
+        self.assertTrue(all(a is b for (a, b) in zip(first, second)))
+        self.assertEqual(1, api.revalidation_stats["not_modified"])
+        self.assertEqual(
+            len(json_data.encode("utf-8")),
+            api.revalidation_stats["bytes_saved"])
+        self.assertGreater(api.revalidation_stats["parse_seconds_saved"], 0)
+
+    @responses.activate
+    def test_conditional_get_modified(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            headers={"ETag": "\"abc\""}, match_querystring=True
+        )
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            headers={"ETag": "\"def\""}, match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", conditional_get=True)
+        first = api.GetAirQuality()
+        second = api.GetAirQuality()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(0, api.revalidation_stats["not_modified"])
+
+    @responses.activate
+    def test_iter_bike_points(self):
+        with open("tests/testdata/bike_points.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        bike_points = self.api.IterBikePoints()
+        self.assertFalse(isinstance(bike_points, (list, tuple, set)))
+        self.assertEqual(self.api.GetBikePoints(), list(bike_points))
+
+    @responses.activate
+    def test_iter_accident_stats(self):
+        with open("tests/testdata/accident_correct.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        accidents = list(self.api.IterAccidentStats(2016))
+        self.assertGreater(len(accidents), 0)
+        self.assertTrue(isinstance(accidents[0], tfl.Accident))
+
+    @responses.activate
+    def test_iter_cabwise(self):
+        with open("tests/testdata/cabwise_no_options.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        cabs = list(self.api.IterCabwise(lat=51.5, lon=-0.12))
+        self.assertEqual(self.api.SearchCabwise(lat=51.5, lon=-0.12), cabs)
+
+    @responses.activate
+    def test_iter_bike_points_error(self):
+        with open("tests/testdata/bike_point_incorrect.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        self.assertRaises(
+            tfl.TflError, lambda: list(self.api.IterBikePoints())
+        )
+
+    def _LinesCallback(self, requested):
+        with open("tests/testdata/line_by_id.json") as f:
+            lines = json.load(f)
+        with open("tests/testdata/bike_point_incorrect.json") as f:
+            not_found = f.read()
+
+        def callback(request):
+            ids = request.path_url.split("/")[2].split(",")
+            requested.append(ids)
+            if "bogus" in ids:
+                return (404, {}, not_found)
+            return (200, {}, json.dumps(
+                [l for l in lines if l["id"] in ids]))
+
+        return callback
+
+    @responses.activate
+    def test_lines_batch(self):
+        requested = []
+        responses.add_callback(
+            responses.GET, DEFAULT_URL, callback=self._LinesCallback(requested)
+        )
+
+        lines = self.api.GetLinesBatch(
+            ["central", "bakerloo", "bogus", "central"])
+        self.assertEqual(
+            ["central", "bakerloo", None, "central"],
+            [getattr(l, "id", None) for l in lines])
+        self.assertTrue(isinstance(lines[2], tfl.TflError))
+        # The failed request is retried one ID at a time
+        self.assertEqual(
+            [["central", "bakerloo", "bogus"], ["central"], ["bakerloo"],
+             ["bogus"]], requested)
+
+    @responses.activate
+    def test_lines_batch_chunks(self):
+        requested = []
+        responses.add_callback(
+            responses.GET, DEFAULT_URL, callback=self._LinesCallback(requested)
+        )
+
+        url = self.api._RequestURL(self.api.base_url + "Line//")
+        lines = self.api.GetLinesBatch(
+            ["bakerloo", "central", "victoria"],
+            max_url_length=len(url) + len("bakerloo,central"))
+        self.assertEqual(
+            [["bakerloo", "central"], ["victoria"]],
+            sorted(requested))
+        self.assertEqual("bakerloo", lines[0].id)
+        self.assertEqual("central", lines[1].id)
+        self.assertTrue(isinstance(lines[2], tfl.TflError))
+
+    @responses.activate
+    def test_bike_points_batch(self):
+        with open("tests/testdata/bike_point_correct.json") as f:
+            bike_point = json.load(f)
+        with open("tests/testdata/bike_point_incorrect.json") as f:
+            not_found = f.read()
+
+        def callback(request):
+            _id = request.path_url.split("?")[0].split("/")[2]
+            if _id == "Invalid_BikePoint":
+                return (404, {}, not_found)
+            return (200, {}, json.dumps(dict(bike_point, id=_id)))
+
+        responses.add_callback(responses.GET, DEFAULT_URL, callback=callback)
+
+        points = self.api.GetBikePointsBatch(
+            ["BikePoints_{0}".format(i) for i in range(20)] +
+            ["Invalid_BikePoint"])
+        self.assertEqual(
+            ["BikePoints_{0}".format(i) for i in range(20)],
+            [p.id for p in points[:20]])
+        self.assertTrue(isinstance(points[20], tfl.TflError))
+
+    @responses.activate
+    def test_retry(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+
+        responses.add(responses.GET, DEFAULT_URL, status=503,
+                      json={"exceptionType": "EntityNotFoundException",
+                            "httpStatusCode": 503, "message": "Busy"})
+        responses.add(responses.GET, DEFAULT_URL, status=429,
+                      headers={"Retry-After": "0"}, body="")
+        responses.add(responses.GET, DEFAULT_URL, body=json_data,
+                      content_type="application/json")
+
+        api = tfl.Api(app_id="test", app_key="test",
+                      retry=tfl.RetryPolicy(backoff=0))
+        self.assertTrue(isinstance(api.GetAirQuality()[0], tfl.AirQuality))
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_retry_gives_up(self):
+        responses.add(responses.GET, DEFAULT_URL, status=503,
+                      json={"exceptionType": "EntityNotFoundException",
+                            "httpStatusCode": 503, "message": "Busy"})
+
+        api = tfl.Api(app_id="test", app_key="test",
+                      retry=tfl.RetryPolicy(max_attempts=2, backoff=0))
+        self.assertRaises(
+            tfl.TflError, lambda: api.GetBikePoint("BikePoints_1"))
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_coalesce(self):
+        with open("tests/testdata/bike_points.json") as f:
+            json_data = f.read()
+        release = threading.Event()
+
+        def callback(request):
+            release.wait(5)
+            return (200, {}, json_data)
+
+        responses.add_callback(responses.GET, DEFAULT_URL, callback=callback)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.api.GetBikePoints()))
+            for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        deadline = time.time() + 5
+        while (self.api.coalesce_stats["coalesced"] < 9 and
+               time.time() < deadline):
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual({"requests": 1, "coalesced": 9},
+                         self.api.coalesce_stats)
+        self.assertEqual(10, len(results))
+        self.assertEqual(10, len(set(id(r) for r in results)))
+        self.assertTrue(all(r == results[0] for r in results))
+        results[0].clear()
+        self.assertEqual(len(results[1]), len(results[2]))
+        self.assertNotEqual(0, len(results[1]))
@@ -0,0 +1,337 @@
+# encoding: utf-8
+
+import asyncio
+import gc
+import unittest
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+import tfl
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestTflAsyncApi(unittest.TestCase):
+
+    def _Run(self, coroutine_function, fixture):
+        with open(fixture) as f:
+            json_data = f.read()
+
+        async def handler(request):
+            return web.Response(
+                body=json_data, content_type="application/json")
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/{tail:.*}", handler)
+            async with TestServer(app) as server:
+                async with tfl.AsyncApi(app_id="test", app_key="test") as api:
+                    api.base_url = str(server.make_url("/"))
+                    return await coroutine_function(api)
+
+        return asyncio.run(run())
+
+    def test_bike_points(self):
+        bike_points = self._Run(
+            lambda api: api.GetBikePoints(), "tests/testdata/bike_points.json")
+
+        self.assertGreater(len(bike_points), 0)
+        self.assertTrue(isinstance(bike_points[0], tfl.Point))
+        self.assertTrue(isinstance(
+            bike_points[0].additionalProperties[0], tfl.AdditionalProperty)
+        )
+
+    def test_bike_point_incorrect(self):
+        self.assertRaises(
+            tfl.TflError, lambda: self._Run(
+                lambda api: api.GetBikePoint("Invalid_BikePoint"),
+                "tests/testdata/bike_point_incorrect.json")
+        )
+
+    def test_line_by_id(self):
+        lines = self._Run(
+            lambda api: api.GetLinesByID(["victoria"]),
+            "tests/testdata/line_by_id.json")
+
+        self.assertTrue(isinstance(lines[0], tfl.Line))
+
+    def test_lines_batch(self):
+        lines = self._Run(
+            lambda api: api.GetLinesBatch(["central", "bakerloo", "victoria"]),
+            "tests/testdata/line_by_id.json")
+
+        self.assertEqual("central", lines[0].id)
+        self.assertEqual("bakerloo", lines[1].id)
+        self.assertTrue(isinstance(lines[2], tfl.TflError))
+
+    def test_bike_points_batch(self):
+        points = self._Run(
+            lambda api: api.GetBikePointsBatch(["BikePoints_1", "Invalid"]),
+            "tests/testdata/bike_point_incorrect.json")
+
+        self.assertTrue(isinstance(points[0], tfl.TflError))
+        self.assertTrue(isinstance(points[1], tfl.TflError))
+
+    def test_journey_planner_via(self):
+        journey = self._Run(
+            lambda api: api.SearchJourneyPlanner(
+                _from="1000129", to="1000077", via="1000248"),
+            "tests/testdata/journey/planner_via.json")
+
+        self.assertTrue(isinstance(journey, tfl.JourneyPlanner))
+        self.assertEqual(journey.journeyVector.via, "1000248")
+
+    def test_journey_planner_disambiguation(self):
+        journey = self._Run(
+            lambda api: api.SearchJourneyPlanner(
+                _from="Euston", to="Kings Cross"),
+            "tests/testdata/journey/planner_disambiguation.json")
+
+        self.assertTrue(isinstance(journey, tfl.JourneyDisambiguation))
+
+    def test_journey_planner_batch(self):
+        async def run(api):
+            progress = []
+            results = [
+                result async for result in api.IterJourneyPlannerBatch(
+                    [("1000129", str(i)) for i in range(20)], max_workers=5,
+                    progress=lambda done, total: progress.append(done))]
+            return (results, progress)
+
+        (results, progress) = self._Run(
+            run, "tests/testdata/journey/planner_default.json")
+
+        self.assertEqual(list(range(20)), sorted(i for (i, _) in results))
+        self.assertTrue(all(
+            isinstance(journey, tfl.JourneyPlanner)
+            for (_, journey) in results))
+        self.assertEqual(list(range(1, 21)), progress)
+
+    def test_journey_planner_batch_malformed(self):
+        async def run(api):
+            return [
+                result async for result in api.IterJourneyPlannerBatch(
+                    [("1000129", "1000077"), query])]
+
+        for query in ({"_from": "1000129"},
+                      {"_from": "a", "to": "b", "too": "x"}):
+            self.assertRaises(tfl.TflError, lambda: self._Run(
+                run, "tests/testdata/journey/planner_default.json"))
+
+    def _RunBlocked(self, coroutine_function):
+        # Requests for a path containing "slow" are held until the server
+        # shuts down; the loop's unhandled errors are returned as well
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+
+        async def handler(request):
+            if "slow" in request.path:
+                await asyncio.sleep(60)
+            return web.Response(
+                body=json_data, content_type="application/json")
+
+        async def run():
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: errors.append(context))
+            app = web.Application()
+            app.router.add_get("/{tail:.*}", handler)
+            async with TestServer(app) as server:
+                api = tfl.AsyncApi(app_id="test", app_key="test")
+                api.base_url = str(server.make_url("/"))
+                result = await coroutine_function(api)
+                await api.close()
+                self.assertEqual({}, api._flights)
+            gc.collect()
+            await asyncio.sleep(0)
+            return (result, errors)
+
+        return asyncio.run(run())
+
+    def test_abandoned_flight_is_cancelled(self):
+        async def run(api):
+            callers = [
+                asyncio.ensure_future(api.SearchJourneyPlanner("slow", "b"))
+                for _ in range(2)]
+            await asyncio.sleep(0.1)
+            flight = list(api._flights.values())[0]
+            callers[0].cancel()
+            await asyncio.sleep(0)
+            running = not flight.task.done()
+            callers[1].cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            return (running, flight.task.cancelled())
+
+        ((running, cancelled), errors) = self._RunBlocked(run)
+
+        self.assertTrue(running)
+        self.assertTrue(cancelled)
+        self.assertEqual([], errors)
+
+    def test_aborted_batch_then_close(self):
+        async def run(api):
+            batch = api.IterJourneyPlannerBatch(
+                [("fast", "b")] + [("slow", str(i)) for i in range(5)])
+            first = await batch.__anext__()
+            await batch.aclose()
+            return first
+
+        ((index, journey), errors) = self._RunBlocked(run)
+
+        self.assertEqual(0, index)
+        self.assertTrue(isinstance(journey, tfl.JourneyPlanner))
+        self.assertEqual([], errors)
+
+    def test_close_cancels_flights(self):
+        async def run(api):
+            caller = asyncio.ensure_future(
+                api.SearchJourneyPlanner("slow", "b"))
+            await asyncio.sleep(0.1)
+            await api.close()
+            await asyncio.gather(caller, return_exceptions=True)
+            return caller.cancelled()
+
+        (result, errors) = self._RunBlocked(run)
+
+        self.assertTrue(result)
+        self.assertEqual([], errors)
+
+    def test_cabwise(self):
+        cabs = self._Run(
+            lambda api: api.SearchCabwise(lat=51.5, lon=-0.12),
+            "tests/testdata/cabwise_extra_options.json")
+
+        self.assertTrue(isinstance(cabs[0], tfl.Cabwise))
+
+    def test_iter_bike_points(self):
+        instrumentation = tfl.Instrumentation()
+
+        async def run(api):
+            api.instrumentation = instrumentation
+            return [point async for point in api.IterBikePoints()]
+
+        points = self._Run(run, "tests/testdata/bike_points.json")
+
+        self.assertGreater(len(points), 0)
+        self.assertTrue(isinstance(points[0], tfl.Point))
+        summary = instrumentation.summary()["IterBikePoints"]
+        self.assertEqual(len(points), summary["objects"])
+
+    def test_iter_cabwise(self):
+        async def run(api):
+            return [cab async for cab in api.IterCabwise(
+                lat=51.5, lon=-0.12)]
+
+        cabs = self._Run(run, "tests/testdata/cabwise_extra_options.json")
+
+        self.assertGreater(len(cabs), 0)
+        self.assertTrue(isinstance(cabs[0], tfl.Cabwise))
+
+    def test_iter_accident_stats(self):
+        async def run(api):
+            accidents = api.IterAccidentStats(2016)
+            first = await accidents.__anext__()
+            await accidents.aclose()
+            return first
+
+        accident = self._Run(run, "tests/testdata/accident_correct.json")
+
+        self.assertTrue(isinstance(accident, tfl.Accident))
+
+    def test_iter_error(self):
+        async def run(api):
+            return [point async for point in api.IterBikePoints()]
+
+        self.assertRaises(
+            tfl.TflError, lambda: self._Run(
+                run, "tests/testdata/bike_point_incorrect.json"))
+
+    def test_concurrency_limit(self):
+        async def run(api):
+            api._max_concurrency = 5
+            api.coalesce = False
+            return await asyncio.gather(
+                *[api.GetAirQuality() for _ in range(50)])
+
+        results = self._Run(run, "tests/testdata/air_quality.json")
+
+        self.assertEqual(len(results), 50)
+        self.assertTrue(isinstance(results[0][0], tfl.AirQuality))
+
+    def test_retry(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+        calls = []
+
+        async def handler(request):
+            calls.append(request.path)
+            if len(calls) == 1:
+                return web.Response(status=429, headers={"Retry-After": "0"})
+            return web.Response(
+                body=json_data, content_type="application/json")
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/{tail:.*}", handler)
+            async with TestServer(app) as server:
+                async with tfl.AsyncApi(
+                        app_id="test", app_key="test",
+                        retry=tfl.RetryPolicy(backoff=0)) as api:
+                    api.base_url = str(server.make_url("/"))
+                    return await api.GetAirQuality()
+
+        results = asyncio.run(run())
+
+        self.assertTrue(isinstance(results[0], tfl.AirQuality))
+        self.assertEqual(2, len(calls))
+
+    def test_coalesce(self):
+        with open("tests/testdata/air_quality.json") as f:
+            json_data = f.read()
+        calls = []
+
+        async def handler(request):
+            calls.append(request.path)
+            await asyncio.sleep(0.05)
+            return web.Response(
+                body=json_data, content_type="application/json")
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/{tail:.*}", handler)
+            async with TestServer(app) as server:
+                async with tfl.AsyncApi(app_id="test", app_key="test") as api:
+                    api.base_url = str(server.make_url("/"))
+                    results = await asyncio.gather(
+                        *[api.GetAirQuality() for _ in range(20)])
+                    return (results, api.coalesce_stats)
+
+        (results, stats) = asyncio.run(run())
+
+        self.assertEqual(20, len(results))
+        self.assertEqual(1, len(calls))
+        self.assertEqual({"requests": 1, "coalesced": 19}, stats)
+
+    def test_instrumentation(self):
+        instrumentation = tfl.Instrumentation()
+
+        async def run(api):
+            api.instrumentation = instrumentation
+            return await asyncio.gather(
+                api.GetBikePoints(), api.GetBikePoints())
+
+        results = self._Run(run, "tests/testdata/bike_points.json")
+
+        summary = instrumentation.summary()["GetBikePoints"]
+        self.assertEqual(2, summary["requests"])
+        self.assertEqual(2 * len(results[0]), summary["objects"])
+        self.assertGreater(summary["bytes"], 0)
+        self.assertGreater(summary["decode"]["max"], 0)
+        self.assertGreater(summary["build"]["max"], 0)
+
+    def test_sync_context_manager(self):
+        api = tfl.AsyncApi(app_id="test", app_key="test")
+        self.assertRaises(tfl.TflError, lambda: api.__enter__())
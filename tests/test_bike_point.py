@@ -1,3 +1,4 @@
+import calendar
 import json
 import unittest
 
@@ -54,3 +55,111 @@ class BikePointTest(unittest.TestCase):
         data = json.loads(self.SAMPLE_JSON)
         bike_point = tfl.Point.fromJSON(data)
         self.assertEqual(self._SampleBikePoint(), bike_point)
+
+    def test_compact_layout(self):
+        data = json.loads(self.SAMPLE_JSON)
+        bike_point = tfl.Point.fromJSON(data)
+        self.assertEqual(None, bike_point._json)
+        self.assertTrue("lat" in tfl.Point.__slots__)
+        self.assertFalse("defaults" in vars(bike_point))
+
+    def test_keep_json(self):
+        data = json.loads(self.SAMPLE_JSON)
+        tfl.Point.keep_json = True
+        try:
+            bike_point = tfl.Point.fromJSON(data)
+        finally:
+            del tfl.Point.keep_json
+        self.assertIs(data, bike_point._json)
+
+    def test_from_json_lazy(self):
+        with open("tests/testdata/bike_point_correct.json") as f:
+            data = json.load(f)
+
+        bike_point = tfl.Point.fromJSON(data, lazy=True)
+        self.assertTrue(isinstance(
+            bike_point.additionalProperties[0], tfl.AdditionalProperty))
+        self.assertEqual(tfl.Point.fromJSON(data), bike_point)
+
+    def test_from_json_nested(self):
+        with open("tests/testdata/bike_point_correct.json") as f:
+            data = json.load(f)
+
+        bike_point = tfl.Point.fromJSON(data)
+        self.assertTrue(isinstance(
+            bike_point.additionalProperties[0], tfl.AdditionalProperty))
+        self.assertEqual(
+            data["additionalProperties"][0]["key"],
+            bike_point.additionalProperties[0].key)
+        self.assertEqual(data["children"], bike_point.children)
+        self.assertIsNot(data["children"], bike_point.children)
+
+        bike_point = tfl.Point.fromJSON(data, commonName="Renamed")
+        self.assertEqual("Renamed", bike_point.commonName)
+        self.assertEqual(data["id"], bike_point.id)
+
+    def test_modified_in_seconds(self):
+        prop = tfl.AdditionalProperty(modified="2018-03-16T10:10:29.77Z")
+        self.assertEqual(
+            calendar.timegm((2018, 3, 16, 10, 10, 29)), prop.date_in_seconds)
+
+        prop.modified = "2018-03-16T11:10:29+01:00"
+        self.assertEqual(
+            calendar.timegm((2018, 3, 16, 10, 10, 29)), prop.date_in_seconds)
+
+        prop.modified = "16 March 2018 10:10"
+        self.assertEqual(
+            calendar.timegm((2018, 3, 16, 10, 10, 0)), prop.date_in_seconds)
+
+    def test_modified_out_of_range(self):
+        for value in ("2018-02-30T10:00:00Z", "2018-03-16T25:00:00Z",
+                      "2018-03-16T10:61:00Z", "2018-02-30T25:61:00Z",
+                      "2018-03-16T10:10:61+01:00", "2018-13-01T10:00:00"):
+            self.assertRaises(
+                ValueError, tfl.utils.timestamp_to_seconds, value)
+            self.assertRaises(
+                ValueError, tfl.utils.timestamps_to_seconds, [value])
+        self.assertEqual(
+            calendar.timegm((2016, 2, 29, 23, 59, 59)),
+            tfl.utils.timestamp_to_seconds("2016-02-29T23:59:59Z"))
+
+    def test_epoch_seconds(self):
+        with open("tests/testdata/bike_points.json") as f:
+            data = json.load(f)
+
+        properties = [
+            p for point in data
+            for p in tfl.Point.fromJSON(point).additionalProperties]
+        self.assertEqual(
+            [p.date_in_seconds for p in properties],
+            tfl.epoch_seconds(properties, "modified"))
+
+    def test_to_json(self):
+        with open("tests/testdata/bike_point_correct.json") as f:
+            data = json.load(f)
+
+        bike_point = tfl.Point.fromJSON(data)
+        self.assertEqual(bike_point.toDict(), json.loads(bike_point.toJSON()))
+        self.assertEqual(
+            bike_point.toDict(), json.loads(bike_point.toJSON(original=True)))
+
+    def test_to_json_original(self):
+        with open("tests/testdata/bike_point_correct.json") as f:
+            data = json.load(f)
+
+        tfl.Point.keep_json = True
+        try:
+            bike_point = tfl.Point.fromJSON(data, lazy=True)
+            lazy_point = tfl.Point.fromJSON(data, lazy=True)
+        finally:
+            del tfl.Point.keep_json
+        self.assertEqual(data, json.loads(bike_point.toJSON(original=True)))
+
+        bike_point.additionalProperties[0].value = "Changed"
+        self.assertEqual(
+            bike_point.toDict(), json.loads(bike_point.toJSON(original=True)))
+
+        lazy_point.commonName = "Renamed"
+        self.assertEqual(
+            "Renamed", json.loads(lazy_point.toJSON(original=True))[
+                "commonName"])
@@ -0,0 +1,159 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import tfl
+
+from tfl.cache import (
+    JourneyCache, LRUCache, PlaceCache, cache_key, cache_ttl_from_headers
+)
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(None, cache.get("b"))
+        self.assertTrue("a" in cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(None, cache.get("b"))
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+        time.sleep(0.02)
+        self.assertEqual(None, cache.get("a"))
+        self.assertEqual(2, cache.get("b"))
+
+    def test_delete_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        self.assertEqual(None, cache.get("a"))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+
+class CacheHelpersTest(unittest.TestCase):
+
+    def test_cache_key_strips_credentials(self):
+        self.assertEqual(
+            cache_key("https://api.tfl.gov.uk/Line/?b=2&app_key=k&a=1"),
+            cache_key("https://api.tfl.gov.uk/Line/?app_id=i&a=1&b=2")
+        )
+        self.assertEqual(
+            "https://api.tfl.gov.uk/Line/?a=1",
+            cache_key("https://api.tfl.gov.uk/Line/?app_id=i&a=1")
+        )
+
+    def test_ttl_from_cache_control(self):
+        self.assertEqual(
+            60, cache_ttl_from_headers({"Cache-Control": "public, max-age=60"}))
+        self.assertEqual(
+            0, cache_ttl_from_headers({"Cache-Control": "no-cache"}))
+
+    def test_ttl_from_expires(self):
+        self.assertEqual(120, cache_ttl_from_headers({
+            "Date": "Wed, 21 Oct 2015 07:28:00 GMT",
+            "Expires": "Wed, 21 Oct 2015 07:30:00 GMT"
+        }))
+        self.assertEqual(0, cache_ttl_from_headers({"Expires": "0"}))
+
+    def test_ttl_without_headers(self):
+        self.assertEqual(None, cache_ttl_from_headers({}))
+
+
+class Result(object):
+
+    def __init__(self, max_age=None):
+        self.recommendedMaxAgeMinutes = max_age
+
+
+class JourneyCacheTest(unittest.TestCase):
+
+    def test_key_normalisation(self):
+        cache = JourneyCache(precision=3, time_bucket=15)
+        self.assertEqual(
+            cache.key("51.50012,-0.12345", "1000077",
+                      {"mode": "tube,bus", "time": "0931", "date": "0316"}),
+            cache.key(" 51.5004, -0.1233", "1000077",
+                      {"date": "0316", "time": "09:44", "mode": "bus,Tube"}))
+        self.assertNotEqual(
+            cache.key("1000129", "1000077", {"time": "0931"}),
+            cache.key("1000129", "1000077", {"time": "0945"}))
+        self.assertNotEqual(
+            cache.key("1000129", "1000077", {}),
+            cache.key("1000077", "1000129", {}))
+
+    def test_ttl_and_stats(self):
+        cache = JourneyCache()
+        key = cache.key("1000129", "1000077", {})
+        self.assertEqual(None, cache.get(key))
+        cache.set(key, Result())
+        self.assertEqual(None, cache.get(key))
+        journey = Result(max_age=1)
+        cache.set(key, journey)
+        self.assertTrue(cache.get(key) is journey)
+        self.assertEqual({"hits": 1, "misses": 2}, cache.stats)
+        self.assertAlmostEqual(1 / 3.0, cache.hit_rate)
+
+
+class PlaceCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open("tests/testdata/journey/planner_disambiguation.json") as f:
+            self.data = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_resolve(self):
+        cache = PlaceCache()
+        cache.set("Kings Cross", "1000129")
+        self.assertEqual("1000129", cache.resolve("  kings   CROSS "))
+        self.assertEqual(None, cache.resolve("Euston"))
+        self.assertEqual(None, cache.resolve("1000077"))
+        self.assertEqual(None, cache.resolve("51.5,-0.12"))
+        self.assertEqual({"hits": 1, "misses": 1}, cache.stats)
+
+    def test_learn(self):
+        self.data["fromLocationDisambiguation"]["matchStatus"] = "identified"
+        disambiguation = tfl.JourneyDisambiguation.fromJSON(self.data)
+        cache = PlaceCache()
+        cache.learn(disambiguation, _from="Euston", to="Kings Cross")
+        self.assertEqual("1019675", cache.resolve("Euston"))
+        # Several options to choose from: left to the caller
+        self.assertFalse("Kings Cross" in cache)
+        cache.choose("Kings Cross", disambiguation.toLocationDisambiguation
+                     .disambiguationOptions[1])
+        self.assertEqual("1019931", cache.resolve("Kings Cross"))
+
+    def test_lru_and_persistence(self):
+        path = os.path.join(self.directory, "places.json")
+        cache = PlaceCache(maxsize=2, path=path)
+        cache.warm({"a": "1", "b": "2"})
+        cache.resolve("a")
+        cache.set("c", "3")
+        self.assertFalse("b" in cache)
+        cache.save()
+
+        warmed = PlaceCache(maxsize=2, path=path)
+        self.assertEqual(2, len(warmed))
+        self.assertEqual("1", warmed.resolve("a"))
+        self.assertEqual("3", warmed.resolve("c"))
@@ -0,0 +1,40 @@
+# encoding: utf-8
+
+import copy
+import json
+import unittest
+
+import tfl
+
+
+class BikePointDiffTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/testdata/bike_points.json") as f:
+            self.data = json.load(f)
+
+    def _Points(self, data):
+        return [tfl.Point.fromJSON(p) for p in data]
+
+    def test_unchanged(self):
+        diff = tfl.diff_bike_points(
+            self._Points(self.data), self._Points(self.data))
+        self.assertFalse(diff)
+
+    def test_changes(self):
+        data = copy.deepcopy(self.data)
+        removed = data.pop(0)
+        added = dict(data[0], id="BikePoints_New")
+        data.append(added)
+        nb_bikes = [p for p in data[1]["additionalProperties"]
+                    if p["key"] == "NbBikes"][0]
+        nb_bikes["value"] = str(int(nb_bikes["value"]) + 1)
+        nb_bikes["modified"] = "2018-03-16T12:00:00Z"
+
+        diff = tfl.diff_bike_points(
+            self._Points(self.data), self._Points(data))
+        self.assertEqual(["BikePoints_New"], [p.id for p in diff.added])
+        self.assertEqual([removed["id"]], [p.id for p in diff.removed])
+        self.assertEqual(
+            [(data[1]["id"], ["NbBikes"])],
+            [(p.id, keys) for (p, keys) in diff.changed])
@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+
+import tfl
+
+
+class FeedSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = tfl.FeedScheduler(max_workers=2)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def _Counter(self):
+        calls = []
+
+        def fetch():
+            calls.append(time.time())
+            return len(calls)
+
+        return (calls, fetch)
+
+    def test_refreshes(self):
+        (calls, count) = self._Counter()
+        third = threading.Event()
+
+        def fetch():
+            value = count()
+            if value == 3:
+                third.set()
+            return value
+
+        feed = self.scheduler.register(
+            "count", fetch, interval=0.02, stale_after=60)
+        self.assertEqual("none yet", self.scheduler.get("count", "none yet"))
+        self.scheduler.start()
+        self.assertTrue(third.wait(5))
+        # Waits for a refresh still running, so the calls are all counted
+        self.scheduler.stop()
+        self.assertGreaterEqual(feed.refreshes, 3)
+        self.assertEqual(len(calls), self.scheduler.get("count"))
+        self.assertFalse(feed.stale)
+
+    def test_failure_keeps_result(self):
+        results = [1]
+
+        def fetch():
+            if not results:
+                raise tfl.TflError("503: Service Unavailable")
+            return results.pop()
+
+        feed = self.scheduler.register(
+            "flaky", fetch, interval=0.02, retry_interval=0.01)
+        self.scheduler.start()
+        self.assertTrue(feed.wait(5))
+        time.sleep(0.1)
+        self.assertEqual(1, feed.get())
+        self.assertGreater(feed.failures, 0)
+        self.assertTrue(isinstance(feed.error, tfl.TflError))
+
+    def test_stale_read_revalidates(self):
+        (calls, fetch) = self._Counter()
+        feed = self.scheduler.register(
+            "slow", fetch, interval=60, stale_after=0.01, retry_interval=0)
+        self.scheduler.start()
+        self.assertTrue(feed.wait(5))
+        time.sleep(0.02)
+        # The stale result is served while a refresh is brought forward
+        self.assertEqual(1, feed.get())
+        deadline = time.time() + 5
+        while feed.refreshes < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(2, feed.get())
+
+    def test_one_refresh_at_a_time(self):
+        release = threading.Event()
+        running = []
+
+        def fetch():
+            running.append(1)
+            release.wait(5)
+            return len(running)
+
+        feed = self.scheduler.register("busy", fetch, interval=60)
+        self.scheduler.start()
+        time.sleep(0.02)
+        self.scheduler.refresh("busy")
+        time.sleep(0.02)
+        self.assertEqual(1, len(running))
+        release.set()
+        self.assertTrue(feed.wait(5))
+        deadline = time.time() + 5
+        while feed.refreshes < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(2, feed.refreshes)
+
+    def test_register_twice(self):
+        self.scheduler.register("a", lambda: 1, interval=1)
+        self.assertRaises(
+            tfl.TflError, self.scheduler.register, "a", lambda: 1, 1)
+        self.scheduler.unregister("a")
+        self.assertFalse("a" in self.scheduler)
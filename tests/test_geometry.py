@@ -0,0 +1,148 @@
+# encoding: utf-8
+
+import json
+import threading
+import unittest
+
+import tfl
+from tfl import geometry
+from tfl.spatial import distance
+
+LINE_STRINGS = [
+    "[[[-0.1,51.5],[-0.2,51.6],[-0.2,51.7]],[[-0.3,51.4],[-0.4,51.3]]]",
+    "[[[0.1,51.45],[0.1,51.55]]]",
+]
+
+
+class GeometryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.geometry = tfl.LineRouteSequence.fromJSON(
+            {"lineStrings": LINE_STRINGS}).lineStrings
+
+    def test_line_route_sequence(self):
+        with open("tests/testdata/line_route_sequence.json") as f:
+            sequence = tfl.LineRouteSequence.fromJSON(json.load(f))
+        self.assertEqual(1, len(sequence.lineStrings))
+        self.assertEqual(
+            [(51.512986, -0.088266), (51.503299, -0.11478)],
+            sequence.lineStrings[0])
+
+    def test_every_branch(self):
+        self.assertEqual(3, len(self.geometry))
+        self.assertEqual(7, self.geometry.points)
+        self.assertEqual([(51.4, -0.3), (51.3, -0.4)], self.geometry[1])
+        self.assertEqual([(51.45, 0.1), (51.55, 0.1)], self.geometry[-1])
+        self.assertEqual([0, 3, 5, 7], list(self.geometry.offsets))
+
+    def test_journey_path(self):
+        path = tfl.models.JourneyPath.fromJSON(
+            {"lineString": "[[51.53, -0.12],[51.52, -0.13]]"})
+        self.assertEqual([[(51.53, -0.12), (51.52, -0.13)]],
+                         list(path.lineString))
+        self.assertEqual(None, tfl.models.JourneyPath.fromJSON(
+            {}).lineString)
+
+    def test_bounds(self):
+        self.assertEqual((51.3, -0.4, 51.7, 0.1), self.geometry.bounds())
+        self.assertEqual(None, tfl.Geometry().bounds())
+
+    def test_lengths(self):
+        expected = [
+            distance(51.5, -0.1, 51.6, -0.2) +
+            distance(51.6, -0.2, 51.7, -0.2),
+            distance(51.4, -0.3, 51.3, -0.4),
+            distance(51.45, 0.1, 51.55, 0.1),
+        ]
+        for (length, value) in zip(expected, self.geometry.lengths()):
+            self.assertAlmostEqual(length, value, places=6)
+        self.assertAlmostEqual(sum(expected), self.geometry.length(), 6)
+        self.assertEqual(
+            [0.0], tfl.Geometry([[(51.5, -0.1)]]).lengths())
+
+    def test_lengths_without_numpy(self):
+        vectorised = self.geometry.lengths()
+        (numpy, geometry.numpy) = (geometry.numpy, None)
+        try:
+            lengths = self.geometry.lengths()
+        finally:
+            geometry.numpy = numpy
+        for (length, value) in zip(vectorised, lengths):
+            self.assertAlmostEqual(length, value, places=6)
+
+    def test_serialised_the_same_by_every_encoder(self):
+        values = [-0.00005, 1e-07, 0.0001, 0.00011, -1e-05, 5e-324, 1e+16,
+                  1.2345678901234568e+17, 1e+22, 9999999999999998.0,
+                  1000000000000000.0, 51.5, -0.0, 0.0, 123.0]
+        pairs = json.dumps([list(pair) for pair in zip(
+            values, reversed(values))], separators=(",", ":"))
+        # A journey path is written back as read, a route with [lon, lat]
+        # swapped both ways
+        line = tfl.Geometry.fromJSON(pairs)
+        route = tfl.Geometry.fromJSON(["[{0}]".format(pairs)])
+        self.assertEqual((len(values),) * 2, (line.points, route.points))
+
+        outputs = []
+        for modules in ((geometry.numpy, geometry.orjson),
+                        (geometry.numpy, None), (None, None)):
+            saved = (geometry.numpy, geometry.orjson)
+            (geometry.numpy, geometry.orjson) = modules
+            try:
+                outputs.append((line.toDict(), route.toDict()))
+            finally:
+                (geometry.numpy, geometry.orjson) = saved
+
+        self.assertEqual((pairs, ["[{0}]".format(pairs)]), outputs[0])
+        for output in outputs[1:]:
+            self.assertEqual(outputs[0], output)
+
+    def test_polyline(self):
+        line = tfl.Geometry(
+            [[(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]])
+        self.assertEqual("_p~iF~ps|U_ulLnnqC_mqNvxq`@", line.polyline())
+        self.assertEqual(
+            line, tfl.Geometry.from_polylines(line.polylines()))
+
+    def test_to_dict(self):
+        self.assertEqual(LINE_STRINGS, self.geometry.toDict())
+        self.geometry.bounds()
+        self.assertEqual(
+            [json.loads(text) for text in LINE_STRINGS],
+            [json.loads(text) for text in self.geometry.toDict()])
+        path = tfl.models.JourneyPath.fromJSON(
+            {"lineString": "[[51.53, -0.12]]"}).lineString
+        self.assertEqual("[[51.53,-0.12]]", path.toDict())
+        path.bounds()
+        self.assertEqual("[[51.53,-0.12]]", path.toDict())
+
+    def test_serialised_whether_read_or_not(self):
+        with open("tests/testdata/journey/planner_via.json") as f:
+            data = json.load(f)
+        tfl.JourneyPlanner.keep_json = True
+        try:
+            (fresh, read) = (tfl.JourneyPlanner.fromJSON(data),
+                             tfl.JourneyPlanner.fromJSON(data))
+        finally:
+            del tfl.JourneyPlanner.keep_json
+        for leg in read.journeys[0].legs:
+            leg.path.lineString.length()
+        self.assertEqual(fresh.toString(), read.toString())
+        self.assertEqual(fresh.toJSON(original=True),
+                         read.toJSON(original=True))
+        self.assertEqual(fresh, read)
+        read.journeys[0].legs[0].path.lineString = tfl.Geometry(
+            [[(51.5, -0.1)]])
+        self.assertNotEqual(fresh.toJSON(original=True),
+                            read.toJSON(original=True))
+
+    def test_parsed_by_many_threads(self):
+        geometry = tfl.Geometry.fromJSON(LINE_STRINGS)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(geometry[1]))
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([[(51.4, -0.3), (51.3, -0.4)]] * 8, results)
@@ -0,0 +1,96 @@
+# encoding: utf-8
+
+import json
+import unittest
+
+import tfl
+
+
+def _Sequence(line, stops, branches=None):
+    """
+    LineRouteSequence JSON for ``line`` through ``stops``, (stop ID, hub
+    ID) pairs, or through each list of ``branches`` in turn.
+    """
+    branches = branches or [stops]
+
+    return {
+        "lineId": line,
+        "stopPointSequences": [{
+            "lineId": line,
+            "branchId": index,
+            "nextBranchIds": [index + 1] if index + 1 < len(branches) else [],
+            "prevBranchIds": [index - 1] if index else [],
+            "stopPoint": [
+                {"id": stop, "stationId": stop, "topMostParentId": hub}
+                for (stop, hub) in branch],
+        } for (index, branch) in enumerate(branches)],
+    }
+
+
+class StationGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = tfl.StationGraph([
+            tfl.LineRouteSequence.fromJSON(_Sequence("a", [
+                ("A1", None), ("A2", None), ("A3", "HUB3"), ("A4", None)])),
+            tfl.LineRouteSequence.fromJSON(_Sequence("b", None, [
+                [("B1", None), ("B3", "HUB3")],
+                [("B4", None), ("B5", None)]])),
+            tfl.LineRouteSequence.fromJSON(_Sequence("c", [
+                ("C1", None), ("C2", None)])),
+        ])
+
+    def test_stations(self):
+        self.assertEqual(9, len(self.graph))
+        self.assertEqual("HUB3", self.graph.station("B3"))
+        self.assertEqual(set(["a", "b"]), self.graph.lines("HUB3"))
+        self.assertFalse("Z1" in self.graph)
+
+    def test_shortest_path(self):
+        (cost, path) = self.graph.shortest_path("A1", "B5")
+        self.assertEqual(
+            [("A1", "a"), ("A2", "a"), ("A3", "a"), ("B3", "b"),
+             ("B4", "b"), ("B5", "b")], path)
+        self.assertEqual(1 + 1 + 2 + 1 + 1, cost)
+        # Travels against the loaded direction too
+        self.assertEqual(cost, self.graph.cost("B5", "A1"))
+        self.assertEqual(0, self.graph.cost("A3", "B3"))
+
+    def test_reachability(self):
+        self.assertTrue(self.graph.connected("A1", "B1"))
+        self.assertFalse(self.graph.connected("A1", "C1"))
+        self.assertEqual(None, self.graph.shortest_path("A1", "C2"))
+        self.assertEqual(
+            {"A1": 0, "A2": 1, "HUB3": 2, "A4": 3},
+            self.graph.reachable("A1", max_cost=3))
+
+    def test_route_stops_joined_in_any_order(self):
+        # X2 is only in line x's ordered route until line y names its hub
+        x = tfl.LineRouteSequence.fromJSON({
+            "lineId": "x",
+            "orderedLineRoutes": [{"naptanIds": ["X1", "X2"]}]})
+        y = tfl.LineRouteSequence.fromJSON(_Sequence("y", [
+            ("Y1", None), ("X2", "HUB"), ("Y3", "HUB")]))
+        costs = []
+        for sequences in ([x, y], [y, x]):
+            graph = tfl.StationGraph(sequences)
+            self.assertEqual("HUB", graph.station("X2"))
+            self.assertEqual(set(["x", "y"]), graph.lines("HUB"))
+            self.assertEqual(3, len(graph))
+            costs.append(graph.reachable("X1"))
+        self.assertEqual(costs[0], costs[1])
+        self.assertEqual({"X1": 0, "HUB": 1, "Y1": 4}, costs[0])
+
+    def test_one_way(self):
+        graph = tfl.StationGraph(
+            [tfl.LineRouteSequence.fromJSON(_Sequence("a", [
+                ("A1", None), ("A2", None)]))], bidirectional=False)
+        self.assertTrue(graph.connected("A1", "A2"))
+        self.assertFalse(graph.connected("A2", "A1"))
+
+    def test_line_route_sequence(self):
+        with open("tests/testdata/line_route_sequence.json") as f:
+            sequence = tfl.LineRouteSequence.fromJSON(json.load(f))
+        graph = tfl.StationGraph([sequence])
+        self.assertEqual(1, graph.cost("HUBBAN", "940GZZLUWLO"))
+        self.assertEqual(1, graph.cost("1000013", "HUBWAT"))
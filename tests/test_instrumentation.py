@@ -0,0 +1,122 @@
+# encoding: utf-8
+
+import re
+import requests
+import responses
+import unittest
+
+import tfl
+from tfl.instrumentation import LatencyHistogram, PHASES, current_timing
+
+
+DEFAULT_URL = re.compile(r'https?://.*\.tfl.gov.uk/.*')
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.add(0.0001)
+        for _ in range(10):
+            histogram.add(0.5)
+        summary = histogram.summary()
+        self.assertEqual(100, summary["count"])
+        self.assertTrue(0.0001 <= summary["p50"] < 0.0002)
+        self.assertEqual(0.5, summary["p99"])
+        self.assertEqual(0.5, summary["max"])
+
+    def test_empty(self):
+        self.assertEqual(0.0, LatencyHistogram().percentile(50))
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/testdata/bike_points.json") as f:
+            self.json_data = f.read()
+        self.timings = []
+        self.instrumentation = tfl.Instrumentation(
+            hooks=[self.timings.append])
+        self.api = tfl.Api(app_id="test", app_key="test",
+                           instrumentation=self.instrumentation)
+
+    @responses.activate
+    def test_phases(self):
+        responses.add(responses.GET, DEFAULT_URL, body=self.json_data)
+
+        points = self.api.GetBikePoints()
+
+        self.assertEqual(1, len(self.timings))
+        timing = self.timings[0]
+        self.assertEqual("GetBikePoints", timing.endpoint)
+        self.assertFalse("app_key" in timing.url)
+        self.assertEqual(len(self.json_data.encode("utf-8")), timing.bytes)
+        self.assertEqual(len(points), timing.objects)
+        for phase in PHASES:
+            self.assertGreater(timing.seconds[phase], 0)
+
+        summary = self.instrumentation.summary()["GetBikePoints"]
+        self.assertEqual(1, summary["requests"])
+        self.assertEqual(len(points), summary["objects"])
+        self.assertEqual(1, summary["build"]["count"])
+
+    @responses.activate
+    def test_streamed(self):
+        responses.add(responses.GET, DEFAULT_URL, body=self.json_data)
+
+        points = list(self.api.IterBikePoints())
+
+        self.assertEqual("IterBikePoints", self.timings[0].endpoint)
+        self.assertEqual(len(points), self.timings[0].objects)
+        self.assertEqual(None, self.timings[0].bytes)
+
+    @responses.activate
+    def test_error_is_recorded(self):
+        with open("tests/testdata/bike_point_incorrect.json") as f:
+            responses.add(responses.GET, DEFAULT_URL, body=f.read(),
+                          status=404)
+
+        self.assertRaises(
+            tfl.TflError, lambda: self.api.GetBikePoint("Invalid"))
+        self.assertEqual("GetBikePoint", self.timings[0].endpoint)
+        self.assertEqual(0, self.timings[0].objects)
+        self.assertTrue(isinstance(self.timings[0].error, tfl.TflError))
+
+    @responses.activate
+    def test_failed_request_is_recorded(self):
+        responses.add(responses.GET, DEFAULT_URL,
+                      body=requests.ConnectionError("refused"))
+
+        self.assertRaises(
+            requests.ConnectionError, lambda: self.api.GetBikePoints())
+        self.assertRaises(
+            requests.ConnectionError, lambda: list(self.api.IterBikePoints()))
+        self.assertEqual(["GetBikePoints", "IterBikePoints"],
+                         [timing.endpoint for timing in self.timings])
+        for timing in self.timings:
+            self.assertTrue(
+                isinstance(timing.error, requests.ConnectionError))
+        self.assertEqual(None, current_timing())
+        summary = self.instrumentation.summary()["GetBikePoints"]
+        self.assertEqual(1, summary["requests"])
+        self.assertEqual(1, summary["errors"])
+
+    def test_named_by_caller(self):
+        class Subclass(tfl.Api):
+
+            def GetBikePoints(self):
+                return super(Subclass, self).GetBikePoints()
+
+        with responses.RequestsMock() as mock:
+            mock.add(responses.GET, DEFAULT_URL, body=self.json_data)
+            Subclass(app_id="test", app_key="test",
+                     instrumentation=self.instrumentation).GetBikePoints()
+        self.assertEqual("GetBikePoints", self.timings[0].endpoint)
+
+    @responses.activate
+    def test_disabled(self):
+        responses.add(responses.GET, DEFAULT_URL, body=self.json_data)
+
+        tfl.Api(app_id="test", app_key="test").GetBikePoints()
+        self.assertEqual({}, self.instrumentation.summary())
@@ -1,6 +1,6 @@
 # encoding: utf-8
-from __future__ import unicode_literals
 
+import json
 import os
 import re
 import responses
@@ -132,3 +132,150 @@ class TestTflApi(unittest.TestCase):
         self.assertEqual(journey.journeyVector.to, "1000077")
         self.assertEqual(journey.journeyVector._from, "1000129")
         self.assertEqual(journey.journeyVector.via, "1000248")
+
+    def test_journey_planner_lazy(self):
+        with open("tests/testdata/journey/planner_via.json") as f:
+            data = json.load(f)
+
+        eager = tfl.JourneyPlanner.fromJSON(data)
+        lazy = tfl.JourneyPlanner.fromJSON(data, lazy=True)
+
+        journey = lazy.journeys[0]
+        self.assertEqual(eager.journeys[0].duration, journey.duration)
+        raw_legs = tfl.models.Journey.legs._slot.__get__(journey)
+        self.assertTrue(isinstance(raw_legs, tfl.models._Lazy))
+
+        legs = journey.legs
+        self.assertTrue(isinstance(legs[0], tfl.models.JourneyLeg))
+        self.assertIs(legs, journey.legs)
+        self.assertEqual(eager, lazy)
+
+    @responses.activate
+    def test_journey_planner_api_lazy(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+
+        responses.add(
+            responses.GET, DEFAULT_URL, body=json_data,
+            match_querystring=True
+        )
+
+        api = tfl.Api(app_id="test", app_key="test", lazy=True)
+        journey = api.SearchJourneyPlanner(_from="1000129", to="1000077")
+        self.assertTrue(isinstance(journey.journeys[0], tfl.models.Journey))
+        self.assertTrue(isinstance(journey.lines[0], tfl.models.Line))
+
+    def test_disruption_dedup(self):
+        with open("tests/testdata/journey/planner_via.json") as f:
+            data = json.load(f)
+
+        planner = tfl.JourneyPlanner.fromJSON(data)
+        disruptions = [
+            d for journey in planner.journeys for leg in journey.legs
+            for d in leg.disruptions]
+        copies = [
+            d for journey in tfl.JourneyPlanner.fromJSON(data).journeys
+            for leg in journey.legs for d in leg.disruptions]
+        self.assertGreater(len(disruptions), 0)
+
+        copies[-1].summary = "Changed"
+        self.assertNotEqual(disruptions[-1], copies[-1])
+
+        unique = set(disruptions)
+        self.assertEqual(unique, set(disruptions + copies[:-1]))
+        for disruption in copies[:-1]:
+            self.assertTrue(disruption in unique)
+            self.assertEqual(hash(disruptions[0]), hash(copies[0]))
+        self.assertFalse(copies[-1] in unique)
+
+    @responses.activate
+    def test_journey_planner_batch(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+        failed = []
+
+        def callback(request):
+            _from = request.path_url.split("/")[3]
+            if _from == "flaky" and not failed:
+                failed.append(_from)
+                return (500, {}, json.dumps({
+                    "exceptionType": "ApiException", "httpStatusCode": 500,
+                    "message": "Internal Server Error"}))
+            if _from == "broken":
+                return (500, {}, json.dumps({
+                    "exceptionType": "ApiException", "httpStatusCode": 500,
+                    "message": "Internal Server Error"}))
+            return (200, {}, json_data)
+
+        responses.add_callback(responses.GET, DEFAULT_URL, callback=callback)
+
+        queries = [("1000129", str(i)) for i in range(20)]
+        queries.append({"_from": "flaky", "to": "1000077"})
+        queries.append(("broken", "1000077"))
+        progress = []
+        results = dict(self.api.IterJourneyPlannerBatch(
+            queries, max_workers=4, attempts=2,
+            progress=lambda done, total: progress.append((done, total))))
+
+        self.assertEqual(set(range(22)), set(results))
+        for index in range(21):
+            self.assertTrue(isinstance(results[index], tfl.JourneyPlanner))
+        self.assertTrue(isinstance(results[21], tfl.TflError))
+        self.assertEqual(["flaky"], failed)
+        self.assertEqual([(i, 22) for i in range(1, 23)], progress)
+
+    @responses.activate
+    def test_journey_planner_batch_generator(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+        responses.add(responses.GET, DEFAULT_URL, body=json_data)
+
+        queries = (("1000129", str(i)) for i in range(10))
+        results = list(self.api.IterJourneyPlannerBatch(queries))
+
+        self.assertEqual(list(range(10)), sorted(i for (i, _) in results))
+
+    @responses.activate
+    def test_journey_planner_batch_malformed(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+        responses.add(responses.GET, DEFAULT_URL, body=json_data)
+
+        for query in ("1000129", ("1000129",), {"_from": "1000129",
+                                                 "too": "1000077"}):
+            self.assertRaises(tfl.TflError, lambda: list(
+                self.api.IterJourneyPlannerBatch(
+                    [("1000129", "1000077"), query])))
+
+    @responses.activate
+    def test_journey_cache(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+        responses.add(responses.GET, DEFAULT_URL, body=json_data)
+
+        api = tfl.Api(app_id="test", app_key="test", journey_cache=True)
+        first = api.SearchJourneyPlanner(
+            _from="51.50123,-0.12345", to="1000077", time="0931",
+            mode=["tube", "bus"])
+        second = api.SearchJourneyPlanner(
+            _from="51.50124,-0.12346", to="1000077", time="0933",
+            mode="bus,tube")
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertTrue(first is second)
+        self.assertEqual(0.5, api.journey_cache.hit_rate)
+
+    @responses.activate
+    def test_place_cache(self):
+        with open("tests/testdata/journey/planner_default.json") as f:
+            json_data = f.read()
+        responses.add(responses.GET, DEFAULT_URL, body=json_data)
+
+        api = tfl.Api(app_id="test", app_key="test", place_cache=True)
+        api.place_cache.warm({"euston": "1000077", "kings cross": "1000129"})
+        api.SearchJourneyPlanner(
+            _from="Euston", to="Kings Cross", via="Angel")
+
+        self.assertTrue(responses.calls[0].request.path_url.startswith(
+            "/Journey/JourneyResults/1000077/to/1000129?"))
+        self.assertTrue("via=Angel" in responses.calls[0].request.path_url)
@@ -0,0 +1,99 @@
+# encoding: utf-8
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import unittest
+
+import tfl
+from tfl.persistence import load_snapshot, refresh_snapshot, save_snapshot
+
+
+class SnapshotPersistenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "points.snapshot")
+        with open("tests/testdata/bike_points.json") as f:
+            self.points = [tfl.Point.fromJSON(p) for p in json.load(f)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        save_snapshot(self.path, self.points)
+        with load_snapshot(self.path) as snapshot:
+            self.assertEqual(len(self.points), len(snapshot))
+            self.assertEqual(self.points, list(snapshot))
+            self.assertEqual(self.points[-1], snapshot[-1])
+            self.assertEqual(self.points[1:3], snapshot[1:3])
+            self.assertIs(snapshot[0], snapshot[0])
+            with self.assertRaises(IndexError):
+                snapshot[len(self.points)]
+        point = snapshot[0]
+        self.assertEqual(self.points[0].toDict(), point.toDict())
+
+    def test_nested_models(self):
+        with open("tests/testdata/line_route_sequence.json") as f:
+            sequence = tfl.LineRouteSequence.fromJSON(json.load(f))
+        save_snapshot(self.path, [sequence])
+        with load_snapshot(self.path) as snapshot:
+            loaded = snapshot[0]
+        self.assertIsInstance(loaded.stopPointSequences[0].stopPoint[0],
+                              tfl.models.Station)
+        self.assertEqual(sequence.lineStrings, loaded.lineStrings)
+        self.assertEqual(sequence.toDict(), loaded.toDict())
+
+    def test_not_a_snapshot(self):
+        with open(self.path, "wb") as f:
+            f.write(b"[]")
+        self.assertRaises(tfl.TflError, load_snapshot, self.path)
+
+    def test_truncated(self):
+        save_snapshot(self.path, self.points)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for length in (len(tfl.persistence.MAGIC) + 2, len(data) // 2):
+            with open(self.path, "wb") as f:
+                f.write(data[:length])
+            self.assertRaises(tfl.TflError, load_snapshot, self.path)
+
+    def test_corrupt_record(self):
+        save_snapshot(self.path, self.points[:2])
+        with open(self.path, "rb") as f:
+            data = f.read()
+        with load_snapshot(self.path) as snapshot:
+            (end,) = struct.unpack_from(
+                "<Q", data, snapshot._offsets + struct.calcsize("<Q"))
+            start = snapshot._records + end
+        with open(self.path, "wb") as f:
+            f.write(data[:start] + b"\x00" + data[start + 1:])
+        with load_snapshot(self.path) as snapshot:
+            self.assertEqual(self.points[0], snapshot[0])
+            self.assertRaises(tfl.TflError, lambda: snapshot[1])
+
+    def test_only_models_are_loaded(self):
+        save_snapshot(self.path, self.points[:1])
+        with open(self.path, "rb") as f:
+            data = f.read()
+        name = "tfl.models:Point".encode("utf-8")
+        with open(self.path, "wb") as f:
+            f.write(data.replace(name, "os.path:isdir_".encode("utf-8")))
+        self.assertRaises(tfl.TflError, load_snapshot, self.path)
+
+    def test_refresh(self):
+        done = threading.Event()
+        results = []
+
+        def on_refresh(models, error):
+            results.append((models, error))
+            done.set()
+
+        refresh_snapshot(self.path, lambda: self.points[:2], on_refresh)
+        self.assertTrue(done.wait(5))
+        self.assertEqual([(self.points[:2], None)], results)
+        with load_snapshot(self.path) as snapshot:
+            self.assertEqual(self.points[:2], list(snapshot))
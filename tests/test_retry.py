@@ -0,0 +1,73 @@
+import time
+import unittest
+from email.utils import formatdate
+
+from tfl.retry import (
+    RetryPolicy, TokenBucket, rate_limit_reset_from_headers,
+    retry_after_from_headers
+)
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def test_backoff(self):
+        policy = RetryPolicy(max_attempts=4, backoff=1, max_backoff=3,
+                             jitter=False)
+        self.assertEqual(
+            [1, 2, 3, None], [policy.delay(n) for n in range(1, 5)])
+
+    def test_jitter(self):
+        policy = RetryPolicy(max_attempts=10, backoff=1)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.delay(3) <= 4)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+        self.assertEqual(7, policy.delay(1, {"Retry-After": "7"}))
+        self.assertEqual(None, policy.delay(1, {"Retry-After": "60"}))
+        self.assertEqual(
+            5, policy.delay(1, {"X-RateLimit-Remaining": "0",
+                                "X-RateLimit-Reset": "5"}))
+
+    def test_retryable(self):
+        policy = RetryPolicy(statuses=[503])
+        self.assertTrue(policy.retryable(503))
+        self.assertFalse(policy.retryable(429))
+
+
+class RetryHeadersTest(unittest.TestCase):
+
+    def test_retry_after(self):
+        self.assertEqual(None, retry_after_from_headers({}))
+        self.assertEqual(3, retry_after_from_headers({"Retry-After": "3"}))
+        wait = retry_after_from_headers(
+            {"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+        self.assertTrue(25 < wait <= 30)
+
+    def test_rate_limit_reset(self):
+        self.assertEqual(None, rate_limit_reset_from_headers(
+            {"RateLimit-Remaining": "3", "RateLimit-Reset": "5"}))
+        self.assertEqual(5, rate_limit_reset_from_headers(
+            {"RateLimit-Remaining": "0", "RateLimit-Reset": "5"}))
+        wait = rate_limit_reset_from_headers(
+            {"X-RateLimit-Remaining": "0",
+             "X-RateLimit-Reset": str(int(time.time()) + 30)})
+        self.assertTrue(25 < wait <= 30)
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertAlmostEqual(0.1, bucket.reserve(), places=2)
+        self.assertAlmostEqual(0.2, bucket.reserve(), places=2)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=10)
+        bucket.pause(5)
+        self.assertTrue(4.9 < bucket.reserve() <= 5)
+
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, TokenBucket, 0)
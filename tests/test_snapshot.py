@@ -0,0 +1,92 @@
+# encoding: utf-8
+
+import json
+import os
+import re
+import unittest
+
+import responses
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import tfl
+from tfl.spatial import distance
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class BikePointSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/testdata/bike_points.json") as f:
+            self.data = json.load(f)
+        self.snapshot = tfl.BikePointSnapshot.fromJSON(self.data)
+
+    def _Count(self, point, key):
+        return int(
+            [p["value"] for p in point["additionalProperties"]
+             if p["key"] == key][0])
+
+    def test_columns(self):
+        self.assertEqual(len(self.data), len(self.snapshot))
+        self.assertEqual(
+            [p["id"] for p in self.data], list(self.snapshot.ids))
+        self.assertEqual(
+            sum(self._Count(p, "NbBikes") for p in self.data),
+            self.snapshot.bikes.sum())
+        self.assertEqual(
+            sum(self._Count(p, "NbDocks") for p in self.data),
+            self.snapshot.docks.sum())
+
+        point = tfl.Point.fromJSON(self.data[0])
+        row = self.snapshot.position(point.id)
+        self.assertEqual(point.lat, self.snapshot.lat[row])
+        self.assertEqual(
+            max(p.date_in_seconds for p in point.additionalProperties
+                if p.key == "NbBikes"),
+            self.snapshot.modified[row])
+
+    def test_mask(self):
+        empty = self.snapshot[self.snapshot.bikes == 0]
+        self.assertEqual(
+            sorted(p["id"] for p in self.data
+                   if self._Count(p, "NbBikes") == 0),
+            sorted(empty.ids))
+
+    def test_row(self):
+        point = tfl.Point.fromJSON(self.data[-1])
+        row = self.snapshot[len(self.data) - 1]
+        self.assertEqual(row, self.snapshot[-1])
+        self.assertEqual(row, self.snapshot[numpy.int64(-1)])
+        self.assertEqual(point.id, row["id"])
+        self.assertEqual(point.lat, row["lat"])
+        self.assertEqual(
+            self._Count(self.data[-1], "NbBikes"), row["bikes"])
+        self.assertTrue(isinstance(row["bikes"], int))
+        self.assertRaises(IndexError, lambda: self.snapshot[len(self.data)])
+        self.assertRaises(
+            IndexError, lambda: self.snapshot[-len(self.data) - 1])
+        self.assertEqual(2, len(self.snapshot[:2]))
+
+    def test_nearest(self):
+        nearest = self.snapshot.nearest(
+            51.5074, -0.1278, k=3, mask=self.snapshot.bikes > 0)
+        expected = sorted(
+            (distance(51.5074, -0.1278, p["lat"], p["lon"]), p["id"])
+            for p in self.data if self._Count(p, "NbBikes") > 0)
+        self.assertEqual([i for (_, i) in expected[:3]], list(nearest.ids))
+
+    @responses.activate
+    def test_api_snapshot(self):
+        responses.add(
+            responses.GET, re.compile(r'https?://.*\.tfl.gov.uk/.*'),
+            body=json.dumps(self.data), match_querystring=True
+        )
+        api = tfl.Api(app_id=os.environ.get("APP_ID"),
+                      app_key=os.environ.get("APP_KEY"))
+
+        snapshot = api.GetBikePointsSnapshot()
+        self.assertEqual(list(self.snapshot.ids), list(snapshot.ids))
+        self.assertEqual(list(self.snapshot.bikes), list(snapshot.bikes))
@@ -0,0 +1,67 @@
+# encoding: utf-8
+
+import json
+import time
+import unittest
+
+import tfl
+from tfl.spatial import distance
+
+
+class BikePointIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/testdata/bike_points.json") as f:
+            self.points = [tfl.Point.fromJSON(p) for p in json.load(f)]
+        self.index = tfl.BikePointIndex(self.points)
+
+    def _Closest(self, lat, lon, points=None):
+        return sorted(
+            (distance(lat, lon, p.lat, p.lon), p.id)
+            for p in (points or self.points))
+
+    def test_nearest(self):
+        for (lat, lon) in [(51.5074, -0.1278), (51.53, -0.2), (51.6, 0.1)]:
+            nearest = self.index.nearest(lat, lon, k=5)
+            self.assertEqual(
+                [i for (_, i) in self._Closest(lat, lon)[:5]],
+                [p.id for (_, p) in nearest])
+
+    def test_nearest_far_outside(self):
+        start = time.time()
+        nearest = self.index.nearest(0.0, 0.0, k=3)
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(
+            [i for (_, i) in self._Closest(0.0, 0.0)[:3]],
+            [p.id for (_, p) in nearest])
+        self.assertEqual([], self.index.nearest(
+            0.0, 0.0, predicate=lambda point: False))
+
+    def test_nearest_predicate(self):
+        def has_bikes(point):
+            return any(
+                p.key == "NbBikes" and int(p.value) > 0
+                for p in point.additionalProperties)
+
+        nearest = self.index.nearest(51.5074, -0.1278, k=3,
+                                     predicate=has_bikes)
+        expected = self._Closest(
+            51.5074, -0.1278, [p for p in self.points if has_bikes(p)])
+        self.assertEqual(
+            [i for (_, i) in expected[:3]], [p.id for (_, p) in nearest])
+
+    def test_within(self):
+        within = self.index.within(51.5074, -0.1278, 800)
+        expected = [
+            i for (d, i) in self._Closest(51.5074, -0.1278) if d <= 800]
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(expected, [p.id for (_, p) in within])
+
+    def test_refresh(self):
+        moved = tfl.Point(id=self.points[0].id, lat=51.0, lon=-1.0)
+        self.index.refresh([moved] + self.points[2:])
+
+        self.assertEqual(len(self.points) - 1, len(self.index))
+        self.assertFalse(self.points[1].id in self.index)
+        self.assertIs(moved, self.index.get(moved.id))
+        self.assertIs(moved, self.index.nearest(51.0, -1.0)[0][1])
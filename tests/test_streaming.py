@@ -0,0 +1,79 @@
+import asyncio
+import json
+import unittest
+
+import tfl
+from tfl.streaming import aiter_json_array, iter_json_array
+
+
+def _Chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class IterJSONArrayTest(unittest.TestCase):
+
+    def test_top_level_array(self):
+        with open("tests/testdata/accident_correct.json") as f:
+            text = f.read()
+
+        for size in (1, 7, 4096):
+            items = list(iter_json_array(_Chunks(text, size)))
+            self.assertEqual(json.loads(text), items)
+
+    def test_nested_array(self):
+        with open("tests/testdata/cabwise_extra_options.json") as f:
+            text = f.read()
+
+        items = list(iter_json_array(
+            _Chunks(text, 13), path=("Operators", "OperatorList")))
+        self.assertEqual(
+            json.loads(text)["Operators"]["OperatorList"], items)
+
+    def test_scalars_and_empty(self):
+        self.assertEqual(
+            [12345, "aé", None, [1, 2]],
+            list(iter_json_array(_Chunks('[12345, "aé", null, [1,2]]', 2)))
+        )
+        self.assertEqual([], list(iter_json_array(_Chunks(' [ ] ', 1))))
+
+    def test_numbers_split_between_chunks(self):
+        text = '[-0.5, 1e5, 12.25E-2, -7, 0, {"a": -1.5e+3}]'
+        for size in range(1, len(text)):
+            self.assertEqual(
+                json.loads(text), list(iter_json_array(_Chunks(text, size))))
+        self.assertEqual([1e5], list(iter_json_array(["[1", "e", "5]"])))
+        self.assertEqual([-0.5], list(iter_json_array(["[-", "0.", "5]"])))
+
+    def test_async_chunks(self):
+        with open("tests/testdata/cabwise_extra_options.json") as f:
+            text = f.read()
+
+        async def chunks(size):
+            for chunk in _Chunks(text, size):
+                yield chunk
+
+        async def run(size):
+            return [item async for item in aiter_json_array(
+                chunks(size), path=("Operators", "OperatorList"))]
+
+        for size in (1, 13, 4096):
+            self.assertEqual(json.loads(text)["Operators"]["OperatorList"],
+                             asyncio.run(run(size)))
+
+    def test_unexpected_document(self):
+        def check(value):
+            raise tfl.TflError(value["message"])
+
+        chunks = _Chunks('{"message": "Not found"}', 3)
+        self.assertRaises(
+            tfl.TflError, lambda: list(iter_json_array(chunks, check=check)))
+        chunks = _Chunks('{"Operators": {}}', 3)
+        self.assertRaises(
+            ValueError,
+            lambda: list(iter_json_array(
+                chunks, path=("Operators", "OperatorList"))))
+
+    def test_truncated_document(self):
+        chunks = _Chunks('[{"a": 1}, {"b": ', 4)
+        self.assertRaises(ValueError, lambda: list(iter_json_array(chunks)))
@@ -1,7 +1,5 @@
 #!/usr/bin/env python
 
-from __future__ import absolute_import
-
 __author__ = "Tom Ravenscroft"
 __description__ = "A Python Wrapper around the TfL API"
 
@@ -20,7 +18,19 @@ from .models import (
     Line,
     LineRouteSequence,
     LineStatusSeverity,
+    epoch_seconds,
 )
 
 from .api import Api
+from .async_api import AsyncApi
+from .cache import JourneyCache, LRUCache, PlaceCache
+from .diff import BikePointDiff, diff_bike_points
+from .feeds import Feed, FeedScheduler
+from .geometry import Geometry
+from .graph import StationGraph
+from .instrumentation import Instrumentation, RequestTiming
+from .persistence import load_snapshot, refresh_snapshot, save_snapshot
+from .snapshot import BikePointSnapshot
+from .retry import RetryPolicy, TokenBucket
+from .spatial import BikePointIndex
 from .exceptions import TflError
@@ -1,6 +1,13 @@
-
 # -*- coding: utf-8 -*-
+import inspect
+import itertools
+import threading
+import time
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 try:
     from urllib.parse import urlparse, urlunparse, urlencode
 except ImportError:
@@ -20,18 +27,138 @@ from tfl import (
     LineStatusSeverity
 )
 
+from tfl.cache import (
+    DEFAULT_CACHE_TTLS, JourneyCache, LRUCache, PlaceCache, cache_key,
+    cache_ttl_from_headers
+)
 from tfl.exceptions import TflError
+from tfl.instrumentation import current_timing, finish_timing, start_timing
+from tfl.retry import (
+    RetryPolicy, rate_limit_reset_from_headers, retry_after_from_headers
+)
+from tfl.snapshot import BikePointSnapshot
+from tfl.streaming import iter_json_array
 from tfl.utils import validate_year, validate_input
 
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Keep batched request URLs, credentials included, under this many characters
+MAX_URL_LENGTH = 2000
+
+# Failures of one chunk of a batch that are reported against its IDs
+BATCH_ERRORS = (TflError, ValueError, requests.RequestException)
+
+
 class Api(object):
     """
     A python interface into the TFL api
     """
-    def __init__(self, app_id=None, app_key=None, timeout=None):
+    def __init__(self, app_id=None, app_key=None, timeout=None,
+                 pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=None, cache=None, cache_ttls=None,
+                 default_cache_ttl=None, conditional_get=False,
+                 validator_cache_size=64, lazy=False, retry=None,
+                 rate_limiter=None, coalesce=True, instrumentation=None,
+                 journey_cache=None, place_cache=None):
+        """
+        :param pool_connections: number of per-host connection pools to
+            keep around.
+        :param pool_maxsize: maximum number of connections kept open to a
+            single host.
+        :param pool_block: block when every connection to a host is in use,
+            instead of opening a throwaway one.
+        :param keep_alive: number of seconds a pooled session may live
+            before new requests move to a fresh one. ``None`` keeps it
+            until ``close()``.
+        :param cache: a response cache, ``True`` for an in-memory LRUCache,
+            or ``None`` to disable caching.
+        :param cache_ttls: seconds to cache responses for, keyed on the
+            endpoint path relative to ``base_url`` (longest prefix wins).
+            Merged over DEFAULT_CACHE_TTLS.
+        :param default_cache_ttl: seconds to cache any other endpoint for.
+        :param conditional_get: remember the ETag/Last-Modified validators
+            of the last ``validator_cache_size`` URLs and revalidate with
+            If-None-Match/If-Modified-Since. A 304 returns the previously
+            parsed models in a new list; the savings are tallied in
+            revalidation_stats.
+        :param lazy: build nested journey, line and bike point attributes
+            on first access rather than up front.
+        :param retry: a RetryPolicy for throttled, failed and transient
+            error responses, ``True`` for the default policy, or ``None``
+            to make a single attempt.
+        :param rate_limiter: a TokenBucket every request waits on. Pass
+            the same bucket to every Api sharing an app key. A Retry-After
+            or exhausted rate limit window in a response pauses it.
+        :param coalesce: share one request between callers asking for the
+            same URL while it is in flight, handing each its own list of
+            the same parsed models. Counted in coalesce_stats.
+        :param instrumentation: an Instrumentation timing the URL, network,
+            decode and build phases of every call, or ``None``.
+        :param journey_cache: a JourneyCache of SearchJourneyPlanner
+            results keyed on the normalised query, ``True`` for a default
+            one, or ``None``.
+        :param place_cache: a PlaceCache resolving free-text journey
+            planner places before searching, ``True`` for an in-memory
+            one, or ``None``.
+
+        Cache-Control/Expires response headers, and the journey planner's
+        recommendedMaxAgeMinutes, take precedence over the configured TTLs.
+
+        Results reused from the cache, a 304 or a coalesced request come in
+        a list of their own, but the models in it are shared with every
+        other caller given them and should be treated as read-only.
+        """
         self.credentials(app_id, app_key)
         self.base_url = "https://api.tfl.gov.uk/"
         self._timeout = timeout
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._session = None
+        self._session_started = None
+        self._session_lock = threading.Lock()
+        self.cache = LRUCache() if cache is True else cache
+        self.cache_ttls = dict(DEFAULT_CACHE_TTLS)
+        self.cache_ttls.update(cache_ttls or {})
+        self.default_cache_ttl = default_cache_ttl
+        self._validators = None
+        if conditional_get:
+            self._validators = LRUCache(maxsize=validator_cache_size)
+        self.revalidation_stats = {
+            "not_modified": 0,
+            "bytes_saved": 0,
+            "parse_seconds_saved": 0.0
+        }
+        self._stats_lock = threading.Lock()
+        self.lazy = lazy
+        self.retry = RetryPolicy() if retry is True else retry
+        self.rate_limiter = rate_limiter
+        self.coalesce = coalesce
+        self.coalesce_stats = {"requests": 0, "coalesced": 0}
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self.instrumentation = instrumentation
+        self.journey_cache = (
+            JourneyCache() if journey_cache is True else journey_cache)
+        self.place_cache = PlaceCache() if place_cache is True else place_cache
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close every pooled connection. The next request opens a new pool.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._session_started = None
 
     def credentials(self, app_id, app_key):
         if not all([app_id, app_key]):
@@ -42,53 +169,462 @@ class Api(object):
     def GetAccidentStats(self, year):
         url = self.base_url + "AccidentStats/{0}/"
         year = validate_year(str(year))
-        response = self._Request(url.format(year), http_method="GET")
-        data = self._CheckResponse(response.json())
+        response = self._Request(
+            url.format(year), http_method="GET", endpoint="GetAccidentStats")
+
+        return self._Parse(response, self._AccidentsFromJSON)
+
+    def IterAccidentStats(self, year):
+        url = self.base_url + "AccidentStats/{0}/"
+        year = validate_year(str(year))
+        response = self._Stream(
+            url.format(year), endpoint="IterAccidentStats")
 
-        return [Accident.fromJSON(x) for x in data]
+        return self._IterParse(response, Accident.fromJSON)
 
     def GetAirQuality(self):
         url = self.base_url + "AirQuality/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json().get('currentForecast'))
+        response = self._Request(
+            url, http_method="GET", endpoint="GetAirQuality")
 
-        return [AirQuality.fromJSON(x) for x in data]
+        return self._Parse(response, self._AirQualityFromJSON)
 
     def GetBikePoints(self):
         url = self.base_url + "BikePoint/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
+        response = self._Request(
+            url, http_method="GET", endpoint="GetBikePoints")
+
+        return self._Parse(response, self._PointsFromJSON)
+
+    def IterBikePoints(self):
+        url = self.base_url + "BikePoint/"
+        response = self._Stream(url, endpoint="IterBikePoints")
+
+        return self._IterParse(response, Point.fromJSON)
 
-        return [Point.fromJSON(b) for b in data]
+    def GetBikePointsSnapshot(self):
+        """
+        All bike points as a columnar BikePointSnapshot (requires numpy),
+        decoded from the streamed response without building models.
+        """
+        url = self.base_url + "BikePoint/"
+        response = self._Stream(url, endpoint="GetBikePointsSnapshot")
+
+        return BikePointSnapshot.fromJSON(
+            self._IterParse(response, lambda point: point))
 
     def GetBikePoint(self, point):
         url = self.base_url + "BikePoint/{0}"
-        response = self._Request(url.format(point), http_method="GET")
-        data = self._CheckResponse(response.json())
+        response = self._Request(
+            url.format(point), http_method="GET", endpoint="GetBikePoint")
+
+        return self._Parse(response, self._PointFromJSON)
+
+    def GetBikePointsBatch(self, points):
+        """
+        Fetch any number of bike points by ID, concurrently over the pooled
+        connections. Returns a list in the order of ``points`` holding a
+        Point, or the TflError raised for that ID.
+        """
+        points = validate_input(points, list, "points")
 
-        return Point.fromJSON(data)
+        return self._Batch(points, [[p] for p in _Unique(points)],
+                           self._BikePointsChunk)
 
     def GetJourneyModes(self):
         url = self.base_url + "Journey/Meta/Modes/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
+        response = self._Request(
+            url, http_method="GET", endpoint="GetJourneyModes")
 
-        return [JourneyMode.fromJSON(j) for j in data]
+        return self._Parse(response, self._JourneyModesFromJSON)
 
     def SearchBikePoints(self, query):
         url = self.base_url + "BikePoint/Search/"
         extra_params = {"query": query}
         response = self._Request(
-            url, extra_params=extra_params, http_method="GET")
-        data = self._CheckResponse(response.json())
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="SearchBikePoints")
 
-        return [Point.fromJSON(b) for b in data]
+        return self._Parse(response, self._PointsFromJSON)
 
     def SearchCabwise(
             self, lat, lon, optype=None, wc=None, radius=None,
             name=None, maxResults=None, legacy_format=True,
             twentyfour_seven=True):
         url = self.base_url + "Cabwise/Search"
+        extra_params = self._CabwiseParams(
+            lat, lon, radius=radius, maxResults=maxResults,
+            twentyfour_seven=twentyfour_seven)
+        response = self._Request(
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="SearchCabwise")
+
+        return self._Parse(response, self._CabwiseFromJSON)
+
+    def IterCabwise(
+            self, lat, lon, optype=None, wc=None, radius=None,
+            name=None, maxResults=None, legacy_format=True,
+            twentyfour_seven=True):
+        url = self.base_url + "Cabwise/Search"
+        extra_params = self._CabwiseParams(
+            lat, lon, radius=radius, maxResults=maxResults,
+            twentyfour_seven=twentyfour_seven)
+        response = self._Stream(
+            url, extra_params=extra_params, endpoint="IterCabwise")
+
+        return self._IterParse(
+            response, Cabwise.fromJSON, path=("Operators", "OperatorList"))
+
+    def SearchJourneyPlanner(
+            self, _from, to, via=None, nationalSearch=False, date=None,
+            time=None, timels=None, journeyPreference=None, mode=None,
+            accessibilityPreference=None, fromName=None, toName=None,
+            viaName=None, maxTransferMinutes=None, maxWalkingMinutes=None,
+            walkingSpeed=None, cyclePreference=None, adjustment=None,
+            bikeProficiency=None, alternativeCycle=None,
+            alternativeWalking=None, useMultiModalCall=None,
+            walkingOptimsation=False, taxiOnlyTrip=False):
+        url = self.base_url + "Journey/JourneyResults/{0}/to/{1}"
+        extra_params = self._JourneyPlannerParams(
+            via=via, nationalSearch=nationalSearch, date=date, time=time,
+            timels=timels, journeyPreference=journeyPreference, mode=mode,
+            accessibilityPreference=accessibilityPreference,
+            fromName=fromName, toName=toName, viaName=viaName,
+            maxTransferMinutes=maxTransferMinutes,
+            maxWalkingMinutes=maxWalkingMinutes, walkingSpeed=walkingSpeed,
+            cyclePreference=cyclePreference, adjustment=adjustment,
+            bikeProficiency=bikeProficiency,
+            alternativeCycle=alternativeCycle,
+            alternativeWalking=alternativeWalking,
+            useMultiModalCall=useMultiModalCall,
+            walkingOptimsation=walkingOptimsation,
+            taxiOnlyTrip=taxiOnlyTrip)
+
+        places = (validate_input(_from, str, "_from"),
+                  validate_input(to, str, "to"), extra_params.get("via"))
+        (_from, to, extra_params) = self._ResolvePlaces(places, extra_params)
+        (key, result) = self._CachedJourney(_from, to, extra_params)
+        if result is not None:
+            return result
+
+        response = self._Request(
+            url.format(_from, to), extra_params=extra_params,
+            http_method="GET", endpoint="SearchJourneyPlanner")
+        result = self._Parse(response, self._JourneyPlannerFromJSON)
+        self._LearnPlaces(result, places)
+
+        max_age = result.recommendedMaxAgeMinutes
+        if (max_age and not response.from_cache and
+                cache_ttl_from_headers(response.headers) is None):
+            self._CacheStore(response, max_age * 60)
+        if key is not None:
+            self.journey_cache.set(key, result)
+
+        return result
+
+    def IterJourneyPlannerBatch(self, queries, max_workers=None, attempts=1,
+                                progress=None):
+        """
+        Plan every journey in ``queries`` concurrently, on ``max_workers``
+        threads (default: the connection pool size), yielding
+        ``(index, result)`` pairs as they complete. ``result`` is a
+        JourneyPlanner, a JourneyDisambiguation, or the TflError of a query
+        that failed ``attempts`` times, retried with jittered backoff.
+
+        Each query is a ``(from, to)`` pair or a dict of
+        SearchJourneyPlanner arguments. ``queries`` may be a generator; only
+        a couple of queries per worker are taken from it ahead of time.
+        ``progress(done, total)`` is called after each result, with
+        ``total`` None when ``queries`` has no length. A query of any other
+        shape, or with arguments SearchJourneyPlanner does not take, raises
+        a TflError when it is reached.
+        """
+        total = len(queries) if hasattr(queries, "__len__") else None
+        queries = _JourneyQueries(queries, self.SearchJourneyPlanner)
+        workers = max_workers or self._pool_maxsize
+        policy = RetryPolicy(max_attempts=attempts)
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set(
+                executor.submit(self._PlanJourney, index, query, policy)
+                for (index, query) in itertools.islice(queries, 2 * workers))
+            try:
+                while pending:
+                    (finished, pending) = futures.wait(
+                        pending, return_when=futures.FIRST_COMPLETED)
+                    for future in finished:
+                        for (index, query) in itertools.islice(queries, 1):
+                            pending.add(executor.submit(
+                                self._PlanJourney, index, query, policy))
+                        done += 1
+                        if progress is not None:
+                            progress(done, total)
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def GetLineModes(self):
+        url = self.base_url + "Line/Meta/Modes/"
+        response = self._Request(
+            url, http_method="GET", endpoint="GetLineModes")
+
+        return self._Parse(response, self._JourneyModesFromJSON)
+
+    def GetLineSeverityCodes(self):
+        url = self.base_url + "Line/Meta/Severity/"
+        response = self._Request(
+            url, http_method="GET", endpoint="GetLineSeverityCodes")
+
+        return self._Parse(response, self._LineStatusSeveritiesFromJSON)
+
+    def GetLineDisruptionCategories(self):
+        url = self.base_url + "Line/Meta/DisruptionCategories/"
+        response = self._Request(
+            url, http_method="GET", endpoint="GetLineDisruptionCategories")
+
+        return self._Parse(response, self._ListFromJSON)
+
+    def GetLineServiceTypes(self):
+        url = self.base_url + "Line/Meta/ServiceTypes/"
+        response = self._Request(
+            url, http_method="GET", endpoint="GetLineServiceTypes")
+
+        return self._Parse(response, self._ListFromJSON)
+
+    def GetLinesByID(self, ids):
+        url = self.base_url + "Line/{0}/"
+        response = self._Request(
+            url.format(",".join(validate_input(ids, list, "ids"))),
+            http_method="GET", endpoint="GetLinesByID"
+        )
+
+        return self._Parse(response, self._LinesFromJSON)
+
+    def GetLinesBatch(self, ids, max_url_length=MAX_URL_LENGTH):
+        """
+        Fetch any number of lines by ID. The IDs are split into requests
+        whose URL stays under ``max_url_length``, which run concurrently
+        over the pooled connections. Returns a list in the order of ``ids``
+        holding a Line, or the TflError raised for that ID.
+        """
+        ids = validate_input(ids, list, "ids")
+        chunks = self._IDChunks(
+            self.base_url + "Line/{0}/", _Unique(ids), max_url_length)
+
+        return self._Batch(ids, chunks, self._LinesChunk)
+
+    def GetLinesByMode(self, modes):
+        url = self.base_url + "Line/Mode/{0}/"
+        response = self._Request(
+            url.format(validate_input(modes, list, "modes")),
+            http_method="GET", endpoint="GetLinesByMode"
+        )
+
+        return self._Parse(response, self._LinesFromJSON)
+
+    def GetLineByServiceType(self, serviceType):
+        url = self.base_url + "Line/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        response = self._Request(
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="GetLineByServiceType"
+        )
+
+        return self._Parse(response, self._LinesFromJSON)
+
+    def GetLinesByIDServiceType(self, ids, serviceType):
+        url = self.base_url + "Line/%s/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        response = self._Request(
+            url.format(validate_input(ids, list, "ids")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLinesByIDServiceType"
+        )
+
+        return self._Parse(response, self._LinesFromJSON)
+
+    def GetLinesByModeServiceType(self, modes, serviceType):
+        url = self.base_url + "Line/Mode/{0}/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        response = self._Request(
+            url.format(validate_input(modes, list, "modes")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLinesByModeServiceType"
+        )
+
+        return self._Parse(response, self._LinesFromJSON)
+
+    def GetLineRouteSequence(
+        self, _id, direction, serviceTypes, excludeCrowding
+    ):
+        url = self.base_url + "Line/{0}/Route/Sequence/{1}/"
+
+        extra_params = self._ServiceTypeParams(serviceTypes)
+        if excludeCrowding is not None:
+            extra_params["excludeCrowding"] = validate_input(
+                excludeCrowding, bool, "excludeCrowding")
+        response = self._Request(
+            url.format(validate_input(_id, str, "_id"),
+                       validate_input(direction, str, "direction")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLineRouteSequence"
+        )
+
+        return self._Parse(response, self._LineRouteSequenceFromJSON)
+
+    def _BikePointsChunk(self, chunk):
+        return {chunk[0]: self.GetBikePoint(chunk[0])}
+
+    def _LinesChunk(self, chunk):
+        return self._LinesByRequestedID(chunk, self.GetLinesByID(chunk))
+
+    def _LinesByRequestedID(self, chunk, lines):
+        found = dict((str(l.id).lower(), l) for l in lines)
+
+        return dict((i, found[i.lower()]) for i in chunk if i.lower() in found)
+
+    def _ResolvePlaces(self, places, extra_params):
+        # Swap free-text places for what the place cache resolved them to
+        (_from, to, via) = places
+        if self.place_cache is None:
+            return (_from, to, extra_params)
+        _from = self.place_cache.resolve(_from) or _from
+        to = self.place_cache.resolve(to) or to
+        if via is not None:
+            extra_params = dict(
+                extra_params, via=self.place_cache.resolve(via) or via)
+
+        return (_from, to, extra_params)
+
+    def _LearnPlaces(self, result, places):
+        if (self.place_cache is not None and
+                isinstance(result, JourneyDisambiguation)):
+            self.place_cache.learn(result, *places)
+
+    def _CachedJourney(self, _from, to, extra_params):
+        # (journey cache key, cached result), or (None, None) without one
+        if self.journey_cache is None:
+            return (None, None)
+        key = self.journey_cache.key(_from, to, extra_params)
+
+        return (key, self.journey_cache.get(key))
+
+    def _PlanJourney(self, index, query, policy):
+        (args, kwargs) = query
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return (index, self.SearchJourneyPlanner(*args, **kwargs))
+            except BATCH_ERRORS as error:
+                wait = policy.delay(attempt)
+                if wait is None:
+                    return (index, _BatchError(
+                        _JourneyName(args, kwargs), error))
+                time.sleep(wait)
+
+    def _IDChunks(self, url, ids, max_url_length):
+        """
+        Split ``ids`` into comma-separated groups that keep
+        ``url.format(group)`` under ``max_url_length`` once authenticated.
+        """
+        empty = len(self._RequestURL(url.format("")))
+        chunks = []
+        length = empty
+        for _id in ids:
+            if chunks and length + 1 + len(_id) <= max_url_length:
+                chunks[-1].append(_id)
+                length += 1 + len(_id)
+            else:
+                chunks.append([_id])
+                length = empty + len(_id)
+
+        return chunks
+
+    def _Batch(self, ids, chunks, fetch):
+        """
+        Run ``fetch(chunk)``, which maps each ID of the chunk it finds to
+        its model, for every chunk on a thread pool the size of the
+        connection pool, then line the results up with ``ids``.
+        """
+        found = {}
+        if chunks:
+            workers = min(self._pool_maxsize, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(
+                        lambda chunk: self._FetchChunk(fetch, chunk), chunks):
+                    found.update(result)
+
+        return _BatchResults(ids, found)
+
+    def _FetchChunk(self, fetch, chunk):
+        try:
+            return fetch(chunk)
+        except BATCH_ERRORS as error:
+            if len(chunk) == 1:
+                return {chunk[0]: _BatchError(chunk[0], error)}
+
+        # Ask for each ID on its own to find out which of them failed
+        found = {}
+        for _id in chunk:
+            found.update(self._FetchChunk(fetch, [_id]))
+
+        return found
+
+    def _AccidentsFromJSON(self, content):
+        return [Accident.fromJSON(x) for x in self._CheckResponse(content)]
+
+    def _AirQualityFromJSON(self, content):
+        data = self._CheckResponse(content.get('currentForecast'))
+
+        return [AirQuality.fromJSON(x) for x in data]
+
+    def _PointsFromJSON(self, content):
+        return [
+            Point.fromJSON(b, lazy=self.lazy)
+            for b in self._CheckResponse(content)]
+
+    def _PointFromJSON(self, content):
+        return Point.fromJSON(self._CheckResponse(content), lazy=self.lazy)
+
+    def _JourneyModesFromJSON(self, content):
+        return [JourneyMode.fromJSON(j) for j in self._CheckResponse(content)]
+
+    def _CabwiseFromJSON(self, content):
+        data = self._CheckResponse(content["Operators"]["OperatorList"])
+
+        return [Cabwise.fromJSON(c) for c in data]
+
+    def _JourneyPlannerFromJSON(self, content):
+        data = self._CheckResponse(content)
+        if "DisambiguationResult" in data["$type"]:
+            return JourneyDisambiguation.fromJSON(data)
+        else:
+            return JourneyPlanner.fromJSON(data, lazy=self.lazy)
+
+    def _LineStatusSeveritiesFromJSON(self, content):
+        return [
+            LineStatusSeverity.fromJSON(l)
+            for l in self._CheckResponse(content)]
+
+    def _ListFromJSON(self, content):
+        return [item for item in self._CheckResponse(content)]
+
+    def _LinesFromJSON(self, content):
+        data = self._CheckResponse(content)
+        if isinstance(data, dict):
+            data = [data]
+
+        return [Line.fromJSON(l, lazy=self.lazy) for l in data]
+
+    def _LineRouteSequenceFromJSON(self, content):
+        return LineRouteSequence.fromJSON(self._CheckResponse(content))
+
+    def _CabwiseParams(
+            self, lat, lon, radius=None, maxResults=None,
+            twentyfour_seven=True):
         extra_params = {}
         extra_params["lat"] = validate_input(lat, float, "lat")
         extra_params["lon"] = validate_input(lon, float, "lon")
@@ -103,15 +639,11 @@ class Api(object):
             extra_params["twentyfour_seven"] = validate_input(
                 twentyfour_seven, bool, "twentyfour_seven"
             )
-        response = self._Request(
-            url, extra_params=extra_params, http_method="GET")
-        data = self._CheckResponse(
-            response.json()["Operators"]["OperatorList"])
 
-        return [Cabwise.fromJSON(c) for c in data]
+        return extra_params
 
-    def SearchJourneyPlanner(
-            self, _from, to, via=None, nationalSearch=False, date=None,
+    def _JourneyPlannerParams(
+            self, via=None, nationalSearch=False, date=None,
             time=None, timels=None, journeyPreference=None, mode=None,
             accessibilityPreference=None, fromName=None, toName=None,
             viaName=None, maxTransferMinutes=None, maxWalkingMinutes=None,
@@ -119,8 +651,6 @@ class Api(object):
             bikeProficiency=None, alternativeCycle=None,
             alternativeWalking=None, useMultiModalCall=None,
             walkingOptimsation=False, taxiOnlyTrip=False):
-        url = self.base_url + "Journey/JourneyResults/{0}/to/{1}"
-
         extra_params = {}
         if via is not None:
             extra_params["via"] = validate_input(via, str, "via")
@@ -140,7 +670,7 @@ class Api(object):
         if mode is not None:
             if isinstance(mode, (tuple, list)):
                 extra_params["mode"] = ','.join(
-                    [validate_input(m) for m in mode])
+                    [validate_input(m, str, "mode") for m in mode])
             else:
                 extra_params["mode"] = validate_input(mode, str, "mode")
         if (accessibilityPreference in
@@ -185,136 +715,16 @@ class Api(object):
             extra_params["taxiOnlyTrip"] = validate_input(
                 taxiOnlyTrip, bool, "taxiOnlyTrip")
 
-        response = self._Request(
-            url.format(
-                validate_input(_from, str, "_from"),
-                validate_input(to, str, "to")),
-            extra_params=extra_params, http_method="GET")
-        data = self._CheckResponse(
-            response.json()
-        )
-
-        if "DisambiguationResult" in data["$type"]:
-            return JourneyDisambiguation.fromJSON(data)
-        else:
-            return JourneyPlanner.fromJSON(data)
-
-    def GetLineModes(self):
-        url = self.base_url + "Line/Meta/Modes/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
-
-        return [JourneyMode.fromJSON(j) for j in data]
-
-    def GetLineSeverityCodes(self):
-        url = self.base_url + "Line/Meta/Severity/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
-
-        return [LineStatusSeverity.fromJSON(l) for l in data]
-
-    def GetLineDisruptionCategories(self):
-        url = self.base_url + "Line/Meta/DisruptionCategories/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
-
-        return [category for category in data]
-
-    def GetLineServiceTypes(self):
-        url = self.base_url + "Line/Meta/ServiceTypes/"
-        response = self._Request(url, http_method="GET")
-        data = self._CheckResponse(response.json())
-
-        return [service for service in data]
-
-    def GetLinesByID(self, ids):
-        url = self.base_url + "Line/{0}/"
-        response = self._Request(
-            url.format(",".join(validate_input(ids, list, "ids"))),
-            http_method="GET"
-        )
-        data = self._CheckResponse(
-            response.json()
-        )
-
-        return [Line.fromJSON(l) for l in data]
-
-    def GetLinesByMode(self, modes):
-        url = self.base_url + "Line/Mode/{0}/"
-        response = self._Request(
-            url.format(validate_input(modes, list, "modes")),
-            http_method="GET"
-        )
-        data = self._CheckResponse(response.json())
-
-        return [Line.fromJSON(l) for l in data]
-
-    def GetLineByServiceType(self, serviceType):
-        url = self.base_url + "Line/Route/"
-        extra_params = {}
-        if serviceType in ["Regular", "Night"]:
-            extra_params["serviceTypes"] = validate_input(
-                serviceType, str, "serviceType"
-            )
-        response = self._Request(
-            url, extra_params=extra_params, http_method="GET"
-        )
-        data = self._CheckResponse(response.json())
-
-        return [Line.fromJSON(l) for l in data]
+        return extra_params
 
-    def GetLinesByIDServiceType(self, ids, serviceType):
-        url = self.base_url + "Line/%s/Route/"
+    def _ServiceTypeParams(self, serviceType):
         extra_params = {}
         if serviceType in ["Regular", "Night"]:
             extra_params["serviceTypes"] = validate_input(
                 serviceType, str, "serviceType"
             )
-        response = self._Request(
-            url.format(validate_input(ids, list, "ids")),
-            extra_params=extra_params, http_method="GET"
-        )
-        data = self._CheckResponse(response.json())
-        if isinstance(data, dict):
-            data = [data]
 
-        return [Line.fromJSON(l) for l in data]
-
-    def GetLinesByModeServiceType(self, modes, serviceType):
-        url = self.base_url + "Line/Mode/{0}/Route/"
-        extra_params = {}
-        if serviceType in ["Regular", "Night"]:
-            extra_params["serviceTypes"] = validate_input(
-                serviceType, str, "serviceType"
-            )
-        response = self._Request(
-            url.format(validate_input(modes, list, "modes")),
-            extra_params=extra_params, http_method="GET"
-        )
-        data = self._CheckResponse(response.json())
-
-        return [Line.fromJSON(l) for l in data]
-
-    def GetLineRouteSequence(
-        self, _id, direction, serviceTypes, excludeCrowding
-    ):
-        url = self.base_url + "Line/{0}/Route/Sequence/{1}/"
-
-        extra_params = {}
-        if serviceTypes in ["Regular", "Night"]:
-            extra_params["serviceTypes"] = validate_input(
-                serviceTypes, str, "serviceType"
-            )
-        if excludeCrowding is not None:
-            extra_params["excludeCrowding"] = validate_input(
-                excludeCrowding, bool, "excludeCrowding")
-        response = self._Request(
-            url.format(validate_input(_id, str, "_id"),
-                       validate_input(direction, str, "direction")),
-            extra_params=extra_params, http_method="GET"
-        )
-        data = self._CheckResponse(response.json())
-        return LineRouteSequence.fromJSON(data)
+        return extra_params
 
     def _CheckResponse(self, content):
         if isinstance(content, (dict, list)) and 'exceptionType' in content:
@@ -339,7 +749,273 @@ class Api(object):
 
             return urlunparse((scheme, netloc, path, params, query, fragment))
 
-    def _Request(self, url, http_method, extra_params=None, authenticate=True):
+    def _Request(self, url, http_method, extra_params=None, authenticate=True,
+                 endpoint=None):
+        """
+        The response to a GET of ``url``. With instrumentation on, the call
+        is timed under ``endpoint`` (the public method's name) until
+        _Parse() is done with the response, or until it fails here.
+        """
+        timing = None
+        if self.instrumentation is not None:
+            timing = start_timing(endpoint)
+        try:
+            return self._Send(
+                url, http_method, extra_params, authenticate, timing)
+        except BaseException as error:
+            if timing is not None:
+                finish_timing(self.instrumentation, timing, error=error)
+            raise
+
+    def _Send(self, url, http_method, extra_params, authenticate, timing):
+        url = self._RequestURL(
+            url, extra_params=extra_params, authenticate=authenticate)
+
+        if http_method != "GET":
+            raise NotImplementedError
+
+        key = cache_key(url)
+        if timing is not None:
+            timing.url = key
+            timing.mark("url")
+        if self.cache is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                response.from_cache = True
+                return response
+
+        if not self.coalesce:
+            return self._Fetch(url, key)
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        with self._stats_lock:
+            self.coalesce_stats["requests" if leader else "coalesced"] += 1
+        if not leader:
+            return flight.Wait()
+
+        try:
+            flight.response = self._Fetch(url, key)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return flight.response
+
+    def _Fetch(self, url, key):
+        previous = None
+        headers = {}
+        if self._validators is not None:
+            previous = self._validators.get(key)
+            if previous is not None:
+                headers = self._ValidatorHeaders(previous)
+
+        response = self._Get(url, headers=headers)
+        if previous is not None and response.status_code == 304:
+            response = self._NotModified(previous, response)
+        else:
+            response.from_cache = False
+            response.not_modified = False
+            if (self._validators is not None and response.ok
+                    and self._ValidatorHeaders(response)):
+                self._validators.set(key, response)
+
+        if self.cache is not None and response.ok:
+            ttl = cache_ttl_from_headers(response.headers)
+            if ttl is None:
+                ttl = self._EndpointCacheTTL(url)
+            self._CacheStore(response, ttl)
+
+        return response
+
+    def _Parse(self, response, from_json):
+        """
+        Build models from a response, reusing the result when the same
+        response is handed back by the cache, a 304 revalidation or a
+        coalesced request. Each caller gets its own copy of a list.
+        """
+        timing = None
+        if self.instrumentation is not None:
+            timing = current_timing()
+        if timing is not None:
+            timing.mark("network")
+            timing.bytes = len(response.content)
+
+        parsed = getattr(response, "parsed", None)
+        error = None
+        try:
+            if parsed is None:
+                start = time.time()
+                content = response.json()
+                if timing is not None:
+                    timing.mark("decode")
+                parsed = from_json(content)
+                response.parse_seconds = time.time() - start
+                response.parsed = parsed
+        except BaseException as failure:
+            error = failure
+            raise
+        finally:
+            if timing is not None:
+                timing.mark("build")
+                finish_timing(self.instrumentation, timing, parsed, error)
+
+        # Callers may sort or trim what they are given without touching
+        # the result kept on the response for the next one
+        return list(parsed) if isinstance(parsed, list) else parsed
+
+    def _Stream(self, url, extra_params=None, endpoint=None):
+        """
+        Issue a GET without reading the body. Streamed requests bypass the
+        response cache and conditional revalidation.
+        """
+        timing = None
+        if self.instrumentation is not None:
+            timing = start_timing(endpoint)
+        try:
+            url = self._RequestURL(url, extra_params=extra_params)
+            if timing is not None:
+                timing.url = cache_key(url)
+                timing.mark("url")
+            response = self._Get(url, stream=True)
+        except BaseException as error:
+            if timing is not None:
+                finish_timing(self.instrumentation, timing, error=error)
+            raise
+        # Streamed responses are never shared, so the timing can travel
+        # with them to _IterParse
+        response.timing = timing
+
+        return response
+
+    def _Get(self, url, **kwargs):
+        """
+        GET ``url`` once the rate limiter allows, repeating it on the
+        statuses and connection errors the retry policy covers. The last
+        response is returned when attempts run out.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self._Session().get(
+                    url, timeout=self._timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                wait = None if self.retry is None else self.retry.delay(
+                    attempt)
+                if wait is None:
+                    raise
+                time.sleep(wait)
+                continue
+
+            self._Throttle(response.status_code, response.headers)
+            if self.retry is None or not self.retry.retryable(
+                    response.status_code):
+                return response
+            wait = self.retry.delay(attempt, response.headers)
+            if wait is None:
+                return response
+            response.close()
+            time.sleep(wait)
+
+    def _Throttle(self, status, headers):
+        # Hold back every request sharing the rate limiter when the server
+        # says the quota is used up
+        if self.rate_limiter is None:
+            return
+        wait = None
+        if status in (429, 503):
+            wait = retry_after_from_headers(headers)
+        if wait is None:
+            wait = rate_limit_reset_from_headers(headers)
+        if wait:
+            self.rate_limiter.pause(wait)
+
+    def _IterParse(self, response, from_json, path=()):
+        """
+        Yield one model per element of the JSON array at ``path`` as the
+        body arrives, so only a single element is decoded at a time.
+        """
+        timing = getattr(response, "timing", None)
+        if timing is None:
+            try:
+                for item in iter_json_array(
+                        response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                        path=path, check=self._CheckResponse):
+                    yield from_json(item)
+            finally:
+                response.close()
+            return
+
+        # Time spent waiting on the caller between items is left out
+        timing.mark("network")
+        error = None
+        try:
+            for item in iter_json_array(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    path=path, check=self._CheckResponse):
+                timing.mark("decode")
+                model = from_json(item)
+                timing.mark("build")
+                timing.objects += 1
+                yield model
+                timing.skip()
+        except Exception as failure:
+            error = failure
+            raise
+        finally:
+            response.close()
+            finish_timing(self.instrumentation, timing, error=error)
+
+    def _ValidatorHeaders(self, response):
+        headers = {}
+        if response.headers.get("ETag"):
+            headers["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        return headers
+
+    def _NotModified(self, previous, response):
+        for header in ("ETag", "Last-Modified", "Cache-Control", "Expires",
+                       "Date"):
+            if header in response.headers:
+                previous.headers[header] = response.headers[header]
+        previous.from_cache = False
+        previous.not_modified = True
+
+        with self._stats_lock:
+            self.revalidation_stats["not_modified"] += 1
+            self.revalidation_stats["bytes_saved"] += len(previous.content)
+            self.revalidation_stats["parse_seconds_saved"] += getattr(
+                previous, "parse_seconds", 0.0)
+
+        return previous
+
+    def _CacheStore(self, response, ttl):
+        if self.cache is not None and ttl:
+            # Key on the URL that was asked for, not where it redirected to
+            request = (response.history or [response])[0].request
+            self.cache.set(cache_key(request.url), response, ttl)
+
+    def _EndpointCacheTTL(self, url):
+        path = urlparse(url).path[len(urlparse(self.base_url).path):]
+        prefixes = [p for p in self.cache_ttls if path.startswith(p)]
+        if prefixes:
+            return self.cache_ttls[max(prefixes, key=len)]
+
+        return self.default_cache_ttl
+
+    def _RequestURL(self, url, extra_params=None, authenticate=True):
         if authenticate and not (self.app_id and self.app_key):
             raise TflError(
                 "The Tfl.Api instance requires authentication to function")
@@ -347,10 +1023,94 @@ class Api(object):
         if extra_params:
             get_params.update(extra_params)
 
-        if http_method != "GET":
-            raise NotImplementedError
+        return self._BuildAbsoluteURL(url, get_params=get_params)
+
+    def _Session(self):
+        with self._session_lock:
+            now = time.time()
+            if (self._session is not None and self._keep_alive is not None
+                    and now - self._session_started >= self._keep_alive):
+                # Other threads may still be reading responses from the
+                # old session, so it is left to close its connections when
+                # the last of them lets go of it
+                self._session = None
+            if self._session is None:
+                self._session = self._BuildSession()
+                self._session_started = now
+
+            return self._session
+
+    def _BuildSession(self):
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+
+class _Flight(object):
+    """
+    A request in flight that other callers of the same URL wait on.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+    def Wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+
+        return self.response
+
+
+def _Unique(ids):
+    seen = set()
+
+    return [i for i in ids if not (i in seen or seen.add(i))]
+
+
+def _BatchError(_id, error):
+    if isinstance(error, TflError):
+        return error
+
+    return TflError("\"{0}\": {1}".format(_id, error))
+
+
+def _JourneyQueries(queries, search):
+    # (index, (args, kwargs)) for each batch query, checked against the
+    # signature of ``search`` as the batch reaches it (``queries`` may be
+    # a generator) and before it is submitted, so a malformed one fails
+    # the batch rather than every attempt at it
+    signature = inspect.signature(search)
+    for (index, query) in enumerate(queries):
+        if isinstance(query, dict):
+            (args, kwargs) = ((), query)
+        elif isinstance(query, (list, tuple)):
+            (args, kwargs) = (tuple(query), {})
         else:
-            url = self._BuildAbsoluteURL(url, get_params=get_params)
-            response = requests.get(url, timeout=self._timeout)
+            raise TflError("Journey query {0} is not a (from, to) pair or a "
+                           "dict of arguments".format(index))
+        try:
+            signature.bind(*args, **kwargs)
+        except TypeError as error:
+            raise TflError("Journey query {0}: {1}".format(index, error))
+        yield (index, (args, kwargs))
 
-        return response
+
+def _JourneyName(args, kwargs):
+    (_from, to) = (tuple(args) + (None, None))[:2]
+
+    return "{0} to {1}".format(
+        kwargs.get("_from", _from), kwargs.get("to", to))
+
+
+def _BatchResults(ids, found):
+    return [
+        found[i] if i in found
+        else TflError("\"{0}\" was not found".format(i)) for i in ids]
@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import itertools
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from tfl import Accident, Cabwise, Point
+from tfl.api import (
+    Api, BATCH_ERRORS, MAX_URL_LENGTH, STREAM_CHUNK_SIZE, _BatchError,
+    _BatchResults, _JourneyName, _JourneyQueries, _Unique
+)
+from tfl.cache import cache_key
+from tfl.exceptions import TflError
+from tfl.instrumentation import current_timing, finish_timing, start_timing
+from tfl.retry import RetryPolicy
+from tfl.snapshot import BikePointSnapshot
+from tfl.streaming import aiter_json_array
+from tfl.utils import validate_year, validate_input
+
+
+class AsyncApi(Api):
+    """
+    An asyncio interface into the TFL api, mirroring Api with coroutines.
+
+    At most ``max_concurrency`` requests are in flight at once; any further
+    calls wait for a slot rather than opening more connections.
+    ``keep_alive`` is how long an idle pooled connection is kept open.
+    """
+    def __init__(self, app_id=None, app_key=None, timeout=None,
+                 pool_maxsize=100, max_concurrency=100, keep_alive=None,
+                 lazy=False, retry=None, rate_limiter=None, coalesce=True,
+                 instrumentation=None, journey_cache=None, place_cache=None):
+        if aiohttp is None:
+            raise TflError("AsyncApi requires the aiohttp package")
+        super(AsyncApi, self).__init__(
+            app_id=app_id, app_key=app_key, timeout=timeout,
+            pool_maxsize=pool_maxsize, keep_alive=keep_alive, lazy=lazy,
+            retry=retry, rate_limiter=rate_limiter, coalesce=coalesce,
+            instrumentation=instrumentation, journey_cache=journey_cache,
+            place_cache=place_cache)
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+
+    def __enter__(self):
+        raise TflError("AsyncApi must be used with \"async with\"")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        # Shared requests outlive their callers' cancellation, so finish
+        # any still running before their connector goes
+        tasks = [flight.task for flight in self._flights.values()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def GetAccidentStats(self, year):
+        url = self.base_url + "AccidentStats/{0}/"
+        year = validate_year(str(year))
+        content = await self._Request(
+            url.format(year), http_method="GET", endpoint="GetAccidentStats")
+
+        return self._Parse(content, self._AccidentsFromJSON)
+
+    async def IterAccidentStats(self, year):
+        url = self.base_url + "AccidentStats/{0}/"
+        year = validate_year(str(year))
+        async for accident in self._IterStream(
+                url.format(year), Accident.fromJSON,
+                endpoint="IterAccidentStats"):
+            yield accident
+
+    async def GetAirQuality(self):
+        url = self.base_url + "AirQuality/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetAirQuality")
+
+        return self._Parse(content, self._AirQualityFromJSON)
+
+    async def GetBikePoints(self):
+        url = self.base_url + "BikePoint/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetBikePoints")
+
+        return self._Parse(content, self._PointsFromJSON)
+
+    async def IterBikePoints(self):
+        url = self.base_url + "BikePoint/"
+        async for point in self._IterStream(
+                url, Point.fromJSON, endpoint="IterBikePoints"):
+            yield point
+
+    async def GetBikePointsSnapshot(self):
+        url = self.base_url + "BikePoint/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetBikePointsSnapshot")
+
+        return self._Parse(content, self._BikePointsSnapshotFromJSON)
+
+    async def GetBikePoint(self, point):
+        url = self.base_url + "BikePoint/{0}"
+        content = await self._Request(
+            url.format(point), http_method="GET", endpoint="GetBikePoint")
+
+        return self._Parse(content, self._PointFromJSON)
+
+    async def GetBikePointsBatch(self, points):
+        points = validate_input(points, list, "points")
+
+        return await self._Batch(
+            points, [[p] for p in _Unique(points)], self._BikePointsChunk)
+
+    async def GetJourneyModes(self):
+        url = self.base_url + "Journey/Meta/Modes/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetJourneyModes")
+
+        return self._Parse(content, self._JourneyModesFromJSON)
+
+    async def SearchBikePoints(self, query):
+        url = self.base_url + "BikePoint/Search/"
+        extra_params = {"query": query}
+        content = await self._Request(
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="SearchBikePoints")
+
+        return self._Parse(content, self._PointsFromJSON)
+
+    async def SearchCabwise(
+            self, lat, lon, optype=None, wc=None, radius=None,
+            name=None, maxResults=None, legacy_format=True,
+            twentyfour_seven=True):
+        url = self.base_url + "Cabwise/Search"
+        extra_params = self._CabwiseParams(
+            lat, lon, radius=radius, maxResults=maxResults,
+            twentyfour_seven=twentyfour_seven)
+        content = await self._Request(
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="SearchCabwise")
+
+        return self._Parse(content, self._CabwiseFromJSON)
+
+    async def IterCabwise(
+            self, lat, lon, optype=None, wc=None, radius=None,
+            name=None, maxResults=None, legacy_format=True,
+            twentyfour_seven=True):
+        url = self.base_url + "Cabwise/Search"
+        extra_params = self._CabwiseParams(
+            lat, lon, radius=radius, maxResults=maxResults,
+            twentyfour_seven=twentyfour_seven)
+        async for cab in self._IterStream(
+                url, Cabwise.fromJSON, extra_params=extra_params,
+                path=("Operators", "OperatorList"), endpoint="IterCabwise"):
+            yield cab
+
+    async def SearchJourneyPlanner(self, _from, to, *args, **kwargs):
+        url = self.base_url + "Journey/JourneyResults/{0}/to/{1}"
+        extra_params = self._JourneyPlannerParams(*args, **kwargs)
+        places = (validate_input(_from, str, "_from"),
+                  validate_input(to, str, "to"), extra_params.get("via"))
+        (_from, to, extra_params) = self._ResolvePlaces(places, extra_params)
+        (key, result) = self._CachedJourney(_from, to, extra_params)
+        if result is not None:
+            return result
+
+        content = await self._Request(
+            url.format(_from, to), extra_params=extra_params,
+            http_method="GET", endpoint="SearchJourneyPlanner")
+        result = self._Parse(content, self._JourneyPlannerFromJSON)
+        self._LearnPlaces(result, places)
+        if key is not None:
+            self.journey_cache.set(key, result)
+
+        return result
+
+    async def IterJourneyPlannerBatch(self, queries, max_workers=None,
+                                      attempts=1, progress=None):
+        """
+        An async generator of ``(index, result)`` pairs as the journeys in
+        ``queries`` complete; see Api.IterJourneyPlannerBatch. At most
+        ``max_workers`` (default: ``max_concurrency``) are planned at once.
+        """
+        total = len(queries) if hasattr(queries, "__len__") else None
+        # Checked against Api's signature, as this one takes **kwargs
+        queries = _JourneyQueries(
+            queries, super(AsyncApi, self).SearchJourneyPlanner)
+        workers = max_workers or self._max_concurrency
+        policy = RetryPolicy(max_attempts=attempts)
+
+        done = 0
+        pending = set(
+            asyncio.ensure_future(self._PlanJourney(index, query, policy))
+            for (index, query) in itertools.islice(queries, workers))
+        try:
+            while pending:
+                (finished, pending) = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    for (index, query) in itertools.islice(queries, 1):
+                        pending.add(asyncio.ensure_future(
+                            self._PlanJourney(index, query, policy)))
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def GetLineModes(self):
+        url = self.base_url + "Line/Meta/Modes/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetLineModes")
+
+        return self._Parse(content, self._JourneyModesFromJSON)
+
+    async def GetLineSeverityCodes(self):
+        url = self.base_url + "Line/Meta/Severity/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetLineSeverityCodes")
+
+        return self._Parse(content, self._LineStatusSeveritiesFromJSON)
+
+    async def GetLineDisruptionCategories(self):
+        url = self.base_url + "Line/Meta/DisruptionCategories/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetLineDisruptionCategories")
+
+        return self._Parse(content, self._ListFromJSON)
+
+    async def GetLineServiceTypes(self):
+        url = self.base_url + "Line/Meta/ServiceTypes/"
+        content = await self._Request(
+            url, http_method="GET", endpoint="GetLineServiceTypes")
+
+        return self._Parse(content, self._ListFromJSON)
+
+    async def GetLinesByID(self, ids):
+        url = self.base_url + "Line/{0}/"
+        content = await self._Request(
+            url.format(",".join(validate_input(ids, list, "ids"))),
+            http_method="GET", endpoint="GetLinesByID")
+
+        return self._Parse(content, self._LinesFromJSON)
+
+    async def GetLinesBatch(self, ids, max_url_length=MAX_URL_LENGTH):
+        ids = validate_input(ids, list, "ids")
+        chunks = self._IDChunks(
+            self.base_url + "Line/{0}/", _Unique(ids), max_url_length)
+
+        return await self._Batch(ids, chunks, self._LinesChunk)
+
+    async def GetLinesByMode(self, modes):
+        url = self.base_url + "Line/Mode/{0}/"
+        content = await self._Request(
+            url.format(validate_input(modes, list, "modes")),
+            http_method="GET", endpoint="GetLinesByMode")
+
+        return self._Parse(content, self._LinesFromJSON)
+
+    async def GetLineByServiceType(self, serviceType):
+        url = self.base_url + "Line/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        content = await self._Request(
+            url, extra_params=extra_params, http_method="GET",
+            endpoint="GetLineByServiceType")
+
+        return self._Parse(content, self._LinesFromJSON)
+
+    async def GetLinesByIDServiceType(self, ids, serviceType):
+        url = self.base_url + "Line/%s/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        content = await self._Request(
+            url.format(validate_input(ids, list, "ids")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLinesByIDServiceType")
+
+        return self._Parse(content, self._LinesFromJSON)
+
+    async def GetLinesByModeServiceType(self, modes, serviceType):
+        url = self.base_url + "Line/Mode/{0}/Route/"
+        extra_params = self._ServiceTypeParams(serviceType)
+        content = await self._Request(
+            url.format(validate_input(modes, list, "modes")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLinesByModeServiceType")
+
+        return self._Parse(content, self._LinesFromJSON)
+
+    async def GetLineRouteSequence(
+        self, _id, direction, serviceTypes, excludeCrowding
+    ):
+        url = self.base_url + "Line/{0}/Route/Sequence/{1}/"
+        extra_params = self._ServiceTypeParams(serviceTypes)
+        if excludeCrowding is not None:
+            extra_params["excludeCrowding"] = validate_input(
+                excludeCrowding, bool, "excludeCrowding")
+        content = await self._Request(
+            url.format(validate_input(_id, str, "_id"),
+                       validate_input(direction, str, "direction")),
+            extra_params=extra_params, http_method="GET",
+            endpoint="GetLineRouteSequence")
+
+        return self._Parse(content, self._LineRouteSequenceFromJSON)
+
+    def _BikePointsSnapshotFromJSON(self, content):
+        return BikePointSnapshot.fromJSON(self._CheckResponse(content))
+
+    async def _BikePointsChunk(self, chunk):
+        return {chunk[0]: await self.GetBikePoint(chunk[0])}
+
+    async def _LinesChunk(self, chunk):
+        return self._LinesByRequestedID(chunk, await self.GetLinesByID(chunk))
+
+    async def _PlanJourney(self, index, query, policy):
+        (args, kwargs) = query
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return (index, await self.SearchJourneyPlanner(
+                    *args, **kwargs))
+            except BATCH_ERRORS + (aiohttp.ClientError,
+                                   asyncio.TimeoutError) as error:
+                wait = policy.delay(attempt)
+                if wait is None:
+                    return (index, _BatchError(
+                        _JourneyName(args, kwargs), error))
+                await asyncio.sleep(wait)
+
+    async def _Batch(self, ids, chunks, fetch):
+        found = {}
+        for result in await asyncio.gather(
+                *[self._FetchChunk(fetch, chunk) for chunk in chunks]):
+            found.update(result)
+
+        return _BatchResults(ids, found)
+
+    async def _FetchChunk(self, fetch, chunk):
+        try:
+            return await fetch(chunk)
+        except BATCH_ERRORS + (aiohttp.ClientError, asyncio.TimeoutError) \
+                as error:
+            if len(chunk) == 1:
+                return {chunk[0]: _BatchError(chunk[0], error)}
+
+        found = {}
+        for _id in chunk:
+            found.update(await self._FetchChunk(fetch, [_id]))
+
+        return found
+
+    async def _Request(self, url, http_method, extra_params=None,
+                       authenticate=True, endpoint=None):
+        timing = None
+        if self.instrumentation is not None:
+            timing = start_timing(endpoint)
+        try:
+            return await self._Send(
+                url, http_method, extra_params, authenticate, timing)
+        except BaseException as error:
+            if timing is not None:
+                finish_timing(self.instrumentation, timing, error=error)
+            raise
+
+    async def _Send(self, url, http_method, extra_params, authenticate,
+                    timing):
+        url = self._RequestURL(
+            url, extra_params=extra_params, authenticate=authenticate)
+
+        if http_method != "GET":
+            raise NotImplementedError
+
+        if timing is not None:
+            timing.url = cache_key(url)
+            timing.mark("url")
+
+        if not self.coalesce:
+            return await self._Fetch(url)
+
+        key = cache_key(url)
+        flight = self._flights.get(key)
+        self.coalesce_stats[
+            "requests" if flight is None else "coalesced"] += 1
+        if flight is None:
+            flight = self._flights[key] = _AsyncFlight(
+                asyncio.ensure_future(self._Fetch(url)))
+            flight.task.add_done_callback(
+                lambda done: self._flights.pop(key, None)
+                if self._flights.get(key) is flight else None)
+
+        # A cancelled caller must not cancel the request the others share,
+        # but the request is cancelled once no caller is left waiting
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    async def _Fetch(self, url):
+        response = await self._Get(url)
+        try:
+            return await self._ReadJSON(response)
+        finally:
+            response.release()
+
+    async def _Get(self, url):
+        """
+        GET ``url`` once the rate limiter allows, repeating it on the
+        statuses and connection errors the retry policy covers. The last
+        response is returned with its body unread, for the caller to
+        release. A concurrency slot is held until the headers arrive; the
+        connector's limit of ``max_concurrency`` covers reading the body.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                async with self._semaphore:
+                    session = await self._Session()
+                    response = await session.get(url)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                wait = None if self.retry is None else self.retry.delay(
+                    attempt)
+                if wait is None:
+                    raise
+            else:
+                self._Throttle(response.status, response.headers)
+                wait = None
+                if self.retry is not None and self.retry.retryable(
+                        response.status):
+                    wait = self.retry.delay(attempt, response.headers)
+                if wait is None:
+                    return response
+                response.release()
+            # Back off without holding a concurrency slot
+            await asyncio.sleep(wait)
+
+    async def _IterStream(self, url, from_json, extra_params=None, path=(),
+                          endpoint=None):
+        """
+        Yield one model per element of the JSON array at ``path`` as the
+        body arrives; see Api._IterParse. Streamed requests bypass
+        coalescing, and hold their connection until they are exhausted or
+        closed.
+        """
+        timing = None
+        if self.instrumentation is not None:
+            timing = start_timing(endpoint)
+        response = None
+        error = None
+        try:
+            url = self._RequestURL(url, extra_params=extra_params)
+            if timing is not None:
+                timing.url = cache_key(url)
+                timing.mark("url")
+            response = await self._Get(url)
+            items = aiter_json_array(
+                response.content.iter_chunked(STREAM_CHUNK_SIZE),
+                path=path, check=self._CheckResponse)
+            if timing is None:
+                async for item in items:
+                    yield from_json(item)
+                return
+
+            # Time spent waiting on the caller between items is left out
+            timing.mark("network")
+            async for item in items:
+                timing.mark("decode")
+                model = from_json(item)
+                timing.mark("build")
+                timing.objects += 1
+                yield model
+                timing.skip()
+        except Exception as failure:
+            error = failure
+            raise
+        finally:
+            if response is not None:
+                response.release()
+            if timing is not None:
+                finish_timing(self.instrumentation, timing, error=error)
+
+    async def _ReadJSON(self, response):
+        # A coalesced request runs as a task started with a copy of the
+        # first caller's context, so the timing is the first caller's
+        timing = None
+        if self.instrumentation is not None:
+            timing = current_timing()
+        if timing is None:
+            return await response.json(content_type=None)
+
+        timing.bytes = len(await response.read())
+        timing.mark("network")
+        content = await response.json(content_type=None)
+        timing.mark("decode")
+
+        return content
+
+    def _Parse(self, content, from_json):
+        timing = None
+        if self.instrumentation is not None:
+            timing = current_timing()
+        if timing is None:
+            return from_json(content)
+
+        timing.mark("network")
+        parsed = None
+        error = None
+        try:
+            parsed = from_json(content)
+        except BaseException as failure:
+            error = failure
+            raise
+        finally:
+            timing.mark("build")
+            finish_timing(self.instrumentation, timing, parsed, error)
+
+        return parsed
+
+    async def _Session(self):
+        if self._session is None:
+            self._session = self._BuildSession()
+
+        return self._session
+
+    def _BuildSession(self):
+        connector_args = {
+            "limit": self._max_concurrency,
+            "limit_per_host": self._pool_maxsize
+        }
+        if self._keep_alive is not None:
+            connector_args["keepalive_timeout"] = self._keep_alive
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**connector_args),
+            timeout=aiohttp.ClientTimeout(total=self._timeout))
+
+
+class _AsyncFlight(object):
+    """
+    A request in flight and the number of callers awaiting it.
+    """
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from email.utils import mktime_tz, parsedate_tz
+
+try:
+    from urllib.parse import urlparse, urlunparse, urlencode, parse_qsl
+except ImportError:
+    from urlparse import urlparse, urlunparse, parse_qsl
+    from urllib import urlencode
+
+_now = time.monotonic
+
+CREDENTIAL_PARAMS = ("app_id", "app_key")
+
+# "lat,lon" journey planner places, and "HHmm" times
+_COORDINATES_RE = re.compile(r"(-?\d+(?:\.\d*)?)\s*,\s*(-?\d+(?:\.\d*)?)$")
+_TIME_RE = re.compile(r"(\d\d):?(\d\d)$")
+
+# Near-static meta endpoints, keyed on their path relative to Api.base_url.
+DEFAULT_CACHE_TTLS = {
+    "Journey/Meta/": 24 * 60 * 60,
+    "Line/Meta/": 24 * 60 * 60,
+}
+
+
+class LRUCache(object):
+    """
+    A thread-safe in-memory cache that evicts the least recently used entry
+    once ``maxsize`` is reached, and drops entries whose TTL has passed.
+
+    Any object with the same ``get``/``set``/``delete``/``clear`` methods can
+    be handed to ``Api(cache=...)`` instead.
+    """
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            (value, expires) = entry
+            if expires is not None and expires <= _now():
+                del self._entries[key]
+                return default
+            # Re-insert to mark the entry as most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+
+            return value
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else _now() + ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expires)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self):
+        """
+        (key, value) pairs of the live entries, least recently used first.
+        """
+        now = _now()
+        with self._lock:
+            return [(key, value)
+                    for (key, (value, expires)) in self._entries.items()
+                    if expires is None or expires > now]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class JourneyCache(object):
+    """
+    Journey planner results keyed on the query rather than the URL, so
+    logically identical queries share one result: "lat,lon" places are
+    rounded to ``precision`` decimal places, times are rounded down to
+    ``time_bucket`` minutes, modes are sorted, and the parameter order is
+    ignored.
+
+    A JourneyPlanner is kept for its ``recommendedMaxAgeMinutes``, any
+    other result (such as a JourneyDisambiguation) for ``default_ttl``
+    seconds, or not at all when that is ``None``. Lookups are counted in
+    ``stats``.
+
+    A hit hands back the cached model itself, shared with every other
+    caller of the same query, so it should be treated as read-only.
+    """
+    def __init__(self, maxsize=1024, precision=4, time_bucket=5,
+                 default_ttl=None):
+        self.precision = precision
+        self.time_bucket = time_bucket
+        self.default_ttl = default_ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+
+        return self.stats["hits"] / float(lookups) if lookups else 0.0
+
+    def key(self, _from, to, params):
+        """
+        The normalised form of a query from ``_from`` to ``to`` with the
+        query string ``params`` built by SearchJourneyPlanner.
+        """
+        normalised = {}
+        for (name, value) in params.items():
+            if name == "via":
+                value = self._Place(value)
+            elif name == "time":
+                value = self._Time(value)
+            elif name == "mode":
+                value = ",".join(sorted(set(
+                    m.strip().lower() for m in str(value).split(",")
+                    if m.strip())))
+            normalised[name] = str(value)
+
+        return (self._Place(_from), self._Place(to),
+                tuple(sorted(normalised.items())))
+
+    def get(self, key):
+        result = self._entries.get(key)
+        with self._lock:
+            self.stats["misses" if result is None else "hits"] += 1
+
+        return result
+
+    def set(self, key, result):
+        ttl = self.default_ttl
+        max_age = getattr(result, "recommendedMaxAgeMinutes", None)
+        if max_age:
+            ttl = max_age * 60
+        if ttl:
+            self._entries.set(key, result, ttl)
+
+    def clear(self):
+        self._entries.clear()
+        with self._lock:
+            self.stats = {"hits": 0, "misses": 0}
+
+    def _Place(self, place):
+        place = str(place).strip()
+        match = _COORDINATES_RE.match(place)
+        if match is None:
+            return place
+
+        return "{0:.{2}f},{1:.{2}f}".format(
+            float(match.group(1)), float(match.group(2)), self.precision)
+
+    def _Time(self, value):
+        match = _TIME_RE.match(str(value).strip())
+        if match is None or not self.time_bucket:
+            return value
+        minutes = int(match.group(1)) * 60 + int(match.group(2))
+        minutes -= minutes % self.time_bucket
+
+        return "{0:02d}{1:02d}".format(minutes // 60, minutes % 60)
+
+
+class PlaceCache(object):
+    """
+    Free-text journey planner places, such as "kings cross", resolved to
+    a value the journey planner takes without disambiguation: an ICS code
+    or "lat,lon". The ``maxsize`` most recently used are kept.
+
+    Api(place_cache=...) uses it on every search, and learns from each
+    JourneyDisambiguation the places matched to a single option. Record
+    a choice from a list of options with choose(). With ``path``, the
+    cache is warmed from that JSON file when it exists, and save() writes
+    it back.
+    """
+    def __init__(self, maxsize=4096, path=None):
+        self.path = path
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, text):
+        return _PlaceName(text) in self._entries
+
+    def resolve(self, text):
+        """
+        The resolved value of ``text``, or None when it is unknown or
+        needs no resolving.
+        """
+        if text is None or _IsResolved(text):
+            return None
+        value = self._entries.get(_PlaceName(text))
+        with self._lock:
+            self.stats["misses" if value is None else "hits"] += 1
+
+        return value
+
+    def set(self, text, value):
+        self._entries.set(_PlaceName(text), value)
+
+    def choose(self, text, option):
+        """
+        Resolve ``text`` to a DisambiguationOption from now on.
+        """
+        value = option.parameterValue
+        place = option.place
+        if not value and place is not None:
+            value = place.icsCode
+            if not value and place.lat is not None:
+                value = "{0},{1}".format(place.lat, place.lon)
+        if value:
+            self.set(text, value)
+
+    def learn(self, disambiguation, _from=None, to=None, via=None):
+        """
+        Remember the places a JourneyDisambiguation for a search from
+        ``_from`` to ``to`` (via ``via``) matched to a single option.
+        """
+        for (text, location) in (
+                (_from, disambiguation.fromLocationDisambiguation),
+                (to, disambiguation.toLocationDisambiguation),
+                (via, disambiguation.viaLocationDisambiguation)):
+            if text is None or location is None or _IsResolved(text):
+                continue
+            options = location.disambiguationOptions or []
+            if options and (location.matchStatus == "identified" or
+                            len(options) == 1):
+                self.choose(text, max(
+                    options, key=lambda option: option.matchQuality or 0))
+
+    def warm(self, entries):
+        """
+        Add ``entries``, a dict or (text, value) pairs.
+        """
+        if isinstance(entries, dict):
+            entries = entries.items()
+        for (text, value) in entries:
+            self.set(text, value)
+
+    def load(self, path=None):
+        with open(path or self.path) as f:
+            self.warm(json.load(f))
+
+    def save(self, path=None):
+        """
+        Write the entries, least recently used first, to a JSON file,
+        replacing it atomically.
+        """
+        path = path or self.path
+        temporary = "{0}.{1}.tmp".format(path, os.getpid())
+        with open(temporary, "w") as f:
+            json.dump(self._entries.items(), f)
+        os.replace(temporary, path)
+
+
+def _PlaceName(text):
+    return " ".join(str(text).split()).lower()
+
+
+def _IsResolved(text):
+    # ICS codes and coordinates go to the journey planner as they are
+    text = str(text).strip()
+
+    return text.isdigit() or _COORDINATES_RE.match(text) is not None
+
+
+def cache_key(url):
+    """
+    The cache key for a request URL: the URL without the app credentials.
+    """
+    (scheme, netloc, path, params, query, fragment) = urlparse(url)
+    query = urlencode(sorted(
+        (k, v) for (k, v) in parse_qsl(query, keep_blank_values=True)
+        if k not in CREDENTIAL_PARAMS))
+
+    return urlunparse((scheme, netloc, path, params, query, fragment))
+
+
+def cache_ttl_from_headers(headers):
+    """
+    Seconds a response may be cached for according to its Cache-Control or
+    Expires headers, or ``None`` when neither says anything.
+    """
+    cache_control = headers.get("Cache-Control")
+    if cache_control:
+        directives = [d.strip().lower() for d in cache_control.split(",")]
+        if any(d in ("no-store", "no-cache", "private") for d in directives):
+            return 0
+        for directive in directives:
+            match = re.match(r"max-age\s*=\s*\"?(\d+)\"?$", directive)
+            if match:
+                return int(match.group(1))
+
+    expires = headers.get("Expires")
+    if expires:
+        expires = parsedate_tz(expires)
+        if expires is None:
+            return 0
+        date = parsedate_tz(headers.get("Date") or "")
+        now = mktime_tz(date) if date is not None else time.time()
+        return max(0, int(mktime_tz(expires) - now))
+
+    return None
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+
+class BikePointDiff(object):
+    """
+    What changed between two GetBikePoints results: the ``added`` and
+    ``removed`` points, and ``changed`` as (point, [property keys]) pairs
+    holding the newer point.
+    """
+    def __init__(self, added=None, removed=None, changed=None):
+        self.added = added or []
+        self.removed = removed or []
+        self.changed = changed or []
+
+    def __repr__(self):
+        return "BikePointDiff(Added={0}, Removed={1}, Changed={2})".format(
+            len(self.added), len(self.removed), len(self.changed))
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    __nonzero__ = __bool__
+
+
+def diff_bike_points(old, new):
+    """
+    Compare two lists of bike points by ``Point.id``, and each point's
+    additional properties by key on their ``modified`` timestamp and
+    value, in one pass over each list.
+    """
+    previous = dict((point.id, point) for point in old)
+
+    diff = BikePointDiff()
+    for point in new:
+        before = previous.pop(point.id, None)
+        if before is None:
+            diff.added.append(point)
+            continue
+        keys = _ChangedProperties(before, point)
+        if keys:
+            diff.changed.append((point, keys))
+    diff.removed = list(previous.values())
+
+    return diff
+
+
+def _ChangedProperties(before, after):
+    before = _Stamps(before)
+    after = _Stamps(after)
+    if before == after:
+        return []
+
+    keys = [key for (key, stamp) in after.items() if before.get(key) != stamp]
+    keys.extend(key for key in before if key not in after)
+
+    return keys
+
+
+def _Stamps(point):
+    return dict(
+        (prop.key, (prop.modified, prop.value))
+        for prop in point.additionalProperties or ())
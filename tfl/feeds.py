@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tfl.exceptions import TflError
+
+_now = time.monotonic
+
+
+class Feed(object):
+    """
+    The latest result of one registered call, refreshed every ``interval``
+    seconds by a FeedScheduler.
+
+    Reads never wait for a refresh: get() returns the last successful
+    result, however old. A fresh read takes no lock; a read that finds the
+    result older than ``stale_after`` briefly takes the scheduler's lock to
+    bring the next refresh forward (stale while revalidate). After a
+    failed refresh the previous result is kept,
+    ``error`` is set, and the next attempt is made ``retry_interval``
+    seconds later.
+    """
+    def __init__(self, scheduler, name, fetch, interval, stale_after=None,
+                 retry_interval=None):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.stale_after = interval if stale_after is None else stale_after
+        self.retry_interval = min(
+            interval, interval if retry_interval is None else retry_interval)
+        self.error = None
+        self.refreshes = 0
+        self.failures = 0
+        self._scheduler = scheduler
+        # (result, monotonic time it was fetched), replaced as a whole
+        self._latest = (None, None)
+        self._ready = threading.Event()
+        self._due = None
+        self._attempted = None
+        self._running = False
+        self._removed = False
+
+    def __repr__(self):
+        return "Feed(Name={0}, Interval={1}, Age={2})".format(
+            self.name, self.interval, self.age)
+
+    @property
+    def value(self):
+        return self._latest[0]
+
+    @property
+    def age(self):
+        """
+        Seconds since the current result was fetched, or None before the
+        first one.
+        """
+        updated = self._latest[1]
+
+        return None if updated is None else _now() - updated
+
+    @property
+    def stale(self):
+        age = self.age
+
+        return age is None or age > self.stale_after
+
+    def get(self, default=None):
+        """
+        The latest result, or ``default`` before the first one arrives.
+        """
+        (value, updated) = self._latest
+        if updated is None:
+            return default
+        if _now() - updated > self.stale_after:
+            self._scheduler._Revalidate(self)
+
+        return value
+
+    def wait(self, timeout=None):
+        """
+        Block until the first result arrives. Returns False on timeout.
+        """
+        return self._ready.wait(timeout)
+
+
+class FeedScheduler(object):
+    """
+    Keep the results of Api calls fresh in the background, e.g.
+
+        feeds = FeedScheduler()
+        feeds.register("bike_points", api.GetBikePoints, interval=60)
+        feeds.register("tube", lambda: api.GetLinesByMode(["tube"]), 30)
+        feeds.start()
+        ...
+        points = feeds.get("bike_points", [])
+
+    A single timer thread hands due feeds to a pool of ``max_workers``
+    threads, so a slow endpoint does not hold up the others. Each feed
+    runs at most one refresh at a time.
+    """
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._feeds = {}
+        # (due, sequence, feed); entries whose due is not the feed's
+        # current one are skipped
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor = None
+        self._thread = None
+        self._stopping = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __contains__(self, name):
+        return name in self._feeds
+
+    def __getitem__(self, name):
+        return self._feeds[name]
+
+    def __iter__(self):
+        return iter(list(self._feeds.values()))
+
+    def __len__(self):
+        return len(self._feeds)
+
+    def register(self, name, fetch, interval, stale_after=None,
+                 retry_interval=None):
+        """
+        Refresh ``fetch()`` every ``interval`` seconds, starting straight
+        away, and return its Feed.
+        """
+        if interval <= 0:
+            raise ValueError("\"interval\" must be positive")
+        feed = Feed(self, name, fetch, interval, stale_after=stale_after,
+                    retry_interval=retry_interval)
+        with self._condition:
+            if name in self._feeds:
+                raise TflError(
+                    "A feed named \"{0}\" is already registered".format(name))
+            self._feeds[name] = feed
+            self._Schedule(feed, _now())
+
+        return feed
+
+    def unregister(self, name):
+        with self._condition:
+            feed = self._feeds.pop(name, None)
+            if feed is not None:
+                feed._removed = True
+
+    def get(self, name, default=None):
+        """
+        The latest result of the feed ``name``; see Feed.get().
+        """
+        return self._feeds[name].get(default)
+
+    def refresh(self, name):
+        """
+        Refresh the feed ``name`` as soon as a worker is free.
+        """
+        with self._condition:
+            self._Schedule(self._feeds[name], _now())
+
+    def start(self):
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._thread = threading.Thread(target=self._Run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self, wait=True):
+        """
+        Stop scheduling refreshes. With ``wait``, block until those
+        already running have finished.
+        """
+        with self._condition:
+            (thread, executor) = (self._thread, self._executor)
+            self._stopping = True
+            self._thread = None
+            self._executor = None
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+            executor.shutdown(wait=wait)
+
+    def _Schedule(self, feed, due):
+        # Call with the condition held. Only ever moves a refresh earlier.
+        if feed._removed or (feed._due is not None and feed._due <= due):
+            return
+        feed._due = due
+        heapq.heappush(self._queue, (due, next(self._sequence), feed))
+        self._condition.notify()
+
+    def _Revalidate(self, feed):
+        with self._condition:
+            if not feed._running:
+                self._Schedule(feed, max(
+                    _now(), feed._attempted + feed.retry_interval))
+
+    def _Run(self):
+        with self._condition:
+            while not self._stopping:
+                now = _now()
+                while self._queue and self._queue[0][0] <= now:
+                    (due, _, feed) = heapq.heappop(self._queue)
+                    # A feed still refreshing is rescheduled when it is done
+                    if (due == feed._due and not feed._removed and
+                            not feed._running):
+                        feed._due = None
+                        feed._running = True
+                        feed._attempted = now
+                        self._executor.submit(self._Refresh, feed)
+                timeout = None
+                if self._queue:
+                    timeout = self._queue[0][0] - now
+                self._condition.wait(timeout)
+
+    def _Refresh(self, feed):
+        interval = feed.interval
+        try:
+            value = feed.fetch()
+        except Exception as error:
+            feed.error = error
+            feed.failures += 1
+            interval = feed.retry_interval
+        else:
+            feed._latest = (value, _now())
+            feed.error = None
+            feed.refreshes += 1
+            feed._ready.set()
+        finally:
+            with self._condition:
+                feed._running = False
+                due = feed._attempted + interval
+                if feed._due is not None:
+                    due = min(due, feed._due)
+                feed._due = None
+                self._Schedule(feed, due)
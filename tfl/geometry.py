@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+import json
+import re
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tfl.spatial import EARTH_RADIUS, distance
+
+# Numbers orjson writes with an exponent, or below 1e-4 without one
+_ORJSON_DIFFERS = re.compile(
+    r"(?<=[\[,])(?:-?[0-9.]+e-?[0-9]+|-?0\.0000[0-9]*)")
+
+
+class Geometry(object):
+    """
+    The lines of a route or journey path, packed into one array of floats,
+    ``lat, lon, lat, lon, ...``, with the position of each line's first
+    point in ``offsets``. That takes 16 bytes a point rather than the 130
+    or so of nested lists of floats.
+
+    Geometry read from the API is kept as the JSON text it arrived as until
+    first used, when it is parsed and the text let go. Two forms are
+    understood:
+
+    - a LineRouteSequence's ``lineStrings``: a list of strings, each
+      holding a list of lines of ``[lon, lat]`` points (every branch of
+      the route is kept), and
+    - a JourneyPath's ``lineString``: one string holding a single line of
+      ``[lat, lon]`` points.
+
+    Points are always given back as ``(lat, lon)``. toDict() gives back
+    the form the geometry was read from, encoded the same way whether or
+    not it has been parsed, and whether or not numpy and orjson are
+    installed.
+
+    Parsing publishes its result with a single assignment, so geometry
+    shared between threads can be read by any of them.
+    """
+    __slots__ = ("_source", "_origin", "_route", "_packed")
+
+    def __init__(self, lines=()):
+        self._source = None
+        self._origin = None
+        self._route = True
+        # (coordinates, offsets, lines per JSON string or None)
+        self._packed = _Pack(lines, None)
+
+    @classmethod
+    def fromJSON(cls, data):
+        """
+        Geometry over ``lineStrings`` (a list) or ``lineString`` (a
+        string), parsed when first used.
+        """
+        geometry = cls.__new__(cls)
+        geometry._source = data
+        geometry._origin = None
+        geometry._route = isinstance(data, list)
+        geometry._packed = None
+
+        return geometry
+
+    @classmethod
+    def from_polylines(cls, polylines, precision=5):
+        """
+        Geometry over encoded polylines, one per line.
+        """
+        return cls(_DecodePolyline(text, precision) for text in polylines)
+
+    def __repr__(self):
+        return "Geometry(Lines={0}, Points={1})".format(
+            len(self), self.points)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        """
+        Line number ``index`` as a list of ``(lat, lon)`` points.
+        """
+        (coordinates, offsets, _) = self._Packed()
+        if index < 0:
+            index += len(offsets) - 1
+        if not 0 <= index < len(offsets) - 1:
+            raise IndexError("geometry index out of range")
+        values = coordinates[2 * offsets[index]:2 * offsets[index + 1]]
+
+        return list(zip(values[0::2], values[1::2]))
+
+    def __eq__(self, other):
+        if not isinstance(other, Geometry):
+            return NotImplemented
+
+        (coordinates, offsets, _) = self._Packed()
+        (other_coordinates, other_offsets, _) = other._Packed()
+
+        return (offsets == other_offsets and
+                coordinates == other_coordinates)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+
+        return not equal
+
+    def __hash__(self):
+        (coordinates, offsets, _) = self._Packed()
+
+        return hash((offsets.tobytes(), coordinates.tobytes()))
+
+    @property
+    def coordinates(self):
+        """
+        Every point of every line as ``array("d", [lat, lon, ...])``.
+        """
+        return self._Packed()[0]
+
+    @property
+    def offsets(self):
+        """
+        The index of the first point of each line, then the point count.
+        """
+        return self._Packed()[1]
+
+    @property
+    def points(self):
+        return len(self.coordinates) // 2
+
+    def bounds(self):
+        """
+        ``(south, west, north, east)`` of every point, or None when there
+        are none.
+        """
+        coordinates = self.coordinates
+        if not coordinates:
+            return None
+        (lat, lon) = (coordinates[0::2], coordinates[1::2])
+
+        return (min(lat), min(lon), max(lat), max(lon))
+
+    def lengths(self):
+        """
+        The great-circle length in metres of each line.
+        """
+        (coordinates, offsets, _) = self._Packed()
+        if numpy is None:
+            lengths = []
+            for (start, end) in zip(offsets, offsets[1:]):
+                lengths.append(sum(
+                    distance(*coordinates[2 * i:2 * i + 4])
+                    for i in range(start, end - 1)))
+            return lengths
+
+        if len(coordinates) < 4:
+            return [0.0] * (len(offsets) - 1)
+        points = numpy.radians(
+            numpy.frombuffer(coordinates, dtype=numpy.float64)).reshape(-1, 2)
+        (lat, lon) = (points[:, 0], points[:, 1])
+        a = (numpy.sin(numpy.diff(lat) / 2) ** 2 +
+             numpy.cos(lat[:-1]) * numpy.cos(lat[1:]) *
+             numpy.sin(numpy.diff(lon) / 2) ** 2)
+        # Running total over every segment, including those joining one
+        # line to the next, which the subtraction below leaves out
+        total = numpy.concatenate(([0.0], numpy.cumsum(
+            2 * EARTH_RADIUS * numpy.arcsin(
+                numpy.sqrt(numpy.minimum(a, 1.0))))))
+        starts = numpy.frombuffer(offsets, dtype=numpy.int64)
+        ends = numpy.maximum(starts[1:] - 1, starts[:-1])
+
+        return (total[ends] - total[starts[:-1]]).tolist()
+
+    def length(self):
+        """
+        The great-circle length in metres of every line together.
+        """
+        return sum(self.lengths())
+
+    def polyline(self, index=0, precision=5):
+        """
+        Line number ``index`` as an encoded polyline.
+        """
+        return _EncodePolyline(self[index], precision)
+
+    def polylines(self, precision=5):
+        return [_EncodePolyline(line, precision) for line in self]
+
+    def toDict(self):
+        (coordinates, offsets, groups) = self._Packed()
+        if not self._route:
+            return _Dumps(coordinates, 0, offsets[-1], False)
+        strings = []
+        line = 0
+        for count in groups or [len(offsets) - 1]:
+            strings.append("[{0}]".format(",".join(
+                _Dumps(coordinates, offsets[i], offsets[i + 1], True)
+                for i in range(line, line + count))))
+            line += count
+
+        return strings
+
+    def _Packed(self):
+        packed = self._packed
+        if packed is None:
+            # Threads racing here each parse the same text; whichever
+            # assignment lands last is equal to the others
+            source = self._source
+            if source is None:
+                # Parsed by another thread since _packed was read
+                return self._packed
+            if self._route:
+                groups = [json.loads(text) for text in source]
+                packed = _Pack(
+                    [[(p[1], p[0]) for p in line]
+                     for group in groups for line in group],
+                    [len(group) for group in groups])
+            else:
+                packed = _Pack(
+                    [[(p[0], p[1]) for p in json.loads(source)]], None)
+            self._origin = _Hash(source)
+            self._packed = packed
+            # The text is not needed once parsed. A reader that saw
+            # _packed as None still holds its own reference to it.
+            self._source = None
+
+        return packed
+
+    def _ReadFrom(self, data):
+        # Whether this was read from the JSON ``data``, remembered by hash
+        # once the text has gone
+        if self._source is data:
+            return True
+
+        return self._origin is not None and self._origin == _Hash(data)
+
+
+def _Hash(data):
+    # Strings keep their hash, so this is cheap for text already hashed
+    return hash(tuple(data) if isinstance(data, list) else data)
+
+
+def _Pack(lines, groups):
+    coordinates = array("d")
+    offsets = array("q", [0])
+    for line in lines:
+        for (lat, lon) in line:
+            coordinates.append(lat)
+            coordinates.append(lon)
+        offsets.append(len(coordinates) // 2)
+
+    return (coordinates, offsets, groups)
+
+
+def _Dumps(coordinates, start, end, swap):
+    # Compact JSON of the points from ``start`` to ``end``, as [lon, lat]
+    # with ``swap``, with floats written as repr() writes them whichever
+    # of numpy and orjson are installed
+    if numpy is None:
+        values = coordinates[2 * start:2 * end]
+        (first, second) = (values[0::2], values[1::2])
+        if swap:
+            (first, second) = (second, first)
+        return json.dumps(
+            [[a, b] for (a, b) in zip(first, second)], separators=(",", ":"))
+
+    points = numpy.frombuffer(
+        coordinates, dtype=numpy.float64)[2 * start:2 * end].reshape(-1, 2)
+    if swap:
+        points = numpy.ascontiguousarray(points[:, ::-1])
+    if orjson is None:
+        return json.dumps(points.tolist(), separators=(",", ":"))
+
+    # orjson picks the same shortest digits as repr() but switches to and
+    # from exponents at other magnitudes (0.00005 for 5e-05, 1e16 for
+    # 1e+16), so the numbers it writes either way are written again
+    text = orjson.dumps(points, option=orjson.OPT_SERIALIZE_NUMPY).decode(
+        "utf-8")
+    if "e" in text or "0.0000" in text:
+        text = _ORJSON_DIFFERS.sub(
+            lambda match: repr(float(match.group(0))), text)
+
+    return text
+
+
+def _EncodePolyline(points, precision):
+    factor = 10 ** precision
+    characters = []
+    previous = (0, 0)
+    for point in points:
+        current = tuple(int(round(value * factor)) for value in point)
+        for (value, before) in zip(current, previous):
+            value -= before
+            value = ~(value << 1) if value < 0 else value << 1
+            while value >= 0x20:
+                characters.append(chr((0x20 | (value & 0x1f)) + 63))
+                value >>= 5
+            characters.append(chr(value + 63))
+        previous = current
+
+    return "".join(characters)
+
+
+def _DecodePolyline(text, precision):
+    factor = float(10 ** precision)
+    values = []
+    (value, shift, total) = (0, 0, [0, 0])
+    for character in text:
+        byte = ord(character) - 63
+        value |= (byte & 0x1f) << shift
+        shift += 5
+        if byte < 0x20:
+            index = len(values) % 2
+            total[index] += ~(value >> 1) if value & 1 else value >> 1
+            values.append(total[index] / factor)
+            (value, shift) = (0, 0)
+
+    return list(zip(values[0::2], values[1::2]))
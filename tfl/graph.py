@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+import heapq
+from collections import OrderedDict
+
+
+class StationGraph(object):
+    """
+    A network of stations built from LineRouteSequence results, answering
+    shortest-path and reachability queries without calling the API, e.g.
+
+        graph = StationGraph(
+            api.GetLineRouteSequence(line, "outbound", None, True)
+            for line in ["central", "northern", "victoria"])
+        graph.shortest_path("940GZZLUBNK", "940GZZLUOXC")
+
+    Each stop on each line is a node. Consecutive stops along a route are
+    joined at a cost of one stop. All the nodes of a station (every
+    line, and every stop of an interchange hub sharing a topMostParentId)
+    are joined at ``interchange_cost``. Stations may be named by stop,
+    station, hub or ICS ID. With ``bidirectional``, loading one direction
+    of a line is enough to travel both ways.
+
+    The shortest-path tree of the ``cache_size`` most recent origins is
+    kept, so repeat queries from an origin are dictionary lookups.
+    """
+    def __init__(self, sequences=(), interchange_cost=2.0,
+                 bidirectional=True, cache_size=256):
+        self.interchange_cost = interchange_cost
+        self.bidirectional = bidirectional
+        self.cache_size = cache_size
+        # Stop model by station key (None for a stop only named in an
+        # ordered route), station key by any of its IDs
+        self.stations = {}
+        self._aliases = {}
+        # Nodes are (stop ID, line ID): {node: {neighbour: cost}}
+        self._edges = {}
+        self._nodes = {}
+        self._trees = OrderedDict()
+        for sequence in sequences:
+            self.add(sequence)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def __contains__(self, station):
+        return self.station(station) is not None
+
+    def station(self, station):
+        """
+        The key the graph knows ``station`` by, or None.
+        """
+        return self._aliases.get(station)
+
+    def lines(self, station):
+        """
+        The IDs of the lines serving ``station``.
+        """
+        key = self.station(station)
+
+        return set(line for (_, line) in self._nodes.get(key, ()))
+
+    def add(self, sequence):
+        """
+        Add the stops and routes of a LineRouteSequence.
+        """
+        line = sequence.lineId
+        first = {}
+        last = {}
+        for stops in sequence.stopPointSequences or ():
+            points = stops.stopPoint or []
+            for point in points:
+                self._AddStop(point)
+            self._AddRoute(line, [point.id for point in points])
+            if points:
+                first[stops.branchId] = points[0].id
+                last[stops.branchId] = points[-1].id
+        # Join branches where one carries on into the next
+        for stops in sequence.stopPointSequences or ():
+            for branch in stops.nextBranchIds or ():
+                if stops.branchId in last and branch in first:
+                    self._AddRoute(
+                        line, [last[stops.branchId], first[branch]])
+        for route in sequence.orderedLineRoutes or ():
+            self._AddRoute(line, route.naptanIds or [])
+        self._trees.clear()
+
+    def cost(self, origin, destination):
+        """
+        The lowest cost from ``origin`` to ``destination``, or None when
+        it cannot be reached.
+        """
+        (costs, _, _) = self._Tree(origin)
+
+        return costs.get(self.station(destination))
+
+    def reachable(self, origin, max_cost=None):
+        """
+        ``{station: lowest cost}`` of every station reachable from
+        ``origin`` at no more than ``max_cost``.
+        """
+        (costs, _, _) = self._Tree(origin)
+        if max_cost is None:
+            return dict(costs)
+
+        return dict(
+            (station, cost) for (station, cost) in costs.items()
+            if cost <= max_cost)
+
+    def connected(self, origin, destination):
+        return self.cost(origin, destination) is not None
+
+    def shortest_path(self, origin, destination):
+        """
+        ``(cost, [(stop ID, line ID), ...])`` of a cheapest route from
+        ``origin`` to ``destination``, changing line wherever the line ID
+        changes, or None when there is none.
+        """
+        (costs, ends, previous) = self._Tree(origin)
+        key = self.station(destination)
+        if key not in costs:
+            return None
+        node = ends[key]
+        path = [node]
+        while previous.get(node) is not None:
+            node = previous[node]
+            path.append(node)
+        path.reverse()
+
+        return (costs[key], path)
+
+    def _AddStop(self, point):
+        key = point.topMostParentId or point.stationId or point.id
+        if self.stations.get(key) is None:
+            self.stations[key] = point
+        for alias in (point.id, point.stationId, point.topMostParentId,
+                      point.icsId):
+            if not alias:
+                continue
+            current = self._aliases.setdefault(alias, key)
+            if current != key and self.stations.get(current) is None:
+                # A stop first seen in an ordered route, now known to
+                # belong to ``key``
+                self._Merge(current, key)
+
+    def _Merge(self, placeholder, key):
+        # Move the aliases and nodes of a placeholder station to ``key``,
+        # joining the nodes to those already there
+        del self.stations[placeholder]
+        for (alias, current) in list(self._aliases.items()):
+            if current == placeholder:
+                self._aliases[alias] = key
+        others = self._nodes.setdefault(key, [])
+        for node in self._nodes.pop(placeholder, ()):
+            for other in others:
+                self._edges[node][other] = self.interchange_cost
+                self._edges[other][node] = self.interchange_cost
+            others.append(node)
+
+    def _AddRoute(self, line, stops):
+        for stop in stops:
+            if stop not in self._aliases:
+                self._aliases[stop] = stop
+                self.stations.setdefault(stop, None)
+        for (a, b) in zip(stops, stops[1:]):
+            if a == b:
+                continue
+            self._Join((a, line), (b, line), 1.0)
+            if self.bidirectional:
+                self._Join((b, line), (a, line), 1.0)
+
+    def _Join(self, a, b, cost):
+        for node in (a, b):
+            if node not in self._edges:
+                self._edges[node] = {}
+                self._AddNode(node)
+        if cost < self._edges[a].get(b, float("inf")):
+            self._edges[a][b] = cost
+
+    def _AddNode(self, node):
+        # Interchange edges to every other node of the same station
+        key = self._aliases[node[0]]
+        others = self._nodes.setdefault(key, [])
+        for other in others:
+            self._edges[node][other] = self.interchange_cost
+            self._edges[other][node] = self.interchange_cost
+        others.append(node)
+
+    def _Tree(self, origin):
+        # (lowest cost by station, cheapest node reached by station,
+        # previous node by node) from Dijkstra over every node of origin
+        key = self.station(origin)
+        tree = self._trees.pop(key, None)
+        if tree is None:
+            tree = self._Dijkstra(key)
+        self._trees[key] = tree
+        while len(self._trees) > self.cache_size:
+            self._trees.popitem(last=False)
+
+        return tree
+
+    def _Dijkstra(self, key):
+        best = {}
+        previous = {}
+        heap = [(0.0, i, node, None)
+                for (i, node) in enumerate(self._nodes.get(key, ()))]
+        counter = len(heap)
+        while heap:
+            (cost, _, node, before) = heapq.heappop(heap)
+            if node in best:
+                continue
+            best[node] = cost
+            previous[node] = before
+            for (neighbour, step) in self._edges[node].items():
+                if neighbour not in best:
+                    counter += 1
+                    heapq.heappush(
+                        heap, (cost + step, counter, neighbour, node))
+
+        costs = {}
+        ends = {}
+        for (node, cost) in best.items():
+            station = self._aliases[node[0]]
+            if station not in costs or cost < costs[station]:
+                costs[station] = cost
+                ends[station] = node
+
+        return (costs, ends, previous)
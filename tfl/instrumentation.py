@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+import bisect
+import contextvars
+import threading
+import time
+
+# Where the time of one call goes: building the URL, the network (cache,
+# coalescing, retries and reading the body included), decoding the JSON,
+# and building models from it. A streamed body is read while it is decoded.
+PHASES = ("url", "network", "decode", "build")
+
+# Upper bounds, in seconds, of the histogram buckets: 1us doubling to ~67s
+BUCKETS = tuple(2 ** i / 1e6 for i in range(27))
+
+# The timing of the call in progress on this thread or task
+_current = contextvars.ContextVar("tfl_request_timing", default=None)
+
+
+class RequestTiming(object):
+    """
+    How long each phase of one Api call took, the size of the response
+    body in bytes (None when streamed), the number of top-level models it
+    produced, and the exception it failed with, if any.
+    """
+    __slots__ = ("endpoint", "url", "seconds", "bytes", "objects", "error",
+                 "_last")
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.url = None
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.bytes = None
+        self.objects = 0
+        self.error = None
+        self._last = time.perf_counter()
+
+    def __repr__(self):
+        return "RequestTiming(Endpoint={0}, Total={1:.6f})".format(
+            self.endpoint, self.total)
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+    def mark(self, phase):
+        """
+        Add the time since the previous mark to ``phase``.
+        """
+        now = time.perf_counter()
+        self.seconds[phase] += now - self._last
+        self._last = now
+
+    def skip(self):
+        """
+        Leave the time since the previous mark out of every phase.
+        """
+        self._last = time.perf_counter()
+
+
+class LatencyHistogram(object):
+    """
+    Counts of durations in buckets doubling from 1us, so percentiles come
+    out within a factor of two in fixed memory.
+    """
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        The upper bound of the bucket holding the ``percent`` percentile.
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for (bucket, count) in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank and bucket < len(BUCKETS):
+                return min(self.max, BUCKETS[bucket])
+
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class Instrumentation(object):
+    """
+    Per-endpoint latency histograms of each phase of an Api call, with
+    body sizes and model counts, e.g.
+
+        instrumentation = Instrumentation()
+        api = Api(app_id, app_key, instrumentation=instrumentation)
+        ...
+        instrumentation.summary()["GetBikePoints"]["build"]["p95"]
+
+    Endpoints are named after the Api method called. Each ``hooks``
+    callable, and any added with add_hook(), is called with the
+    RequestTiming of every call as it completes. An Api without
+    instrumentation does no timing at all.
+    """
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def record(self, timing):
+        with self._lock:
+            endpoint = self._endpoints.get(timing.endpoint)
+            if endpoint is None:
+                endpoint = self._endpoints[timing.endpoint] = _Endpoint()
+            endpoint.add(timing)
+        for hook in self.hooks:
+            hook(timing)
+
+    def summary(self):
+        """
+        ``{endpoint: {"requests", "errors", "bytes", "objects", phase:
+        histogram summary, ..., "total": histogram summary}}``, failed
+        calls included.
+        """
+        with self._lock:
+            return dict(
+                (name, endpoint.summary())
+                for (name, endpoint) in self._endpoints.items())
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+class _Endpoint(object):
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.objects = 0
+        self.phases = dict(
+            (phase, LatencyHistogram()) for phase in PHASES + ("total",))
+
+    def add(self, timing):
+        self.requests += 1
+        if timing.error is not None:
+            self.errors += 1
+        self.bytes += timing.bytes or 0
+        self.objects += timing.objects
+        for (phase, seconds) in timing.seconds.items():
+            self.phases[phase].add(seconds)
+        self.phases["total"].add(timing.total)
+
+    def summary(self):
+        summary = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "objects": self.objects,
+        }
+        for (phase, histogram) in self.phases.items():
+            summary[phase] = histogram.summary()
+
+        return summary
+
+
+def start_timing(endpoint):
+    """
+    Start timing a call and make it the current one until finish_timing().
+    """
+    timing = RequestTiming(endpoint)
+    _current.set(timing)
+
+    return timing
+
+
+def current_timing():
+    return _current.get()
+
+
+def finish_timing(instrumentation, timing, parsed=None, error=None):
+    """
+    Count the models in ``parsed``, note the ``error`` the call failed
+    with, and hand ``timing`` to ``instrumentation``.
+    """
+    timing.error = error
+    if parsed is not None:
+        timing.objects = len(parsed) if isinstance(parsed, list) else 1
+    if _current.get() is timing:
+        _current.set(None)
+    instrumentation.record(timing)
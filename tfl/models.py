@@ -1,85 +1,513 @@
 # -*- coding: utf-8 -*-
-from __future__ import unicode_literals
 
-from dateutil import parser
 import json
+import keyword
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tfl.geometry import Geometry
+from tfl.utils import timestamp_to_seconds, timestamps_to_seconds
+
+
+class _Lazy(object):
+    """
+    A nested value that has not been built yet: ``function(*args)``.
+    """
+    __slots__ = ("function", "args")
+
+    def __init__(self, function, *args):
+        self.function = function
+        self.args = args
+
+
+class _LazySlot(object):
+    """
+    Wraps the slot of a field listed in ``lazy_fields``. A stored _Lazy is
+    built on first access and replaced by its result.
+    """
+    def __init__(self, slot):
+        self._slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self._slot.__get__(instance, owner)
+        if isinstance(value, _Lazy):
+            value = value.function(*value.args)
+            self._slot.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self._slot.__delete__(instance)
+
+
+class _Seconds(object):
+    """
+    Seconds since the epoch of the timestamp in ``field``, parsed once per
+    instance and kept until the field is given a new value.
+    """
+    def __init__(self, field):
+        self._field = field
+        self._cache = "_{0}_seconds".format(field)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self._field)
+        cached = instance.__dict__.get(self._cache)
+        if cached is None or cached[0] != value:
+            cached = (value, timestamp_to_seconds(value))
+            instance.__dict__[self._cache] = cached
+
+        return cached[1]
+
+
+def epoch_seconds(models, field):
+    """
+    Seconds since the epoch of the timestamp in ``field`` for each of
+    ``models``, e.g. epoch_seconds(point.additionalProperties, "modified").
+    """
+    return timestamps_to_seconds([getattr(m, field) for m in models])
+
+
+class _ModelMeta(type):
+    """
+    Gives every model a ``__slots__`` entry per field in its class-level
+    ``defaults``, so field values live in the instance rather than in a
+    per-instance ``__dict__``.
+    """
+    def __new__(mcs, name, bases, namespace):
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(namespace.get("defaults", ()))
+
+        cls = super(_ModelMeta, mcs).__new__(mcs, name, bases, namespace)
+        for field in namespace.get("lazy_fields", ()):
+            setattr(cls, field, _LazySlot(cls.__dict__[field]))
+
+        # (attribute, JSON key, default) for each field, worked out once
+        json_keys = getattr(cls, "json_keys", {})
+        cls._fields = tuple(
+            (param, json_keys.get(param, param), default)
+            for (param, default) in getattr(cls, "defaults", {}).items())
+        # The slot behind each field, for writes that skip a _LazySlot
+        cls._slots = dict(
+            (param, _Slot(cls, param)) for (param, _, _) in cls._fields)
+        identity = getattr(cls, "identity_fields", ())
+        cls._identity = tuple(f for f in identity if f in cls._slots)
+        if "fromJSON" not in namespace and "defaults" in namespace:
+            cls.fromJSON = classmethod(_build_first)
+
+        return cls
+
+
+def _Slot(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            slot = klass.__dict__[name]
+            return slot._slot if isinstance(slot, _LazySlot) else slot
+
+
+def _build_first(cls, data, lazy=False, **kwargs):
+    # Nested models may be declared further down the module, so builders
+    # are compiled on first use rather than with the class.
+    return _compile(cls)(cls, data, lazy, **kwargs)
+
+
+def _compile(cls):
+    """
+    Compile ``fromJSON(cls, data, lazy=False, **kwargs)`` for a model, which
+    fills each field of a new instance from ``data`` (``kwargs`` take
+    precedence) with one straight line of code per field and builds the
+    models in ``nested`` inline, instead of copying ``data`` and looping
+    over ``defaults``.
+
+    Nested models are built by the ``_plain(data)`` compiled alongside,
+    the eager body on its own, which saves the keyword arguments and
+    branches of a full fromJSON call for every nested object.
+    """
+    namespace = {"new": object.__new__, "Lazy": _Lazy, "build": _build,
+                 "geometry": Geometry.fromJSON, "cls": cls}
+    eager = []
+    lazy = []
+    overridden = []
+    for (index, (param, key, default)) in enumerate(cls._fields):
+        namespace["d{0}".format(index)] = default
+        get = "get({0!r}, d{1})".format(key, index)
+        model = cls.nested.get(param)
+        if model is not None and model is not list:
+            model = globals()[model]
+            if "_build" not in model.__dict__ and getattr(
+                    model.__dict__.get("fromJSON"), "__func__",
+                    None) is _build_first:
+                _compile(model)
+            namespace["f{0}".format(index)] = model.fromJSON
+            namespace["p{0}".format(index)] = _plain_builder(model)
+
+        if param in cls.lazy_fields:
+            # Write to the slot itself, skipping the _LazySlot wrapper
+            namespace["s{0}".format(index)] = cls._slots[param].__set__
+            target = "s{0}(c, {{0}})".format(index)
+        elif param.isidentifier() and not keyword.iskeyword(param):
+            target = "c.{0} = {{0}}".format(param)
+        else:
+            target = "setattr(c, {0!r}, {{0}})".format(param)
+
+        if param in cls.geometry_fields:
+            fill = ["v = get({0!r})".format(key), target.format(
+                "d{0} if v is None else geometry(v)".format(index))]
+            eager.append(fill)
+            lazy.append(fill)
+        elif model is None:
+            fill = [target.format(get)]
+            eager.append(fill)
+            lazy.append(fill)
+        else:
+            value = "v = get({0!r})".format(key)
+            if model is list:
+                built = "list(v)"
+                eager.append([value, target.format(
+                    "d{0} if v is None else {1}".format(index, built))])
+                lazy.append(eager[-1])
+            else:
+                built = ("[p{0}(x) for x in v] if v.__class__ is list "
+                         "else p{0}(v)").format(index)
+                eager.append([value, target.format(
+                    "d{0} if v is None else {1}".format(index, built))])
+                if param in cls.lazy_fields:
+                    built = "Lazy(build, f{0}, v, True)".format(index)
+                else:
+                    built = "build(f{0}, v, True)".format(index)
+                lazy.append([value, target.format(
+                    "d{0} if v is None else {1}".format(index, built))])
+
+        overridden.append(
+            ["if {0!r} in kwargs:".format(param),
+             "    " + target.format("kwargs[{0!r}]".format(param)),
+             "elif lazy:"] +
+            ["    " + line for line in lazy[-1]] +
+            ["else:"] +
+            ["    " + line for line in eager[-1]])
+
+    def body(blocks):
+        return ["        " + line
+                for block in blocks for line in block] or ["        pass"]
+
+    source = "\n".join(
+        ["def fromJSON(cls, data, lazy=False, **kwargs):",
+         "    c = new(cls)",
+         "    get = data.get",
+         "    if kwargs:"] + body(overridden) +
+        ["    elif lazy:"] + body(lazy) +
+        ["    else:"] + body(eager) +
+        ["    c._json = data if cls.keep_json else None",
+         "    return c",
+         "",
+         "def plain(data):",
+         "    c = new(cls)",
+         "    get = data.get"] +
+        ["    " + line for block in eager for line in block] +
+        ["    c._json = data if cls.keep_json else None",
+         "    return c"])
+    exec(source, namespace)
+
+    cls._build = staticmethod(namespace["fromJSON"])
+    cls._plain = staticmethod(namespace["plain"])
+    if getattr(cls.__dict__.get("fromJSON"), "__func__",
+               None) is _build_first:
+        cls.fromJSON = classmethod(cls._build)
+
+    return cls._build
+
+
+def _plain_builder(model):
+    # A one-argument builder for ``model``: its compiled _plain, unless
+    # fromJSON has been replaced or ``model`` is still being compiled
+    # (models nested in each other)
+    plain = model.__dict__.get("_plain")
+    build = model.__dict__.get("_build")
+    if (plain is None or
+            getattr(model.fromJSON, "__func__", None) is not build.__func__):
+        return model.fromJSON
+
+    return plain.__func__
+
+
+def _compile_to_dict(cls):
+    """
+    Compile ``toDict(self)`` for a model: one read per field, with plain
+    values passed straight through and only lists, sets, tuples and
+    models going through _Plain().
+    """
+    namespace = {"plain": _Plain, "passthrough": _PASSTHROUGH}
+    lines = ["def toDict(self):"]
+    items = []
+    for (index, (param, _, _)) in enumerate(cls._fields):
+        if param.isidentifier() and not keyword.iskeyword(param):
+            lines.append("    v{0} = self.{1}".format(index, param))
+        else:
+            lines.append("    v{0} = getattr(self, {1!r})".format(
+                index, param))
+        items.append(
+            "        {0!r}: v{1} if v{1}.__class__ in passthrough "
+            "else plain(v{1}),".format(param, index))
+    lines.extend(["    return {"] + items + ["    }"])
+    exec("\n".join(lines), namespace)
+
+    to_dict = namespace["toDict"]
+    if "toDict" not in cls.__dict__:
+        cls.toDict = to_dict
+
+    return to_dict
+
+
+_PASSTHROUGH = frozenset(
+    [str, bytes, int, float, bool, type(None), dict])
+
+
+def _Plain(value):
+    if isinstance(value, (list, set, tuple)):
+        return [_Plain(v) for v in value]
+    if getattr(value, "toDict", None):
+        return value.toDict()
+
+    return value
+
+
+def _compile_unmodified(cls):
+    """
+    Compile ``unmodified(self, data)`` for a model: whether it still holds
+    exactly what fromJSON read from ``data`` (the same objects for plain
+    fields, equal lists, unmodified nested models), without building any
+    unbuilt lazy fields.
+    """
+    namespace = {"Lazy": _Lazy, "nested": _UnmodifiedNested,
+                 "geometry": _UnmodifiedGeometry}
+    lines = ["def unmodified(self, data):",
+             "    if data.__class__ is not dict:",
+             "        return False",
+             "    get = data.get"]
+    for (index, (param, key, default)) in enumerate(cls._fields):
+        namespace["d{0}".format(index)] = default
+        namespace["g{0}".format(index)] = cls._slots[param].__get__
+        lines.append("    v = g{0}(self)".format(index))
+        lines.append("    r = get({0!r}, d{1})".format(key, index))
+        kind = cls.nested.get(param)
+        if param in cls.geometry_fields:
+            lines.append("    if v is not r and not geometry(v, r):")
+        elif kind is None:
+            lines.append("    if v is not r:")
+        elif kind is list:
+            lines.append("    if v is not r and v != r:")
+        else:
+            lines.append("    if v is not r and not (")
+            lines.append("            v.__class__ is Lazy and v.args[1] is r"
+                         " or nested(v, r)):")
+        lines.append("        return False")
+    lines.append("    return True")
+    exec("\n".join(lines), namespace)
+
+    cls._unmodified = staticmethod(namespace["unmodified"])
+
+    return cls._unmodified
+
+
+def _UnmodifiedNested(value, raw):
+    if value is None or raw is None:
+        return False
+    if value.__class__ is list:
+        if raw.__class__ is not list or len(value) != len(raw):
+            return False
+        for (item, raw_item) in zip(value, raw):
+            if not _Unmodified(item, raw_item):
+                return False
+        return True
+
+    return _Unmodified(value, raw)
+
+
+def _UnmodifiedGeometry(value, raw):
+    return value.__class__ is Geometry and value._ReadFrom(raw)
+
+
+def _Unmodified(model, data):
+    check = type(model).__dict__.get("_unmodified")
+    if check is None:
+        check = _compile_unmodified(type(model))
+
+    return check(model, data)
+
+
+def dumps(data):
+    """
+    Encode ``data`` as compact, key-sorted UTF-8 JSON bytes with orjson
+    when it is installed, or the json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
 
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"),
+        ensure_ascii=False).encode("utf-8")
 
-class TflModel(object):
+
+def _build(fromJSON, data, lazy=False):
+    if isinstance(data, list):
+        return [fromJSON(item, lazy) for item in data]
+
+    return fromJSON(data, lazy)
+
+
+class _ModelBase(metaclass=_ModelMeta):
+    # "__dict__" keeps attributes outside ``defaults`` assignable; the dict
+    # is only allocated for instances that actually use one.
+    __slots__ = ("_json", "_hash", "__dict__")
+
+
+def _Hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_Hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted(
+            ((k, _Hashable(v)) for (k, v) in value.items()),
+            key=lambda item: item[0]))
+    if isinstance(value, set):
+        return frozenset(value)
+
+    return value
+
+
+class TflModel(_ModelBase):
+
+    # The fields of a model and their default values, shared by every
+    # instance of the class.
+    defaults = {}
+
+    # JSON keys for fields whose attribute name differs from the key.
+    json_keys = {}
+
+    # Fields holding other models, mapped to the model's class name, or to
+    # ``list`` for a list of plain values. A JSON list gives a list of models.
+    nested = {}
+
+    # Fields that fromJSON(data, lazy=True) leaves unbuilt until first read.
+    lazy_fields = ()
+
+    # Fields holding route or path geometry as JSON text, read into a
+    # Geometry that packs the points into a float array on first use.
+    geometry_fields = ()
+
+    # Fields that tell instances apart on their own; __eq__ compares these
+    # first. Fields a model does not have are skipped.
+    identity_fields = ("id",)
+
+    # Keep a reference to the source JSON on ``_json`` for each instance
+    # built by fromJSON. Off by default, as it keeps the whole payload alive.
+    keep_json = False
 
     def __init__(self, **kwargs):
-        self.defaults = {}
+        for (param, key, default) in self._fields:
+            setattr(self, param, kwargs.get(param, kwargs.get(key, default)))
+        self._json = None
 
     def __str__(self):
         return self.toString()
 
     def __eq__(self, other):
-        return other and self.toDict() == other.toDict()
+        if self is other:
+            return True
+        if not isinstance(other, TflModel):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        for field in self._identity:
+            if getattr(self, field) != getattr(other, field):
+                return False
+        # Only compare content hashes that have already been worked out
+        mine = getattr(self, "_hash", None)
+        theirs = getattr(other, "_hash", None)
+        if mine is not None and theirs is not None and mine != theirs:
+            return False
+        for (param, _, _) in self._fields:
+            if getattr(self, param) != getattr(other, param):
+                return False
+
+        return True
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+
+        return not equal
+
+    def __hash__(self):
+        """
+        A hash of every field, nested models and lists included, worked out
+        on first use and then kept: a model must not be changed once it has
+        been hashed, e.g. by going into a set or being used as a dict key.
+        """
+        value = getattr(self, "_hash", None)
+        if value is None:
+            value = hash((type(self).__name__,) + tuple(
+                _Hashable(getattr(self, param))
+                for (param, _, _) in self._fields))
+            self._hash = value
+
+        return value
 
     def toString(self):
         return json.dumps(self.toDict(), sort_keys=True)
 
     def toDict(self):
-        data = {}
-        for (key, _) in self.defaults.items():
-            if isinstance(getattr(self, key, None), (list, set, tuple)):
-                data[key] = []
-                for sub in getattr(self, key, None):
-                    if getattr(sub, "toDict", None):
-                        data[key].append(sub.toDict())
-                    else:
-                        data[key].append(sub)
-
-            elif getattr(getattr(self, key, None), "toDict", None):
-                data[key] = getattr(self, key).toDict()
+        # Compiled for the class on first use, which then replaces this
+        return _compile_to_dict(type(self))(self)
 
-            elif hasattr(self, key):
-                data[key] = getattr(self, key, None)
+    def toJSON(self, original=False):
+        """
+        The model as UTF-8 JSON bytes. With ``original``, a model built by
+        fromJSON with ``keep_json`` on that has not been changed since
+        gives back its source payload, unknown keys included.
+        """
+        if (original and self._json is not None and
+                _Unmodified(self, self._json)):
+            return dumps(self._json)
 
-        return data
+        return dumps(self.toDict())
 
     @classmethod
-    def fromJSON(cls, data, **kwargs):
-        json_data = data.copy()
-        if kwargs:
-            for k, v in kwargs.items():
-                json_data[k] = v
-
-        c = cls(**json_data)
-        c._json = data
+    def fromJSON(cls, data, lazy=False, **kwargs):
+        # Fill the slots straight from ``data`` (with ``kwargs`` taking
+        # precedence) rather than copying it into constructor arguments.
+        build = cls.__dict__.get("_build") or _compile(cls)
 
-        return c
+        return build(cls, data, lazy, **kwargs)
 
 
 class Casualty(TflModel):
 
-    def __init___(self, **kwargs):
-        self.defaults = {
-            "age": 0,
-            "class": None,
-            "severity": None,
-            "mode": None,
-            "ageBand": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "age": 0,
+        "class": None,
+        "severity": None,
+        "mode": None,
+        "ageBand": None
+    }
 
     def __repr__(self):
         return "Casualty(Age={0})".format(self.age)
 
 
 class AccidentVehicle(TflModel):
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "type": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "type": None
+    }
 
     def __repr__(self):
         return "AccidentVehicle(Type={0})".format(self.type)
@@ -87,60 +515,42 @@ class AccidentVehicle(TflModel):
 
 class Accident(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "lat": None,
-            "lon": None,
-            "date": None,
-            "severity": None,
-            "borough": None,
-            "casualties": None,
-            "vehicles": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "lat": None,
+        "lon": None,
+        "date": None,
+        "severity": None,
+        "borough": None,
+        "casualties": None,
+        "vehicles": None
+    }
+
+    nested = {
+        "casualties": "Casualty",
+        "vehicles": "AccidentVehicle"
+    }
 
     def __repr__(self):
         return "Accident(ID={0}, Severity={1})".format(self.id, self.severity)
 
-    @property
-    def date_in_seconds(self):
-        return int(parser.parse(self.date).strftime("%s"))
-
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        casualties = None
-        vehicles = None
-
-        if 'casualties' in data:
-            casualties = [Casualty.fromJSON(c) for c in data['casualties']]
-        if 'vehicles' in data:
-            vehicles = [AccidentVehicle.fromJSON(v) for v in data['vehicles']]
-
-        return super(cls, cls).fromJSON(
-            data=data, casualties=casualties, vehicles=vehicles)
+    date_in_seconds = _Seconds("date")
 
 
 class AirQuality(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "forecastType": None,
-            "forecastID": None,
-            "forecastBand": None,
-            "forecastSummary": None,
-            "nO2Band": None,
-            "o3Band": None,
-            "pM10Band": None,
-            "pM25Band": None,
-            "sO2Band": None,
-            "forecastText": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "forecastType": None,
+        "forecastID": None,
+        "forecastBand": None,
+        "forecastSummary": None,
+        "nO2Band": None,
+        "o3Band": None,
+        "pM10Band": None,
+        "pM25Band": None,
+        "sO2Band": None,
+        "forecastText": None
+    }
 
     def __repr__(self):
         return "AirQuality(forecastID={0})".format(self.forecastID)
@@ -148,36 +558,26 @@ class AirQuality(TflModel):
 
 class AdditionalProperty(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "category": None,
-            "key": None,
-            "sourceSystemKey": None,
-            "value": None,
-            "modified": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "category": None,
+        "key": None,
+        "sourceSystemKey": None,
+        "value": None,
+        "modified": None
+    }
 
     def __repr__(self):
         return "AdditionalProperty(Key={0}, Value={1})".format(
             self.key, self.value)
 
-    @property
-    def date_in_seconds(self):
-        return int(parser.parse(self.modified).strftime("%s"))
+    date_in_seconds = _Seconds("modified")
 
 
 class BpChildUrl(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "type": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "type": None
+    }
 
     def __repr__(self):
         return "BpChildUrl(Type={0})".format(self.type)
@@ -185,132 +585,100 @@ class BpChildUrl(TflModel):
 
 class Point(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "url": None,
-            "commonName": None,
-            "distance": 0,
-            "placeType": None,
-            "additionalProperties": None,
-            "children": None,
-            "childrenUrls": None,
-            "lat": None,
-            "lon": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "url": None,
+        "commonName": None,
+        "distance": 0,
+        "placeType": None,
+        "additionalProperties": None,
+        "children": None,
+        "childrenUrls": None,
+        "lat": None,
+        "lon": None
+    }
+
+    nested = {
+        "additionalProperties": "AdditionalProperty",
+        "children": list,
+        "childrenUrls": "BpChildUrl"
+    }
+
+    lazy_fields = ("additionalProperties", "childrenUrls")
 
     def __repr__(self):
         return "Point(ID={0}, CommonName={1})".format(
             self.id, self.commonName
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        additional_properties = None
-        children = None
-        children_urls = None
-
-        if 'additionalProperties' in data:
-            additional_properties = [
-                AdditionalProperty.fromJSON(bp)
-                for bp in data['additionalProperties']]
-        if 'children' in data:
-            children = [c for c in data['children']]
-        if 'childrenUrls' in data:
-            children_urls = [
-                BpChildUrl.fromJSON(cu) for cu in data['childrenUrls']]
-
-        return super(cls, cls).fromJSON(
-            data=data, additionalProperties=additional_properties,
-            children=children, childrenUrls=children_urls)
-
 
 class Cabwise(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "OperatorId": 0,
-            "OrganisationName": None,
-            "TradingName": None,
-            "AlsoKnownAs": None,
-            "CentreId": None,
-            "AddressLine1": None,
-            "AddressLine2": None,
-            "AddressLine3": None,
-            "Town": None,
-            "County": None,
-            "Postcode": None,
-            "BookingsPhoneNumber": None,
-            "BookingsEmail": None,
-            "PublicAccess": None,
-            "PublicWaitingRoom": None,
-            "WheelchairAccessible": None,
-            "CreditDebitCard": None,
-            "ChequeBankersCard": None,
-            "AccountServicesAvailable": None,
-            "HoursOfOperation24X7": None,
-            "HoursOfOperationMonThu": None,
-            "StartTimeMonThu": None,
-            "EndTimeMonThu": None,
-            "HoursOfOperationFri": None,
-            "StartTimeFri": None,
-            "EndTimeFri": None,
-            "HoursOfOperationSat": None,
-            "StartTimeSat": None,
-            "EndTimeSat": None,
-            "HoursOfOperationSun": None,
-            "StartTimeSun": None,
-            "EndTimeSun": None,
-            "HoursOfOperationPubHol": None,
-            "StartTimePubHol": None,
-            "EndTimePubHol": None,
-            "NumberOfVehicles": None,
-            "NumberOfVehiclesWheelchair": None,
-            "Longitude": None,
-            "Latitude": None,
-            "OperatorTypes": None,
-            "Distance": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "OperatorId": 0,
+        "OrganisationName": None,
+        "TradingName": None,
+        "AlsoKnownAs": None,
+        "CentreId": None,
+        "AddressLine1": None,
+        "AddressLine2": None,
+        "AddressLine3": None,
+        "Town": None,
+        "County": None,
+        "Postcode": None,
+        "BookingsPhoneNumber": None,
+        "BookingsEmail": None,
+        "PublicAccess": None,
+        "PublicWaitingRoom": None,
+        "WheelchairAccessible": None,
+        "CreditDebitCard": None,
+        "ChequeBankersCard": None,
+        "AccountServicesAvailable": None,
+        "HoursOfOperation24X7": None,
+        "HoursOfOperationMonThu": None,
+        "StartTimeMonThu": None,
+        "EndTimeMonThu": None,
+        "HoursOfOperationFri": None,
+        "StartTimeFri": None,
+        "EndTimeFri": None,
+        "HoursOfOperationSat": None,
+        "StartTimeSat": None,
+        "EndTimeSat": None,
+        "HoursOfOperationSun": None,
+        "StartTimeSun": None,
+        "EndTimeSun": None,
+        "HoursOfOperationPubHol": None,
+        "StartTimePubHol": None,
+        "EndTimePubHol": None,
+        "NumberOfVehicles": None,
+        "NumberOfVehiclesWheelchair": None,
+        "Longitude": None,
+        "Latitude": None,
+        "OperatorTypes": None,
+        "Distance": None
+    }
+
+    identity_fields = ("OperatorId",)
+
+    nested = {
+        "AlsoKnownAs": list,
+        "OperatorTypes": list
+    }
 
     def __repr__(self):
         return "Cabwise(ID={0}, Name={1})".format(
             self.CentreId, self.TradingName
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        also_known_as = None
-        operator_types = None
-
-        if 'AlsoKnownAs' in data:
-            also_known_as = [a for a in data["AlsoKnownAs"]]
-        if 'OperatorTypes' in data:
-            operator_types = [t for t in data["OperatorTypes"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, AlsoKnownAs=also_known_as,
-            OperatorTypes=operator_types
-        )
-
 
 class JourneyMode(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "isTflService": False,
-            "isFarePaying": False,
-            "isScheduledService": False,
-            "modeName": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "isTflService": False,
+        "isFarePaying": False,
+        "isScheduledService": False,
+        "modeName": None
+    }
 
     def __repr__(self):
         return "JourneyMode(ModeName={0})".format(self.modeName)
@@ -318,106 +686,73 @@ class JourneyMode(TflModel):
 
 class Place(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "naptanId": None,
-            "modes": None,
-            "icsCode": None,
-            "stopType": None,
-            "url": None,
-            "commonName": None,
-            "placeType": None,
-            "additionalProperties": None,
-            "lat": None,
-            "lon": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "naptanId": None,
+        "modes": None,
+        "icsCode": None,
+        "stopType": None,
+        "url": None,
+        "commonName": None,
+        "placeType": None,
+        "additionalProperties": None,
+        "lat": None,
+        "lon": None
+    }
+
+    nested = {
+        "modes": list,
+        "additionalProperties": "AdditionalProperty"
+    }
+
+    identity_fields = ("naptanId",)
 
     def __repr__(self):
         return "Place(ID={0}, CommonName={1})".format(
             self.naptanId, self.commonName)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        modes = None
-        additional_properties = None
-        if "modes" in data:
-            modes = [mode for mode in data["modes"]]
-        if "additionalProperties" in data:
-            additional_properties = [
-                AdditionalProperty(p) for p in data["additionalProperties"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, modes=modes, additionalProperties=additional_properties)
-
 
 class DisambiguationOption(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "parameterValue": None,
-            "uri": None,
-            "place": None,
-            "matchQuality": None
-        }
+    defaults = {
+        "parameterValue": None,
+        "uri": None,
+        "place": None,
+        "matchQuality": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "place": "Place"
+    }
 
     def __repr__(self):
         return "DisambiguationOption(ID={0}, MatchQuality={1})".format(
             self.parameterValue, self.matchQuality
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        place = None
-        if "place" in data:
-            place = Place.fromJSON(data["place"])
-
-        return super(cls, cls).fromJSON(data=data, place=place)
-
 
 class LocationDisambiguation(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "disambiguationOptions": None,
-            "matchStatus": None
-        }
+    defaults = {
+        "disambiguationOptions": None,
+        "matchStatus": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "disambiguationOptions": "DisambiguationOption"
+    }
 
     def __repr__(self):
         return "LocationDisambiguation(Status={0})".format(self.matchStatus)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        options = None
-        if "disambiguationOptions" in data:
-            options = [
-                DisambiguationOption.fromJSON(d)
-                for d in data["disambiguationOptions"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, disambiguationOptions=options)
-
 
 class Adjustment(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "date": None,
-            "time": None,
-            "timeIs": None,
-            "uri": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "date": None,
+        "time": None,
+        "timeIs": None,
+        "uri": None
+    }
 
     def __repr__(self):
         return "Adjustment(Date={0}, Time={1}, TimeIs={2})".format(
@@ -427,16 +762,19 @@ class Adjustment(TflModel):
 
 class TimeAdjustments(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "earliest": None,
-            "earlier": None,
-            "later": None,
-            "latest": None
-        }
+    defaults = {
+        "earliest": None,
+        "earlier": None,
+        "later": None,
+        "latest": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "earliest": "Adjustment",
+        "earlier": "Adjustment",
+        "later": "Adjustment",
+        "latest": "Adjustment"
+    }
 
     def __repr__(self):
         "TimeAdjustments(Earliest={0}, Latest={1})".format(
@@ -444,71 +782,36 @@ class TimeAdjustments(TflModel):
             getattr(self.latest, "date", None)
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        earliest = None
-        earlier = None
-        later = None
-        latest = None
-        if "earliest" in data:
-            earliest = Adjustment.fromJSON(data["earliest"])
-        if "earlier" in data:
-            earlier = Adjustment.fromJSON(data["earlier"])
-        if "later" in data:
-            later = Adjustment.fromJSON(data["later"])
-        if "latest" in data:
-            latest = Adjustment.fromJSON(data["latest"])
-
-        return super(cls, cls).fromJSON(
-            data=data, earliest=earliest, earlier=earlier,
-            later=later, latest=latest)
-
 
 class JourneySearch(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "dateTime": None,
-            "dateTimeType": None,
-            "timeAdjustments": None
-        }
+    defaults = {
+        "dateTime": None,
+        "dateTimeType": None,
+        "timeAdjustments": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "timeAdjustments": "TimeAdjustments"
+    }
 
     def __repr__(self):
         return "JourneySearch(DateTime={0}, Type={1})".format(
             self.dateTime, self.dateTimeType
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        time_adjustments = None
-        if "timeAdjustments" in data:
-            time_adjustments = TimeAdjustments.fromJSON(
-                data["timeAdjustments"]
-            )
-
-        return super(cls, cls).fromJSON(
-            data=data, timeAdjustments=time_adjustments)
-
 
 class JourneyOutline(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "_from": None,
-            "to": None,
-            "via": None,
-            "uri": None
-        }
-
-        for (param, default) in self.defaults.items():
-            # We need to avoid the reserved keyword here
-            kwarg_value = param
-            if param == "_from":
-                kwarg_value = "from"
-            setattr(self, param, kwargs.get(kwarg_value, default))
+    defaults = {
+        "_from": None,
+        "to": None,
+        "via": None,
+        "uri": None
+    }
+
+    # We need to avoid the reserved keyword here
+    json_keys = {"_from": "from"}
 
     def __repr__(self):
         return "JourneyOutline(From={0}, To={1}, Via={2})".format(
@@ -518,18 +821,22 @@ class JourneyOutline(TflModel):
 
 class JourneyDisambiguation(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "toLocationDisambiguation": None,
-            "fromLocationDisambiguation": None,
-            "viaLocationDisambiguation": None,
-            "recommendedMaxAgeMinutes": None,
-            "searchCriteria": None,
-            "journeyVector": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "toLocationDisambiguation": None,
+        "fromLocationDisambiguation": None,
+        "viaLocationDisambiguation": None,
+        "recommendedMaxAgeMinutes": None,
+        "searchCriteria": None,
+        "journeyVector": None
+    }
+
+    nested = {
+        "toLocationDisambiguation": "LocationDisambiguation",
+        "fromLocationDisambiguation": "LocationDisambiguation",
+        "viaLocationDisambiguation": "LocationDisambiguation",
+        "searchCriteria": "JourneySearch",
+        "journeyVector": "JourneyOutline"
+    }
 
     def __repr__(self):
         return "JourneyDisambiguation(From={0}, To={1})".format(
@@ -537,47 +844,15 @@ class JourneyDisambiguation(TflModel):
             getattr(self.journeyVector, "to", None)
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        to_location = None
-        from_location = None
-        via_location = None
-        search_criteria = None
-        journey_vector = None
-
-        if "toLocationDisambiguation" in data:
-            to_location = LocationDisambiguation.fromJSON(
-                data["toLocationDisambiguation"])
-        if "fromLocationDisambiguation" in data:
-            from_location = LocationDisambiguation.fromJSON(
-                data["fromLocationDisambiguation"])
-        if "viaLocationDisambiguation" in data:
-            via_location = LocationDisambiguation.fromJSON(
-                data["viaLocationDisambiguation"])
-        if "searchCriteria" in data:
-            search_criteria = JourneySearch.fromJSON(data["searchCriteria"])
-        if "journeyVector" in data:
-            journey_vector = JourneyOutline.fromJSON(data["journeyVector"])
-
-        return super(cls, cls).fromJSON(
-            data=data, toLocationDisambiguation=to_location,
-            fromLocationDisambiguation=from_location,
-            viaLocationDisambiguation=via_location,
-            searchCriteria=search_criteria, journeyVector=journey_vector)
-
 
 class JourneyLegObstacle(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "position": None,
-            "type": None,
-            "incline": None,
-            "stopId": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "position": None,
+        "type": None,
+        "incline": None,
+        "stopId": None
+    }
 
     def __repr__(self):
         return "JourneyLegObstacle(ID={0}, Type={1}, Incline={2})".format(
@@ -587,16 +862,12 @@ class JourneyLegObstacle(TflModel):
 
 class JourneyLegPlannedWorks(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "description": None,
-            "createdDateTime": None,
-            "lastUpdateDateTime": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "description": None,
+        "createdDateTime": None,
+        "lastUpdateDateTime": None
+    }
 
     def __repr__(self):
         return "JourneyLegPlannedWorks(ID={0})".format(self.id)
@@ -604,15 +875,10 @@ class JourneyLegPlannedWorks(TflModel):
 
 class JourneyStepPathAttribute(TflModel):
 
-    def __init__(self, **kwargs):
-
-        self.defaults = {
-            "value": None,
-            "name": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "value": None,
+        "name": None
+    }
 
     def __repr__(self):
         return "JourneyStepPathAttribute(Name={0}, Value={1}".format(
@@ -622,26 +888,25 @@ class JourneyStepPathAttribute(TflModel):
 
 class JourneyLegInstructionStep(TflModel):
 
-    def __init__(self, **kwargs):
-
-        self.defaults = {
-            "description": None,
-            "turnDirection": None,
-            "streetName": None,
-            "distance": None,
-            "cumulativeDistance": None,
-            "skyDirection": None,
-            "skyDirectionDescription": None,
-            "cumulativeTravelTime": None,
-            "latitude": None,
-            "longitude": None,
-            "pathAttribute": None,
-            "descriptionHeading": None,
-            "trackType": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "description": None,
+        "turnDirection": None,
+        "streetName": None,
+        "distance": None,
+        "cumulativeDistance": None,
+        "skyDirection": None,
+        "skyDirectionDescription": None,
+        "cumulativeTravelTime": None,
+        "latitude": None,
+        "longitude": None,
+        "pathAttribute": None,
+        "descriptionHeading": None,
+        "trackType": None
+    }
+
+    nested = {
+        "pathAttribute": "JourneyStepPathAttribute"
+    }
 
     def __repr__(self):
         return ("JourneyLegInstructionStep(SkyDirection={0}, "
@@ -649,53 +914,29 @@ class JourneyLegInstructionStep(TflModel):
                     self.skyDirection, self.streetName)
                 )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        pathAttribute = None
-        if "pathAttribute" in data:
-            pathAttribute = JourneyStepPathAttribute.fromJSON(
-                data["pathAttribute"]
-            )
-
-        return super(cls, cls).fromJSON(data=data, pathAttribute=pathAttribute)
-
 
 class JourneyLegInstruction(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "detailed": None,
-            "steps": None,
-            "summary": None
-        }
+    defaults = {
+        "detailed": None,
+        "steps": None,
+        "summary": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "steps": "JourneyLegInstructionStep"
+    }
 
     def __repr__(self):
         return "JourneyLegInstruction(Summary={0})".format(self.summary)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        steps = None
-
-        if "steps" in data:
-            steps = [
-                JourneyLegInstructionStep.fromJSON(s) for s in data["steps"]]
-
-        return super(cls, cls).fromJSON(data=data, steps=steps)
-
 
 class Location(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "lat": None,
-            "lon": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "lat": None,
+        "lon": None
+    }
 
     def __repr__(self):
         return "Location(Lat={0}, Lon={1})".format(self.lat, self.lon)
@@ -703,14 +944,10 @@ class Location(TflModel):
 
 class PassengerFlow(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "timeSlice": None,
-            "value": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "timeSlice": None,
+        "value": None
+    }
 
     def __repr__(self):
         return "PassengerFlow(Time={0}, Value={1})".format(
@@ -720,19 +957,15 @@ class PassengerFlow(TflModel):
 
 class TrainLoading(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "line": None,
-            "lineDirection": None,
-            "platformDirection": None,
-            "direction": None,
-            "naptanTo": None,
-            "timeSlice": None,
-            "value": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "line": None,
+        "lineDirection": None,
+        "platformDirection": None,
+        "direction": None,
+        "naptanTo": None,
+        "timeSlice": None,
+        "value": None
+    }
 
     def __repr__(self):
         return "TrainLoading(Line={0}, To={1})".format(
@@ -742,349 +975,214 @@ class TrainLoading(TflModel):
 
 class Crowding(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "passengerFlows": None,
-            "trainLoadings": None
-        }
+    defaults = {
+        "passengerFlows": None,
+        "trainLoadings": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "passengerFlows": "PassengerFlow",
+        "trainLoadings": "TrainLoading"
+    }
 
     def __repr__(self):
         return "Crowding(Loading={0}, Flow={1})".format(
             self.trainLoadings, self.passengerFlows
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        passengerFlows = None
-        trainLoadings = None
-
-        if "passengerFlows" in data:
-            passengerFlows = [
-                PassengerFlow.fromJSON(p) for p in data["passengerFlows"]
-            ]
-        if "trainLoadings" in data:
-            trainLoadings = [
-                TrainLoading.fromJSON(t) for t in data["trainLoadings"]
-            ]
-
-        return super(cls, cls).fromJSON(
-            data=data, passengerFlows=passengerFlows,
-            trainLoadings=trainLoadings
-        )
-
 
 class LineSequence(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "name": None,
-            "uri": None,
-            "fullName": None,
-            "type": None,
-            "crowding": None,
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "name": None,
+        "uri": None,
+        "fullName": None,
+        "type": None,
+        "crowding": None,
+    }
+
+    nested = {
+        "crowding": "Crowding"
+    }
 
     def __repr__(self):
         "LineSequence(ID={0}, Name={1})".format(self.id, self.name)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        crowding = None
-
-        if "crowding" in data and isinstance(data["crowding"], list):
-            crowding = [Crowding.fromJSON(c) for c in data["crowding"]]
-        elif "crowding" in data and isinstance(data["crowding"], dict):
-            crowding = Crowding.fromJSON(data["crowding"])
-
-        return super(cls, cls).fromJSON(data=data, crowding=crowding)
-
 
 class LineGroup(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "naptanIdReference": None,
-            "stationAtcoCode": None,
-            "lineIdentifier": None
-        }
+    defaults = {
+        "naptanIdReference": None,
+        "stationAtcoCode": None,
+        "lineIdentifier": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "lineIdentifier": list
+    }
 
     def __repr__(self):
         "LineGroup(ID={0})".format(self.naptanIdReference)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        lineIdentifier = None
-
-        if "lineIdentifier" in data:
-            lineIdentifier = [l for l in data["lineIdentifier"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, lineIdentifier=lineIdentifier
-        )
-
 
 class LineModeGroup(TflModel):
 
-    def __init___(self, **kwargs):
-        self.defaults = {
-            "modeName": None,
-            "lineIdentifier": None
-        }
+    defaults = {
+        "modeName": None,
+        "lineIdentifier": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "lineIdentifier": list
+    }
 
     def __repr__(self):
         return "LineModeGroup(Mode={0})".format(self.modeName)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        lineIdentifier = None
-
-        if "lineIdentifier" in data:
-            lineIdentifier = [l for l in data["lineIdentifier"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, lineIdentifier=lineIdentifier
-        )
-
 
 class StopPoint(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "naptanId": None,
-            "platformName": None,
-            "indicator": None,
-            "stopLetter": None,
-            "modes": None,
-            "icsCode": None,
-            "smsCode": None,
-            "stopType": None,
-            "stationNaptan": None,
-            "accessibilitySummary": None,
-            "hubNaptanCode": None,
-            "lines": None,
-            "lineGroup": None,
-            "lineModeGroups": None,
-            "fullName": None,
-            "naptanMode": None,
-            "status": None,
-            "id": None,
-            "url": None,
-            "commonName": None,
-            "distance": None,
-            "placeType": None,
-            "additionalProperties": None,
-            "children": None,
-            "childrenUrls": None,
-            "lat": None,
-            "lon": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "naptanId": None,
+        "platformName": None,
+        "indicator": None,
+        "stopLetter": None,
+        "modes": None,
+        "icsCode": None,
+        "smsCode": None,
+        "stopType": None,
+        "stationNaptan": None,
+        "accessibilitySummary": None,
+        "hubNaptanCode": None,
+        "lines": None,
+        "lineGroup": None,
+        "lineModeGroups": None,
+        "fullName": None,
+        "naptanMode": None,
+        "status": None,
+        "id": None,
+        "url": None,
+        "commonName": None,
+        "distance": None,
+        "placeType": None,
+        "additionalProperties": None,
+        "children": None,
+        "childrenUrls": None,
+        "lat": None,
+        "lon": None
+    }
+
+    nested = {
+        "modes": list,
+        "lines": "LineSequence",
+        "lineGroup": "LineGroup",
+        "lineModeGroups": "LineModeGroup",
+        "additionalProperties": "AdditionalProperty",
+        "children": "Point",
+        "childrenUrls": list
+    }
 
     def __repr__(self):
         "StopPoint(ID={0}, FullName={1})".format(self.id, self.fullName)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        modes = None
-        lines = None
-        lineGroup = None
-        lineModeGroups = None
-        additionalProperties = None
-        children = None
-        childrenUrls = None
-
-        if "modes" in data:
-            modes = [mode for mode in data["modes"]]
-        if "lines" in data:
-            lines = [LineSequence.fromJSON(l) for l in data["lines"]]
-        if "lineGroup" in data:
-            lineGroup = [LineGroup.fromJSON(g) for g in data["lineGroup"]]
-        if "lineModeGroups" in data:
-            lineModeGroups = [
-                LineModeGroup.fromJSON(m) for m in data["lineModeGroups"]
-            ]
-        if "additionalProperties" in data:
-            additionalProperties = [
-                AdditionalProperty.fromJSON(p)
-                for p in data["additionalProperties"]
-            ]
-        if "children" in data:
-            children = [Point.fromJSON(c) for c in data["children"]]
-        if "childrenUrls" in data:
-            childrenUrls = [u for u in data["childrenUrls"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, modes=modes, lines=lines, lineGroup=lineGroup,
-            lineModeGroups=lineModeGroups,
-            additionalProperties=additionalProperties,
-            children=children, childrenUrls=childrenUrls
-        )
-
 
 class RouteSequence(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "ordinal": None,
-            "stopPoint": None
-        }
+    defaults = {
+        "ordinal": None,
+        "stopPoint": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "stopPoint": "StopPoint"
+    }
 
     def __repr__(self):
         "RouteSequence(Ordinal={0})".format(self.ordinal)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        stopPoint = None
-
-        if "stopPoint" in data:
-            stopPoint = StopPoint.fromJSON(data["stopPoint"])
-
-        return super(cls, cls).fromJSON(data=data, stopPoint=stopPoint)
-
 
 class AffectedRoute(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "lineId": None,
-            "routeCode": None,
-            "name": None,
-            "lineString": None,
-            "direction": None,
-            "originationName": None,
-            "destinationName": None,
-            "validFrom": None,
-            "validTo": None,
-            "routeSectionNaptanEntrySequence": None,
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "lineId": None,
+        "routeCode": None,
+        "name": None,
+        "lineString": None,
+        "direction": None,
+        "originationName": None,
+        "destinationName": None,
+        "validFrom": None,
+        "validTo": None,
+        "routeSectionNaptanEntrySequence": None,
+    }
+
+    nested = {
+        "routeSectionNaptanEntrySequence": "RouteSequence"
+    }
 
     def __repr__(self):
         return "AffectedRoute(ID={0}, Name={1})".format(
             self.id, self.name
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        route_sequence = None
-
-        if "routeSectionNaptanEntrySequence" in data:
-            route_sequence = [
-                RouteSequence.fromJSON(r)
-                for r in data["routeSectionNaptanEntrySequence"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, routeSectionNaptanEntrySequence=route_sequence
-        )
-
 
 class Disruption(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "category": None,
-            "type": None,
-            "categoryDescription": None,
-            "description": None,
-            "summary": None,
-            "additionalInfo": None,
-            "created": None,
-            "lastUpdate": None,
-            "affectedRoutes": None,
-            "affectedStops": None,
-            "closureText": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "category": None,
+        "type": None,
+        "categoryDescription": None,
+        "description": None,
+        "summary": None,
+        "additionalInfo": None,
+        "created": None,
+        "lastUpdate": None,
+        "affectedRoutes": None,
+        "affectedStops": None,
+        "closureText": None
+    }
+
+    nested = {
+        "affectedRoutes": "AffectedRoute",
+        "affectedStops": "StopPoint"
+    }
 
     def __repr__(self):
         return "Disruption(Category={0}, Created={1})".format(
             self.category, self.created
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        affected_routes = None
-        affected_stops = None
-
-        if "affectedRoutes" in data:
-            affected_routes = [
-                AffectedRoute.fromJSON(a) for a in data["affectedRoutes"]]
-        if "affectedStops" in data:
-            affected_stops = [
-                StopPoint.fromJSON(s) for s in data["affectedStops"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, affectedRoutes=affected_routes,
-            affectedStops=affected_stops)
-
 
 class RouteOption(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "directions": None,
-            "name": None,
-            "lineIdentifier": None
-        }
+    defaults = {
+        "directions": None,
+        "name": None,
+        "lineIdentifier": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "directions": list,
+        "lineIdentifier": "LineSequence"
+    }
 
     def __repr__(self):
         return "RouteOption(name={0})".format(self.name)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        directions = None
-        lineIdentifier = None
-
-        if "directions" in data:
-            directions = [d for d in data["directions"]]
-        if "lineIdentifier" in data:
-            lineIdentifier = LineSequence.fromJSON(data["lineIdentifier"])
-
-        return super(cls, cls).fromJSON(
-            data=data, directions=directions, lineIdentifier=lineIdentifier)
-
 
 class Elevation(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "distance": None,
-            "startLat": None,
-            "startLon": None,
-            "endLat": None,
-            "endLon": None,
-            "heightFromPreviousPoint": None,
-            "gradient": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "distance": None,
+        "startLat": None,
+        "startLon": None,
+        "endLat": None,
+        "endLon": None,
+        "heightFromPreviousPoint": None,
+        "gradient": None
+    }
 
     def __repr__(self):
         return "Elevation(Start=({0}, {1}), End=({0}, {1}))".format(
@@ -1094,146 +1192,95 @@ class Elevation(TflModel):
 
 class JourneyPath(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "lineString": None,
-            "elevation": None,
-            "stopPoints": None
-        }
+    defaults = {
+        "lineString": None,
+        "elevation": None,
+        "stopPoints": None
+    }
+
+    nested = {
+        "elevation": "Elevation",
+        "stopPoints": "LineSequence"
+    }
+
+    lazy_fields = ("elevation", "stopPoints")
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    geometry_fields = ("lineString",)
 
     def __repr__(self):
         return "JourneyPath()"
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        elevation = None
-        stopPoints = None
-
-        if "elevation" in data:
-            elevation = [
-                Elevation.fromJSON(e) for e in data["elevation"]
-            ]
-        if "stopPoints" in data:
-            stopPoints = [LineSequence.fromJSON(l) for l in data["stopPoints"]]
-
-        return super(cls, cls).fromJSON(
-            data, elevation=elevation, stopPoints=stopPoints
-        )
-
 
 class JourneyLeg(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "departureTime": None,
-            "obstacles": None,
-            "plannedWorks": None,
-            "arrivalPoint": None,
-            "departurePoint": None,
-            "instruction": None,
-            "isDisrupted": None,
-            "disruptions": None,
-            "routeOptions": None,
-            "mode": None,
-            "arrivalTime": None,
-            "duration": None,
-            "path": None,
-            "hasFixedLocations": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "departureTime": None,
+        "obstacles": None,
+        "plannedWorks": None,
+        "arrivalPoint": None,
+        "departurePoint": None,
+        "instruction": None,
+        "isDisrupted": None,
+        "disruptions": None,
+        "routeOptions": None,
+        "mode": None,
+        "arrivalTime": None,
+        "duration": None,
+        "path": None,
+        "hasFixedLocations": None
+    }
+
+    nested = {
+        "obstacles": "JourneyLegObstacle",
+        "plannedWorks": "JourneyLegPlannedWorks",
+        "arrivalPoint": "Location",
+        "departurePoint": "Location",
+        "instruction": "JourneyLegInstruction",
+        "disruptions": "Disruption",
+        "routeOptions": "RouteOption",
+        "mode": "LineSequence",
+        "path": "JourneyPath"
+    }
+
+    lazy_fields = (
+        "obstacles", "plannedWorks", "arrivalPoint", "departurePoint",
+        "instruction", "disruptions", "routeOptions", "mode", "path"
+    )
 
     def __repr__(self):
         return "JourneyLeg(From={0}, To={1}, IsDisrupted={2}".format(
             self.departurePoint, self.arrivalPoint, self.isDisrupted
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        obstacles = None
-        plannedWorks = None
-        instruction = None
-        arrivalPoint = None
-        departurePoint = None
-        disruptions = None
-        routeOptions = None
-        mode = None
-        path = None
-
-        if "obstacles" in data:
-            obstacles = [
-                JourneyLegObstacle.fromJSON(ob) for ob in data["obstacles"]]
-        if "plannedWorks" in data:
-            plannedWorks = [
-                JourneyLegPlannedWorks.fromJSON(p)
-                for p in data["plannedWorks"]
-            ]
-        if "instruction" in data:
-            instruction = JourneyLegInstruction.fromJSON(data["instruction"])
-        if "arrivalPoint" in data:
-            arrivalPoint = Location.fromJSON(data["arrivalPoint"])
-        if "departurePoint" in data:
-            departurePoint = Location.fromJSON(data["departurePoint"])
-        if "disruptions" in data:
-            disruptions = [Disruption.fromJSON(d) for d in data["disruptions"]]
-        if "routeOptions" in data:
-            routeOptions = [
-                RouteOption.fromJSON(r) for r in data["routeOptions"]
-            ]
-        if "mode" in data:
-            mode = LineSequence.fromJSON(data["mode"])
-        if "path" in data:
-            path = JourneyPath.fromJSON(data["path"])
-        return super(cls, cls).fromJSON(
-            data=data, obstacles=obstacles, plannedWorks=plannedWorks,
-            instruction=instruction, arrivalPoint=arrivalPoint,
-            departurePoint=departurePoint, disruptions=disruptions,
-            routeOptions=routeOptions, mode=mode, path=path)
-
 
 class Journey(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "duration": None,
-            "legs": None,
-            "startDateTime": None,
-            "arrivalDateTime": None
-        }
+    defaults = {
+        "duration": None,
+        "legs": None,
+        "startDateTime": None,
+        "arrivalDateTime": None
+    }
+
+    nested = {
+        "legs": "JourneyLeg"
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    lazy_fields = ("legs",)
 
     def __repr__(self):
         return "Journey(Duration={0}, StartTime={1}, ArrivalTime={2})".format(
             self.duration, self.startDateTime, self.arrivalDateTime
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        legs = None
-
-        if "legs" in data:
-            legs = [JourneyLeg.fromJSON(l) for l in data["legs"]]
-
-        return super(cls, cls).fromJSON(data=data, legs=legs)
-
 
 class ValidityPeriod(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "fromDate": None,
-            "toDate": None,
-            "isNow": False
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "fromDate": None,
+        "toDate": None,
+        "isNow": False
+    }
 
     def __repr__(self):
         return "ValidityPeriod(From={0}, To={1})".format(
@@ -1243,63 +1290,40 @@ class ValidityPeriod(TflModel):
 
 class LineStatus(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "lineId": None,
-            "statusSeverity": None,
-            "statusSeverityDescription": None,
-            "reason": None,
-            "created": None,
-            "modified": None,
-            "validityPeriods": None,
-            "disruption": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "lineId": None,
+        "statusSeverity": None,
+        "statusSeverityDescription": None,
+        "reason": None,
+        "created": None,
+        "modified": None,
+        "validityPeriods": None,
+        "disruption": None
+    }
+
+    nested = {
+        "validityPeriods": "ValidityPeriod"
+    }
 
     def __repr__(self):
         return "LineStatus(ID={0}, LineID={1})".format(self.id, self.lineId)
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        validityPeriods = None
-        disruptions = None
-
-        if "validityPeriods" in data:
-            validityPeriods = [
-                ValidityPeriod.fromJSON(v) for v in data["validityPeriods"]
-            ]
-        if "disruptions" in data:
-            disruptions = [
-                Disruption.fromJSON(d) for d in data["disruptions"]
-            ]
-
-        return super(cls, cls).fromJSON(
-            data=data, validityPeriods=validityPeriods,
-            disruptions=disruptions
-        )
-
 
 class RouteSection(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "routeCode": None,
-            "name": None,
-            "direction": None,
-            "originationName": None,
-            "destinationName": None,
-            "originator": None,
-            "destination": None,
-            "serviceType": None,
-            "validTo": None,
-            "validFrom": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "routeCode": None,
+        "name": None,
+        "direction": None,
+        "originationName": None,
+        "destinationName": None,
+        "originator": None,
+        "destination": None,
+        "serviceType": None,
+        "validTo": None,
+        "validFrom": None
+    }
 
     def __repr__(self):
         return "RouteSection(RouteCode={0}, name={1})".format(
@@ -1309,14 +1333,10 @@ class RouteSection(TflModel):
 
 class ServiceType(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "name": None,
-            "uri": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "name": None,
+        "uri": None
+    }
 
     def __repr__(self):
         return "ServiceType(Name={0})".format(self.name)
@@ -1324,244 +1344,156 @@ class ServiceType(TflModel):
 
 class Line(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "id": None,
-            "name": None,
-            "modeName": None,
-            "disruptions": None,
-            "created": None,
-            "modified": None,
-            "lineStatuses": None,
-            "routeSections": None,
-            "serviceTypes": None,
-            "crowding": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "id": None,
+        "name": None,
+        "modeName": None,
+        "disruptions": None,
+        "created": None,
+        "modified": None,
+        "lineStatuses": None,
+        "routeSections": None,
+        "serviceTypes": None,
+        "crowding": None
+    }
+
+    nested = {
+        "disruptions": "Disruption",
+        "lineStatuses": "LineStatus",
+        "routeSections": "RouteSection",
+        "serviceTypes": "ServiceType",
+        "crowding": "Crowding"
+    }
+
+    lazy_fields = (
+        "disruptions", "lineStatuses", "routeSections", "serviceTypes",
+        "crowding"
+    )
 
     def __repr__(self):
         return "Line(ID={0}, Name={1})".format(self.id, self.name)
 
-    @property
-    def created_in_seconds(self):
-        return int(parser.parse(self.created).strftime("%s"))
-
-    @property
-    def modified_in_seconds(self):
-        return int(parser.parse(self.modified).strftime("%s"))
-
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        disruptions = None
-        lineStatuses = None
-        routeSections = None
-        serviceTypes = None
-        crowding = None
-
-        if "disruptions" in data:
-            disruptions = [Disruption.fromJSON(d) for d in data["disruptions"]]
-        if "lineStatuses" in data:
-            lineStatuses = [
-                LineStatus.fromJSON(l) for l in data["lineStatuses"]
-            ]
-        if "routeSections" in data:
-            routeSections = [
-                RouteSection.fromJSON(r) for r in data["routeSections"]
-            ]
-        if "serviceTypes" in data:
-            serviceTypes = [
-                ServiceType.fromJSON(s) for s in data["serviceTypes"]
-            ]
-        if "crowding" in data:
-            crowding = Crowding.fromJSON(data["crowding"])
-
-        return super(cls, cls).fromJSON(
-            data=data, disruptions=disruptions, lineStatuses=lineStatuses,
-            routeSections=routeSections, serviceTypes=serviceTypes,
-            crowding=crowding
-        )
+    created_in_seconds = _Seconds("created")
+    modified_in_seconds = _Seconds("modified")
 
 
 class StopPointSequence(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "lineId": None,
-            "lineName": None,
-            "direction": None,
-            "branchId": None,
-            "nextBranchIds": None,
-            "prevBranchIds": None,
-            "stopPoint": None,
-            "serviceType": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "lineId": None,
+        "lineName": None,
+        "direction": None,
+        "branchId": None,
+        "nextBranchIds": None,
+        "prevBranchIds": None,
+        "stopPoint": None,
+        "serviceType": None
+    }
+
+    nested = {
+        "nextBranchIds": list,
+        "prevBranchIds": list,
+        "stopPoint": "Station"
+    }
 
     def __repr__(self):
         return "StopPointSequence(LineID={0}, LineName={1})".format(
             self.lineId, self.lineName
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        nextBranchIds = None
-        prevBranchIds = None
-        stopPoint = None
-
-        if "nextBranchIds" in data:
-            nextBranchIds = [_id for _id in data["nextBranchIds"]]
-        if "prevBranchIds" in data:
-            prevBranchIds = [_id for _id in data["prevBranchIds"]]
-        if "stopPoint" in data:
-            stopPoint = [Station.fromJSON(p) for p in data["stopPoint"]]
-
-        return super(cls, cls).fromJSON(
-            data=data, nextBranchIds=nextBranchIds,
-            prevBranchIds=prevBranchIds, stopPoint=stopPoint
-        )
-
 
 class Station(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "routeId": None,
-            "parentId": None,
-            "stationId": None,
-            "icsId": None,
-            "topMostParentId": None,
-            "direction": None,
-            "towards": None,
-            "modes": None,
-            "stopType": None,
-            "stopLetter": None,
-            "zone": None,
-            "accessibilitySummary": None,
-            "hasDisruption": None,
-            "lines": None,
-            "status": None,
-            "id": None,
-            "url": None,
-            "name": None,
-            "lat": None,
-            "lon": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "routeId": None,
+        "parentId": None,
+        "stationId": None,
+        "icsId": None,
+        "topMostParentId": None,
+        "direction": None,
+        "towards": None,
+        "modes": None,
+        "stopType": None,
+        "stopLetter": None,
+        "zone": None,
+        "accessibilitySummary": None,
+        "hasDisruption": None,
+        "lines": None,
+        "status": None,
+        "id": None,
+        "url": None,
+        "name": None,
+        "lat": None,
+        "lon": None
+    }
+
+    nested = {
+        "modes": list,
+        "lines": "LineSequence"
+    }
 
     def __repr__(self):
         return "Station(RouteID={0}, StationID={1})".format(
             self.routeId, self.stationId
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        modes = None
-        lines = None
-        if "modes" in data:
-            modes = [mode for mode in data["modes"]]
-        if "lines" in data:
-            lines = [LineSequence.fromJSON(l) for l in data["lines"]]
-
-        return super(cls, cls).fromJSON(data=data, modes=modes, lines=lines)
-
 
 class LineRoute(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "name": None,
-            "naptanIds": None,
-            "serviceType": None
-        }
+    defaults = {
+        "name": None,
+        "naptanIds": None,
+        "serviceType": None
+    }
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    nested = {
+        "naptanIds": list
+    }
 
     def __repr__(self):
         return "LineRoute(Name={0}, ServiceType={1})".format(
             self.name, self.serviceType
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        naptanIds = None
-        if "naptanIds" in data:
-            naptanIds = [_id for _id in data["naptanIds"]]
-
-        return super(cls, cls).fromJSON(data=data, naptanIds=naptanIds)
-
 
 class LineRouteSequence(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "lineId": None,
-            "lineName": None,
-            "direction": None,
-            "isOutboundOnly": None,
-            "mode": None,
-            "lineStrings": None,
-            "stations": None,
-            "stopPointSequences": None,
-            "orderedLineRoutes": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "lineId": None,
+        "lineName": None,
+        "direction": None,
+        "isOutboundOnly": None,
+        "mode": None,
+        "lineStrings": None,
+        "stations": None,
+        "stopPointSequences": None,
+        "orderedLineRoutes": None
+    }
+
+    nested = {
+        "stations": "Station",
+        "stopPointSequences": "StopPointSequence",
+        "orderedLineRoutes": "LineRoute"
+    }
+
+    geometry_fields = ("lineStrings",)
 
     def __repr__(self):
         return "LineRouteSequence(LineName={0}, Direction={1})".format(
             self.lineName, self.direction
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        lineStrings = None
-        stations = None
-        stopPointSequences = None
-        orderedLineRoutes = None
-
-        if "lineStrings" in data:
-            lineStrings = [json.loads(l) for l in data["lineStrings"]][0][0]
-        if "stations" in data:
-            stations = [Station.fromJSON(s) for s in data["stations"]]
-        if "stopPointSequences" in data:
-            stopPointSequences = [
-                StopPointSequence.fromJSON(p)
-                for p in data["stopPointSequences"]
-            ]
-        if "orderedLineRoutes" in data:
-            orderedLineRoutes = [
-                LineRoute.fromJSON(l) for l in data["orderedLineRoutes"]
-            ]
-
-        return super(cls, cls).fromJSON(
-            data=data, lineStrings=lineStrings, stations=stations,
-            stopPointSequences=stopPointSequences,
-            orderedLineRoutes=orderedLineRoutes
-        )
-
 
 class DockingPoint(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "originNumberOfBikes": None,
-            "destinationNumberOfBikes": None,
-            "originNumberOfEmptySlots": None,
-            "destinationNumberOfEmptySlots": None,
-            "originId": None,
-            "destinationId": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "originNumberOfBikes": None,
+        "destinationNumberOfBikes": None,
+        "originNumberOfEmptySlots": None,
+        "destinationNumberOfEmptySlots": None,
+        "originId": None,
+        "destinationId": None
+    }
 
     def __repr__(self):
         return "DockingPoint(ID={0}, NoBikes={1})".format(
@@ -1571,19 +1503,29 @@ class DockingPoint(TflModel):
 
 class JourneyPlanner(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "journeyVector": None,
-            "journeys": None,
-            "lines": None,
-            "searchCriteria": None,
-            "stopMessages": None,
-            "recommendedMaxAgeMinutes": None,
-            "cycleHireDockingStationData": None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "journeyVector": None,
+        "journeys": None,
+        "lines": None,
+        "searchCriteria": None,
+        "stopMessages": None,
+        "recommendedMaxAgeMinutes": None,
+        "cycleHireDockingStationData": None
+    }
+
+    nested = {
+        "journeyVector": "JourneyOutline",
+        "journeys": "Journey",
+        "lines": "Line",
+        "searchCriteria": "JourneySearch",
+        "stopMessages": list,
+        "cycleHireDockingStationData": "DockingPoint"
+    }
+
+    lazy_fields = (
+        "journeyVector", "journeys", "lines", "searchCriteria",
+        "cycleHireDockingStationData"
+    )
 
     def __repr__(self):
         return "JourneyPlanner(From={0}, To={1})".format(
@@ -1591,48 +1533,14 @@ class JourneyPlanner(TflModel):
             getattr(self.journeyVector, "to", None)
         )
 
-    @classmethod
-    def fromJSON(cls, data, **kwargs):
-        journeys = None
-        journey_vector = None
-        lines = None
-        search_criteria = None
-        stop_messages = None
-        docking_data = None
-
-        if "journeys" in data:
-            journeys = [Journey.fromJSON(j) for j in data["journeys"]]
-        if "journeyVector" in data:
-            journey_vector = JourneyOutline.fromJSON(data["journeyVector"])
-        if "lines" in data:
-            lines = [Line.fromJSON(l) for l in data["lines"]]
-        if "searchCriteria" in data:
-            search_criteria = JourneySearch.fromJSON(data["searchCriteria"])
-        if "stopMessages" in data:
-            stop_messages = [message for message in data["stopMessages"]]
-        if "cycleHireDockingStationData" in data:
-            docking_data = DockingPoint.fromJSON(
-                data["cycleHireDockingStationData"]
-            )
-
-        return super(cls, cls).fromJSON(
-            data=data, journeys=journeys, journeyVector=journey_vector,
-            lines=lines, searchCriteria=search_criteria,
-            cycleHireDockingStationData=docking_data,
-            stopMessages=stop_messages)
-
 
 class LineStatusSeverity(TflModel):
 
-    def __init__(self, **kwargs):
-        self.defaults = {
-            "modeName": None,
-            "severityLevel": None,
-            "description": None,
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    defaults = {
+        "modeName": None,
+        "severityLevel": None,
+        "description": None,
+    }
 
     def __repr__(self):
         return "LineStatusSeverity(ModeName={0}, SeverityLevel={1})".format(
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from tfl.exceptions import TflError
+from tfl.geometry import Geometry
+from tfl.models import TflModel
+
+MAGIC = b"TFLSNAP1"
+
+# Header length, then one offset per record plus the end of the last one
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+
+# What a truncated or corrupt file raises while being read
+_CORRUPT = (struct.error, EOFError, ValueError, TypeError, KeyError,
+            IndexError)
+
+
+def save_snapshot(path, models):
+    """
+    Write a list of models to ``path`` in a compact binary format, one
+    record per model, replacing the file atomically.
+
+    Records are encoded with marshal, so a snapshot can only be read back
+    by the same Python version, and only trusted files should be loaded.
+    Models are named by class, and only TflModel subclasses already
+    imported when the snapshot is loaded can be read back.
+    """
+    classes = []
+    class_index = {}
+    records = []
+    for model in models:
+        records.append(marshal.dumps(_Pack(model, classes, class_index)))
+
+    header = marshal.dumps({
+        "marshal": marshal.version,
+        "python": tuple(sys.version_info[:2]),
+        "classes": classes,
+    })
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    temporary = "{0}.{1}.tmp".format(path, os.getpid())
+    with open(temporary, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        f.write(_LENGTH.pack(len(records)))
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        for record in records:
+            f.write(record)
+    os.replace(temporary, path)
+
+
+def load_snapshot(path):
+    """
+    Open a snapshot written by save_snapshot(). The file is memory mapped
+    and each model is only decoded when first read from the returned
+    ModelSnapshot, so opening takes about the same time at any size.
+    """
+    return ModelSnapshot(path)
+
+
+def refresh_snapshot(path, fetch, on_refresh=None):
+    """
+    Call ``fetch()`` (e.g. ``api.GetBikePoints``) on a background thread,
+    save its result to ``path`` and hand it to ``on_refresh``. Returns the
+    started thread. Errors are handed to ``on_refresh`` as
+    ``on_refresh(None, error)``, leaving the file as it was.
+    """
+    def refresh():
+        try:
+            models = fetch()
+            save_snapshot(path, models)
+        except Exception as error:
+            if on_refresh is not None:
+                on_refresh(None, error)
+            return
+        if on_refresh is not None:
+            on_refresh(models, None)
+
+    thread = threading.Thread(target=refresh)
+    thread.daemon = True
+    thread.start()
+
+    return thread
+
+
+class ModelSnapshot(object):
+    """
+    A read-only sequence of the models in a snapshot file, decoded from
+    the memory mapped file on first access and kept from then on.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise TflError("\"{0}\" is not a snapshot".format(path))
+        try:
+            self._ReadHeader(path)
+        except Exception:
+            self.close()
+            raise
+        self._models = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot index out of range")
+        model = self._models.get(index)
+        if model is None:
+            model = self._models[index] = self._Decode(index)
+
+        return model
+
+    def close(self):
+        """
+        Unmap the file. Models already read stay usable.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _ReadHeader(self, path):
+        data = self._map
+        if data[:len(MAGIC)] != MAGIC:
+            raise TflError("\"{0}\" is not a snapshot".format(path))
+        try:
+            self._ReadIndex(path, data)
+        except _CORRUPT as error:
+            raise TflError(
+                "\"{0}\" is corrupt: {1!r}".format(path, error))
+
+    def _ReadIndex(self, path, data):
+        position = len(MAGIC)
+        (length,) = _LENGTH.unpack_from(data, position)
+        position += _LENGTH.size
+        header = marshal.loads(data[position:position + length])
+        position += length
+        if (header["marshal"] != marshal.version or
+                tuple(header["python"]) != tuple(sys.version_info[:2])):
+            raise TflError(
+                "\"{0}\" was written by another Python version".format(path))
+        models = _Models()
+        self._unpackers = [
+            cls.__dict__.get("_unpack") or _CompileUnpack(cls)
+            for cls in [_Class(name, models) for name in header["classes"]]]
+        (self._count,) = _LENGTH.unpack_from(data, position)
+        self._offsets = position + _LENGTH.size
+        self._records = self._offsets + (self._count + 1) * _OFFSET.size
+        (end,) = _OFFSET.unpack_from(
+            data, self._offsets + self._count * _OFFSET.size)
+        if self._records + end > len(data):
+            raise TflError("\"{0}\" is truncated".format(path))
+
+    def _Decode(self, index):
+        if self._map is None:
+            raise TflError("The snapshot has been closed")
+        try:
+            (start,) = _OFFSET.unpack_from(
+                self._map, self._offsets + index * _OFFSET.size)
+            (end,) = _OFFSET.unpack_from(
+                self._map, self._offsets + (index + 1) * _OFFSET.size)
+            record = self._map[self._records + start:self._records + end]
+            return _Unpack(marshal.loads(record), self._unpackers)
+        except _CORRUPT as error:
+            raise TflError("Record {0} of \"{1}\" is corrupt: {2!r}".format(
+                index, self._path, error))
+
+
+def _Pack(value, classes, class_index):
+    # Models become (class number, field values) tuples; JSON values stay
+    # as they are, with tuples and sets stored as lists and geometry as its
+    # JSON text. Only fields in a model's ``nested`` are read back as
+    # models, and those in ``geometry_fields`` as Geometry.
+    if isinstance(value, TflModel):
+        cls = type(value)
+        number = class_index.get(cls)
+        if number is None:
+            number = class_index[cls] = len(classes)
+            classes.append("{0}:{1}".format(cls.__module__, cls.__name__))
+        return (number, tuple(
+            _Pack(getattr(value, param), classes, class_index)
+            for (param, _, _) in cls._fields))
+    if isinstance(value, Geometry):
+        return value.toDict()
+    if isinstance(value, (list, tuple, set)):
+        return [_Pack(v, classes, class_index) for v in value]
+    if isinstance(value, dict):
+        return dict(
+            (k, _Pack(v, classes, class_index)) for (k, v) in value.items())
+
+    return value
+
+
+def _Unpack(value, unpackers):
+    if value.__class__ is tuple:
+        return unpackers[value[0]](value[1], unpackers)
+    if value.__class__ is list:
+        return [_Unpack(v, unpackers) for v in value]
+
+    return value
+
+
+def _CompileUnpack(cls):
+    """
+    Compile ``unpack(values, unpackers)`` for a model, which fills a new
+    instance through the raw slots with one line per field, only recursing
+    into the fields that hold models according to ``nested``.
+    """
+    namespace = {"new": object.__new__, "cls": cls, "Unpack": _Unpack,
+                 "geometry": Geometry.fromJSON}
+    lines = ["def unpack(values, unpackers):",
+             "    c = new(cls)"]
+    for (index, (param, _, _)) in enumerate(cls._fields):
+        namespace["s{0}".format(index)] = cls._slots[param].__set__
+        value = "values[{0}]".format(index)
+        if param in cls.geometry_fields:
+            value = "None if {0} is None else geometry({0})".format(value)
+        elif cls.nested.get(param) not in (None, list):
+            value = "Unpack({0}, unpackers)".format(value)
+        lines.append("    s{0}(c, {1})".format(index, value))
+    lines.extend(["    c._json = None",
+                  "    return c"])
+    exec("\n".join(lines), namespace)
+    cls._unpack = namespace["unpack"]
+
+    return cls._unpack
+
+
+def _Class(name, models):
+    # Only models are looked up, never imported: a header naming anything
+    # else would otherwise run whatever module it names
+    cls = models.get(name)
+    if cls is None:
+        raise TflError("\"{0}\" is not a known model".format(name))
+
+    return cls
+
+
+def _Models():
+    # Every TflModel subclass defined so far, by "module:name"
+    models = {}
+    pending = [TflModel]
+    while pending:
+        cls = pending.pop()
+        for subclass in cls.__subclasses__():
+            models["{0}:{1}".format(
+                subclass.__module__, subclass.__name__)] = subclass
+            pending.append(subclass)
+
+    return models
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+_now = time.monotonic
+
+# Throttling and transient server errors worth another attempt
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Header pairs announcing how many requests are left in the current window
+# and when it resets
+RATE_LIMIT_HEADERS = (
+    ("RateLimit-Remaining", "RateLimit-Reset"),
+    ("X-RateLimit-Remaining", "X-RateLimit-Reset"),
+)
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before repeating a failed request.
+
+    Up to ``max_attempts`` requests are made in total. Before attempt n + 1
+    the wait is ``backoff * 2 ** (n - 1)`` seconds, capped at
+    ``max_backoff``. With ``jitter`` on, it is drawn uniformly from zero up
+    to that, which spreads out workers that failed together. A
+    ``Retry-After`` header, or an exhausted rate limit window, overrides
+    the backoff, and a wait longer than ``max_retry_after`` gives up
+    instead.
+    """
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30.0,
+                 jitter=True, statuses=RETRY_STATUSES, max_retry_after=120.0):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+
+    def retryable(self, status):
+        return status in self.statuses
+
+    def delay(self, attempt, headers=None):
+        """
+        Seconds to wait after failed attempt number ``attempt`` (from 1),
+        or ``None`` when no more attempts should be made.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        wait = None
+        if headers is not None:
+            wait = retry_after_from_headers(headers)
+            if wait is None:
+                wait = rate_limit_reset_from_headers(headers)
+        if wait is not None:
+            return wait if wait <= self.max_retry_after else None
+
+        wait = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            wait = random.uniform(0, wait)
+
+        return wait
+
+
+class TokenBucket(object):
+    """
+    A thread-safe client-side rate limiter allowing ``rate`` requests a
+    second on average, in bursts of up to ``capacity`` (default: one
+    second's worth).
+
+    Share one bucket between every Api using the same app key, e.g.
+    ``TokenBucket(500 / 60.0)`` for 500 requests a minute, to stay under
+    the quota rather than be throttled by it. A bucket only covers the
+    process it lives in.
+    """
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("\"rate\" must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else
+                              max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = _now()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take ``tokens`` and return how many seconds the caller must wait
+        before using them. Callers queue up in the order they reserve.
+        """
+        with self._lock:
+            now = _now()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            return max(0.0, -self._tokens / self.rate,
+                       self._paused_until - now)
+
+    def acquire(self, tokens=1):
+        """
+        Block until ``tokens`` may be used. Returns the seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def pause(self, seconds):
+        """
+        Hold every caller back for ``seconds``, e.g. when the server says
+        the quota is used up.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, _now() + seconds)
+
+
+def retry_after_from_headers(headers):
+    """
+    Seconds to wait according to a ``Retry-After`` header, given either in
+    seconds or as an HTTP date, or ``None`` when there is none.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+
+    return max(0.0, mktime_tz(date) - time.time())
+
+
+def rate_limit_reset_from_headers(headers):
+    """
+    Seconds until the rate limit window resets when the response says no
+    requests are left in it, otherwise ``None``. Resets are read as a
+    number of seconds, or as epoch seconds when that is in the future.
+    """
+    for (remaining, reset) in RATE_LIMIT_HEADERS:
+        left = headers.get(remaining)
+        if left is None:
+            continue
+        try:
+            if int(left) > 0:
+                return None
+            reset = float(headers.get(reset))
+        except (TypeError, ValueError):
+            return None
+        if reset > time.time():
+            reset -= time.time()
+
+        return max(0.0, reset)
+
+    return None
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from tfl.exceptions import TflError
+from tfl.spatial import EARTH_RADIUS
+from tfl.utils import timestamps_to_seconds
+
+# Availability counts, as keyed in a bike point's additionalProperties
+COUNT_KEYS = {
+    "NbBikes": "bikes",
+    "NbEmptyDocks": "empty_docks",
+    "NbDocks": "docks",
+}
+
+
+class BikePointSnapshot(object):
+    """
+    Every bike point of one GetBikePoints response as parallel NumPy
+    arrays: ``ids``, ``lat``, ``lon``, ``bikes``, ``empty_docks``,
+    ``docks`` and ``modified`` (epoch seconds of the latest availability
+    count). Missing counts and timestamps are -1.
+
+    Boolean masks select points, e.g.
+    ``snapshot[snapshot.bikes > 0].ids``.
+    """
+    FIELDS = ("ids", "lat", "lon", "bikes", "empty_docks", "docks",
+              "modified")
+
+    def __init__(self, ids=(), lat=(), lon=(), bikes=(), empty_docks=(),
+                 docks=(), modified=()):
+        if numpy is None:
+            raise TflError("BikePointSnapshot requires the numpy package")
+        self.ids = numpy.asarray(ids, dtype=object)
+        self.lat = numpy.asarray(lat, dtype=numpy.float64)
+        self.lon = numpy.asarray(lon, dtype=numpy.float64)
+        self.bikes = numpy.asarray(bikes, dtype=numpy.int32)
+        self.empty_docks = numpy.asarray(empty_docks, dtype=numpy.int32)
+        self.docks = numpy.asarray(docks, dtype=numpy.int32)
+        self.modified = numpy.asarray(modified, dtype=numpy.int64)
+        self._positions = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, selection):
+        """
+        The point at row ``selection`` as a dict of plain values, keyed
+        ``id`` rather than ``ids``, or the snapshot of the points selected
+        by a slice, boolean mask or array of rows.
+        """
+        if (isinstance(selection, (int, numpy.integer)) and
+                not isinstance(selection, bool)):
+            return self._Row(int(selection))
+
+        return BikePointSnapshot(
+            *[getattr(self, field)[selection] for field in self.FIELDS])
+
+    def __repr__(self):
+        return "BikePointSnapshot(Points={0}, Bikes={1})".format(
+            len(self), int(self.bikes[self.bikes > 0].sum()))
+
+    def position(self, point_id):
+        """
+        The row of ``point_id``, or None when it is not in the snapshot.
+        """
+        if self._positions is None:
+            self._positions = dict(
+                (point_id, row) for (row, point_id) in enumerate(self.ids))
+
+        return self._positions.get(point_id)
+
+    def distances(self, lat, lon):
+        """
+        Great-circle distance in metres from ``lat``/``lon`` to every point.
+        """
+        lat1 = numpy.radians(lat)
+        lat2 = numpy.radians(self.lat)
+        a = (numpy.sin((lat2 - lat1) / 2) ** 2 +
+             numpy.cos(lat1) * numpy.cos(lat2) *
+             numpy.sin(numpy.radians(self.lon - lon) / 2) ** 2)
+
+        return 2 * EARTH_RADIUS * numpy.arcsin(
+            numpy.sqrt(numpy.minimum(a, 1.0)))
+
+    def nearest(self, lat, lon, k=1, mask=None):
+        """
+        The snapshot of the ``k`` points closest to ``lat``/``lon``,
+        closest first, among those selected by the boolean ``mask``.
+        """
+        rows = numpy.arange(len(self))
+        if mask is not None:
+            rows = rows[mask]
+        distances = self.distances(lat, lon)[rows]
+        if k < len(rows):
+            closest = numpy.argpartition(distances, k)[:k]
+        else:
+            closest = numpy.arange(len(rows))
+        closest = closest[numpy.argsort(distances[closest], kind="stable")]
+
+        return self[rows[closest]]
+
+    def _Row(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("snapshot index out of range")
+
+        return {
+            "id": self.ids[row],
+            "lat": float(self.lat[row]),
+            "lon": float(self.lon[row]),
+            "bikes": int(self.bikes[row]),
+            "empty_docks": int(self.empty_docks[row]),
+            "docks": int(self.docks[row]),
+            "modified": int(self.modified[row]),
+        }
+
+    @classmethod
+    def fromJSON(cls, data):
+        """
+        Build a snapshot from the JSON list of bike points (or any iterable
+        of its elements) without creating Point models.
+        """
+        columns = dict((field, []) for field in cls.FIELDS)
+        modified = []
+        for point in data:
+            columns["ids"].append(point.get("id"))
+            columns["lat"].append(_Float(point.get("lat")))
+            columns["lon"].append(_Float(point.get("lon")))
+            counts = {}
+            latest = None
+            for prop in point.get("additionalProperties") or ():
+                field = COUNT_KEYS.get(prop.get("key"))
+                if field is not None:
+                    counts[field] = prop.get("value")
+                    if prop.get("modified") and (
+                            latest is None or prop["modified"] > latest):
+                        latest = prop["modified"]
+            for field in COUNT_KEYS.values():
+                columns[field].append(_Int(counts.get(field)))
+            modified.append(latest)
+
+        columns["modified"] = [
+            -1 if s is None else s for s in timestamps_to_seconds(modified)]
+
+        return cls(**columns)
+
+
+def _Float(value):
+    return float("nan") if value is None else float(value)
+
+
+def _Int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
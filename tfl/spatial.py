@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import heapq
+import math
+
+EARTH_RADIUS = 6371008.8
+
+# Metres per degree of latitude
+_DEGREE = math.pi * EARTH_RADIUS / 180
+
+
+def distance(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in metres between two points.
+    """
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    a = (math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) *
+         math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+class BikePointIndex(object):
+    """
+    A grid over bike points (or any model with ``id``, ``lat`` and ``lon``)
+    answering nearest and radius queries without scanning every point.
+
+    ``cell_size`` is the side of a grid cell in degrees; the default of
+    0.005 gives cells of roughly 550m by 350m in London, a handful of docks
+    each. Points without a location are left out.
+    """
+    def __init__(self, points=(), cell_size=0.005):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._points = {}
+        # (top, left, bottom, right) grid cells ever occupied
+        self._bounds = None
+        self.update(points)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __contains__(self, point_id):
+        return point_id in self._points
+
+    def __iter__(self):
+        return (entry[2] for entry in self._points.values())
+
+    def get(self, point_id, default=None):
+        entry = self._points.get(point_id)
+
+        return default if entry is None else entry[2]
+
+    def update(self, points):
+        """
+        Add ``points``, replacing any already indexed under the same ID.
+        Only points that moved change grid cell.
+        """
+        for point in points:
+            if point.lat is None or point.lon is None:
+                self.remove(point.id)
+                continue
+            (lat, lon) = (float(point.lat), float(point.lon))
+            cell = self._Cell(lat, lon)
+            entry = self._points.get(point.id)
+            if entry is not None and entry[3] != cell:
+                self._Discard(point.id, entry[3])
+            entry = (lat, lon, point, cell)
+            self._points[point.id] = entry
+            self._Grow(cell)
+            self._cells.setdefault(cell, {})[point.id] = entry
+
+    def refresh(self, points):
+        """
+        Bring the index in line with a new full list of points, such as a
+        fresh GetBikePoints result: update those given, drop the rest.
+        """
+        points = list(points)
+        current = set(p.id for p in points)
+        for point_id in [i for i in self._points if i not in current]:
+            self.remove(point_id)
+        self.update(points)
+
+    def remove(self, point_id):
+        entry = self._points.pop(point_id, None)
+        if entry is not None:
+            self._Discard(point_id, entry[3])
+
+    def nearest(self, lat, lon, k=1, predicate=None):
+        """
+        The ``k`` points closest to ``lat``/``lon`` for which
+        ``predicate(point)`` holds, as (distance in metres, point) pairs,
+        closest first.
+        """
+        if k <= 0 or not self._points:
+            return []
+        (row, column) = self._Cell(lat, lon)
+        (top, left, bottom, right) = self._bounds
+        furthest = max(row - top, bottom - row, column - left, right - column)
+
+        # A heap of the best k so far, furthest first: (-distance, id, point)
+        found = []
+        ring = 0
+        if furthest > max(bottom - top, right - left):
+            # Far outside the grid, where rings would be scanned cell by
+            # cell over empty ground: every point is checked instead
+            self._Push(found, k, lat, lon, self._points.values(), predicate)
+            ring = furthest + 1
+        while ring <= furthest:
+            for cell in self._Ring(row, column, ring):
+                bucket = self._cells.get(cell)
+                if bucket is not None:
+                    self._Push(found, k, lat, lon, bucket.values(), predicate)
+            # Anything outside this ring is at least ``_Reach`` away
+            if len(found) == k and -found[0][0] <= self._Reach(lat, ring):
+                break
+            ring += 1
+
+        return [(-d, point) for (d, _, point) in sorted(
+            found, key=lambda item: (-item[0], item[1]))]
+
+    def within(self, lat, lon, radius, predicate=None):
+        """
+        Every point within ``radius`` metres of ``lat``/``lon`` for which
+        ``predicate(point)`` holds, as (distance in metres, point) pairs,
+        closest first.
+        """
+        (row, column) = self._Cell(lat, lon)
+        rows = int(math.ceil(radius / (_DEGREE * self.cell_size)))
+        columns = int(math.ceil(radius / (
+            _DEGREE * self.cell_size * self._Cos(lat, rows))))
+
+        found = []
+        for r in range(row - rows, row + rows + 1):
+            for c in range(column - columns, column + columns + 1):
+                for (p_lat, p_lon, point, _) in self._cells.get(
+                        (r, c), {}).values():
+                    d = distance(lat, lon, p_lat, p_lon)
+                    if d <= radius and (
+                            predicate is None or predicate(point)):
+                        found.append((d, id(point), point))
+
+        return [(d, point) for (d, _, point) in sorted(found)]
+
+    def _Push(self, found, k, lat, lon, entries, predicate):
+        # Keep the closest k of ``entries`` in the heap ``found``
+        for (p_lat, p_lon, point, _) in entries:
+            if predicate is not None and not predicate(point):
+                continue
+            item = (-distance(lat, lon, p_lat, p_lon), id(point), point)
+            if len(found) < k:
+                heapq.heappush(found, item)
+            elif item[:2] > found[0][:2]:
+                heapq.heapreplace(found, item)
+
+    def _Cell(self, lat, lon):
+        return (int(math.floor(lat / self.cell_size)),
+                int(math.floor(lon / self.cell_size)))
+
+    def _Grow(self, cell):
+        if self._bounds is None:
+            self._bounds = cell + cell
+        else:
+            (top, left, bottom, right) = self._bounds
+            self._bounds = (min(top, cell[0]), min(left, cell[1]),
+                            max(bottom, cell[0]), max(right, cell[1]))
+
+    def _Discard(self, point_id, cell):
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(point_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def _Ring(self, row, column, ring):
+        if ring == 0:
+            return [(row, column)]
+        cells = []
+        for c in range(column - ring, column + ring + 1):
+            cells.append((row - ring, c))
+            cells.append((row + ring, c))
+        for r in range(row - ring + 1, row + ring):
+            cells.append((r, column - ring))
+            cells.append((r, column + ring))
+
+        return cells
+
+    def _Cos(self, lat, cells):
+        # Narrowest cell width over the rows involved, so bounds stay safe
+        lat = min(89.0, abs(lat) + (cells + 1) * self.cell_size)
+
+        return math.cos(math.radians(lat))
+
+    def _Reach(self, lat, ring):
+        # Distance from a point to the nearest edge outside ``ring``
+        return ring * _DEGREE * self.cell_size * self._Cos(lat, ring)
+
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import codecs
+import json
+
+_WHITESPACE = " \t\r\n"
+
+# What may follow a complete number
+_DELIMITERS = _WHITESPACE + ",]}"
+
+
+# Yielded by _IterArray when the reader needs another chunk fed to it
+_MORE = object()
+
+
+class _Starved(Exception):
+    """
+    Raised by a reader fed with Feed() that has run out of chunks before
+    the end of the document.
+    """
+
+
+class _JSONReader(object):
+    """
+    A read cursor over a JSON document arriving in chunks. Only the part of
+    the document that has not been consumed yet is kept in memory.
+
+    Chunks are pulled from ``chunks``, or when that is None, pushed in with
+    Feed(). A pushed reader raises _Starved when it needs more; every read
+    either completes or consumes nothing, so it can simply be repeated
+    once another chunk has been fed.
+    """
+    def __init__(self, chunks):
+        self._chunks = None if chunks is None else iter(chunks)
+        self._closed = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def Feed(self, chunk):
+        """
+        Push the next chunk, or None at the end of the document.
+        """
+        if chunk is None:
+            self._closed = True
+            return
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        self._buffer += chunk
+
+    def _Fill(self):
+        if self._eof:
+            return False
+        # Drop what has already been consumed before growing the buffer
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        if self._chunks is None:
+            if not self._closed:
+                raise _Starved()
+        else:
+            for chunk in self._chunks:
+                if isinstance(chunk, bytes):
+                    chunk = self._decoder.decode(chunk)
+                if chunk:
+                    self._buffer += chunk
+                    return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+
+        return False
+
+    def Peek(self):
+        while True:
+            while (self._pos < len(self._buffer) and
+                   self._buffer[self._pos] in _WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._Fill():
+                return ""
+
+    def Expect(self, char):
+        if self.Peek() != char:
+            raise ValueError("Expected \"{0}\" at offset {1}".format(
+                char, self._pos))
+        self._pos += 1
+
+    def Decode(self):
+        self.Peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._Fill():
+                    raise
+                continue
+            # A number may carry on into the next chunk, which the decoder
+            # cannot tell from one that has ended: "-0." and "1e" decode as
+            # the numbers before them
+            if (value.__class__ in (int, float) and (
+                    end == len(self._buffer) or
+                    self._buffer[end] not in _DELIMITERS) and self._Fill()):
+                continue
+            self._pos = end
+
+            return value
+
+
+def iter_json_array(chunks, path=(), check=None):
+    """
+    Yield the elements of the JSON array found at ``path`` (a sequence of
+    object keys) in a document arriving as ``chunks`` of bytes or text,
+    decoding one element at a time.
+
+    When the document does not have an array at ``path``, the value found
+    instead (or the object that lacks the key) is handed to ``check``,
+    which is expected to raise; a ValueError is raised otherwise.
+    """
+    return _IterArray(_JSONReader(chunks), path, check)
+
+
+async def aiter_json_array(chunks, path=(), check=None):
+    """
+    iter_json_array() over an async iterable of chunks, such as an aiohttp
+    response's ``content.iter_chunked(size)``.
+    """
+    reader = _JSONReader(None)
+    chunks = chunks.__aiter__()
+    for item in _IterArray(reader, path, check):
+        if item is not _MORE:
+            yield item
+            continue
+        try:
+            reader.Feed(await chunks.__anext__())
+        except StopAsyncIteration:
+            reader.Feed(None)
+
+
+def _Read(read, *args):
+    # Repeat a read of a pushed reader, asking for a chunk each time it
+    # runs out. A pulling reader never does, so this yields nothing.
+    while True:
+        try:
+            return read(*args)
+        except _Starved:
+            yield _MORE
+
+
+def _IterArray(reader, path, check):
+    for key in path:
+        if (yield from _Read(reader.Peek)) != "{":
+            _Unexpected((yield from _Read(reader.Decode)), check)
+        yield from _Read(reader.Expect, "{")
+        skipped = {}
+        while (yield from _Read(reader.Peek)) != "}":
+            name = yield from _Read(reader.Decode)
+            yield from _Read(reader.Expect, ":")
+            if name == key:
+                break
+            skipped[name] = yield from _Read(reader.Decode)
+            if (yield from _Read(reader.Peek)) == ",":
+                yield from _Read(reader.Expect, ",")
+        else:
+            _Unexpected(skipped, check)
+
+    if (yield from _Read(reader.Peek)) != "[":
+        _Unexpected((yield from _Read(reader.Decode)), check)
+    yield from _Read(reader.Expect, "[")
+    if (yield from _Read(reader.Peek)) == "]":
+        return
+    while True:
+        yield (yield from _Read(reader.Decode))
+        if (yield from _Read(reader.Peek)) == "]":
+            return
+        yield from _Read(reader.Expect, ",")
+
+
+def _Unexpected(value, check):
+    if check is not None:
+        check(value)
+    raise ValueError("The JSON document has no array at the given path")
@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
 import re
-from datetime import date
+from datetime import date, datetime
+
+from dateutil import parser, tz
 
 from tfl.exceptions import TflError
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=tz.tzutc())
+_EPOCH_DAY = _EPOCH.toordinal()
+
+_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.\d+)?"
+    r"(Z|[+-]\d\d:?\d\d)?$")
+
 
 def validate_year(year):
     year_re = re.compile('(|19|20)\d{2}$')
@@ -24,3 +33,85 @@ def validate_input(_input, _type, var):
         raise TflError("\"{0}\" is not of type {1}".format(var.__name__))
     else:
         return _value
+
+
+def timestamp_to_seconds(value):
+    """
+    Whole seconds since the epoch for an ISO-8601 timestamp. TfL's
+    "2018-04-12T16:31:47.517Z" format is parsed directly; anything else goes
+    through dateutil. Timestamps without a timezone are taken as UTC.
+    """
+    return _TimestampSeconds(value, None)
+
+
+def timestamps_to_seconds(values):
+    """
+    timestamp_to_seconds() for a whole sequence of timestamps, working out
+    the seconds at midnight once per distinct day.
+    """
+    days = {}
+
+    return [_TimestampSeconds(value, days) for value in values]
+
+
+def _TimestampSeconds(value, days):
+    if value is None:
+        return None
+
+    # Fixed layout: "YYYY-MM-DDTHH:MM:SS", then optional fraction and "Z"
+    if (len(value) >= 19 and value[10] == "T" and
+            (len(value) == 19 or value[-1] == "Z") and
+            value[19:20] in ("", ".", "Z")):
+        try:
+            day = value[:10]
+            seconds = None if days is None else days.get(day)
+            if seconds is None:
+                seconds = _DaySeconds(day[:4], day[5:7], day[8:])
+                if days is not None:
+                    days[day] = seconds
+            clock = _ClockSeconds(value[11:13], value[14:16], value[17:19])
+            if clock is not None:
+                return seconds + clock
+        except ValueError:
+            pass
+
+    # Out of range fields fall through to dateutil, which rejects them
+    match = _TIMESTAMP_RE.match(value)
+    clock = None if match is None else _ClockSeconds(*match.groups()[3:6])
+    if clock is None:
+        return _ParsedSeconds(value)
+
+    (year, month, day, _, _, _, zone) = match.groups()
+    try:
+        seconds = _DaySeconds(year, month, day) + clock
+    except ValueError:
+        return _ParsedSeconds(value)
+    if zone and zone != "Z":
+        offset = int(zone[1:3]) * 3600 + int(zone[-2:]) * 60
+        seconds = seconds - offset if zone[0] == "+" else seconds + offset
+
+    return seconds
+
+
+def _ParsedSeconds(value):
+    parsed = parser.parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz.tzutc())
+
+    return int((parsed - _EPOCH).total_seconds() // 1)
+
+
+def _DaySeconds(year, month, day):
+    # Seconds at midnight UTC; date() raises ValueError for a day the
+    # month does not have, where calendar.timegm() would roll over
+    return (date(int(year), int(month), int(day)).toordinal() -
+            _EPOCH_DAY) * 86400
+
+
+def _ClockSeconds(hour, minute, second):
+    # Seconds since midnight, or None when a field is out of range
+    (hour, minute, second) = (int(hour), int(minute), int(second))
+    if 0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60:
+        return hour * 3600 + minute * 60 + second
+
+    return None